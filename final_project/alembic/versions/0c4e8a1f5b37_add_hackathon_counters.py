@@ -0,0 +1,54 @@
+"""add hackathon counters
+
+Revision ID: 0c4e8a1f5b37
+Revises: f2b7c91d4a60
+Create Date: 2026-10-18 17:02:13.540918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from hackathon_assistant.adapters.db.counters import drop_counter_trigger_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c4e8a1f5b37'
+down_revision: Union[str, Sequence[str], None] = 'f2b7c91d4a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('hackathon_counters',
+    sa.Column('hackathon_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('total_users', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('participants', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('organizers', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('subscribed_users', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('hackathon_id')
+    )
+    # начальные значения; 0 — пользователи без выбранного хакатона
+    op.execute(
+        "INSERT INTO hackathon_counters "
+        "(hackathon_id, total_users, participants, organizers, subscribed_users) "
+        "SELECT hackathon_id, SUM(total_users), SUM(participants), SUM(organizers), "
+        "SUM(subscribed_users) FROM ("
+        "SELECT COALESCE(current_hackathon_id, 0) AS hackathon_id, 1 AS total_users, "
+        "CASE WHEN role = 'PARTICIPANT' THEN 1 ELSE 0 END AS participants, "
+        "CASE WHEN role = 'ORGANIZER' THEN 1 ELSE 0 END AS organizers, "
+        "0 AS subscribed_users FROM users "
+        "UNION ALL "
+        "SELECT hackathon_id, 0, 0, 0, 1 FROM reminder_subscriptions WHERE enabled"
+        ") AS counted GROUP BY hackathon_id"
+    )
+    # триггеры ставит 9f3a6c1d2b84: они пишут уже в разложенные по shard строки
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in drop_counter_trigger_ddl(op.get_bind().dialect.name):
+        op.execute(statement)
+    op.drop_table('hackathon_counters')
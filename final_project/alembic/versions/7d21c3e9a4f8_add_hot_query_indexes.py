@@ -0,0 +1,36 @@
+"""add hot query indexes
+
+Revision ID: 7d21c3e9a4f8
+Revises: 0c4e8a1f5b37
+Create Date: 2026-10-18 18:11:37.204416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d21c3e9a4f8'
+down_revision: Union[str, Sequence[str], None] = '0c4e8a1f5b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # на PostgreSQL строим без блокировки записи (CONCURRENTLY нельзя внутри транзакции)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_events_hackathon_id_starts_at', 'events', ['hackathon_id', 'starts_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_users_current_hackathon_id'), 'users', ['current_hackathon_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_faq_items_hackathon_id'), 'faq_items', ['hackathon_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_reminder_subscriptions_enabled_hackathon_id', 'reminder_subscriptions', ['hackathon_id', 'user_id'], unique=False, postgresql_concurrently=True, postgresql_where=sa.text('enabled'), sqlite_where=sa.text('enabled = 1'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reminder_subscriptions_enabled_hackathon_id', table_name='reminder_subscriptions')
+    op.drop_index(op.f('ix_faq_items_hackathon_id'), table_name='faq_items')
+    op.drop_index(op.f('ix_users_current_hackathon_id'), table_name='users')
+    op.drop_index('ix_events_hackathon_id_starts_at', table_name='events')
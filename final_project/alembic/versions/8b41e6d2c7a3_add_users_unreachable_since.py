@@ -0,0 +1,28 @@
+"""add users.unreachable_since
+
+Revision ID: 8b41e6d2c7a3
+Revises: 3c5d0f7e9b21
+Create Date: 2026-10-18 12:24:51.093377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41e6d2c7a3'
+down_revision: Union[str, Sequence[str], None] = '3c5d0f7e9b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('unreachable_since', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'unreachable_since')
@@ -0,0 +1,85 @@
+"""shard hackathon counters
+
+Revision ID: 9f3a6c1d2b84
+Revises: b5f19c2e8d47
+Create Date: 2026-10-18 21:14:52.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from hackathon_assistant.adapters.db.counters import (
+    COUNTER_SHARDS,
+    counter_trigger_ddl,
+    drop_counter_trigger_ddl,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3a6c1d2b84'
+down_revision: Union[str, Sequence[str], None] = 'b5f19c2e8d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _seed(sharded: bool) -> str:
+    # начальные значения; shard — по users.id / reminder_subscriptions.user_id
+    key = "hackathon_id, shard" if sharded else "hackathon_id"
+    user_shard = f"id % {COUNTER_SHARDS} AS shard, " if sharded else ""
+    subscription_shard = f"user_id % {COUNTER_SHARDS}, " if sharded else ""
+    return (
+        f"INSERT INTO hackathon_counters "
+        f"({key}, total_users, participants, organizers, subscribed_users) "
+        f"SELECT {key}, SUM(total_users), SUM(participants), SUM(organizers), "
+        "SUM(subscribed_users) FROM ("
+        f"SELECT COALESCE(current_hackathon_id, 0) AS hackathon_id, {user_shard}"
+        "1 AS total_users, "
+        "CASE WHEN role = 'PARTICIPANT' THEN 1 ELSE 0 END AS participants, "
+        "CASE WHEN role = 'ORGANIZER' THEN 1 ELSE 0 END AS organizers, "
+        "0 AS subscribed_users FROM users "
+        "UNION ALL "
+        f"SELECT hackathon_id, {subscription_shard}0, 0, 0, 1 "
+        "FROM reminder_subscriptions WHERE enabled"
+        f") AS counted GROUP BY {key}"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for statement in drop_counter_trigger_ddl(dialect):
+        op.execute(statement)
+    # строки пересчитываются с нуля: проще пересоздать таблицу, чем менять первичный ключ
+    op.drop_table('hackathon_counters')
+    op.create_table('hackathon_counters',
+    sa.Column('hackathon_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('shard', sa.Integer(), autoincrement=False, server_default='0', nullable=False),
+    sa.Column('total_users', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('participants', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('organizers', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('subscribed_users', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('hackathon_id', 'shard')
+    )
+    op.execute(_seed(sharded=True))
+    for statement in counter_trigger_ddl(dialect):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in drop_counter_trigger_ddl(op.get_bind().dialect.name):
+        op.execute(statement)
+    op.drop_table('hackathon_counters')
+    op.create_table('hackathon_counters',
+    sa.Column('hackathon_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('total_users', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('participants', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('organizers', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('subscribed_users', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('hackathon_id')
+    )
+    # триггеров для таблицы без shard больше нет: до повторного upgrade счётчики
+    # не обновляются
+    op.execute(_seed(sharded=False))
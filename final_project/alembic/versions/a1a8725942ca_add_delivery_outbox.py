@@ -0,0 +1,46 @@
+"""add delivery_outbox
+
+Revision ID: a1a8725942ca
+Revises: 6e73b57f59bf
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1a8725942ca'
+down_revision: Union[str, Sequence[str], None] = '6e73b57f59bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('delivery_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('message_key', sa.String(length=128), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('telegram_id', sa.BigInteger(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'IN_PROGRESS', 'SENT', 'FAILED', name='deliverystatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('uq_outbox_message_recipient', 'delivery_outbox', ['message_key', 'telegram_id'], unique=True)
+    op.create_index('ix_delivery_outbox_status_id', 'delivery_outbox', ['status', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_delivery_outbox_status_id', table_name='delivery_outbox')
+    op.drop_index('uq_outbox_message_recipient', table_name='delivery_outbox')
+    op.drop_table('delivery_outbox')
+    op.execute("DROP TYPE IF EXISTS deliverystatus")
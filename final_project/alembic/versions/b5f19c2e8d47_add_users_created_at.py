@@ -0,0 +1,29 @@
+"""add users.created_at
+
+Revision ID: b5f19c2e8d47
+Revises: 7d21c3e9a4f8
+Create Date: 2026-10-18 19:02:14.518330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5f19c2e8d47'
+down_revision: Union[str, Sequence[str], None] = '7d21c3e9a4f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # время регистрации существующих пользователей неизвестно, остаётся NULL
+    op.add_column('users', sa.Column('created_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'created_at')
@@ -0,0 +1,28 @@
+"""add hackathons.content_version
+
+Revision ID: d93f0a6b5e12
+Revises: 8b41e6d2c7a3
+Create Date: 2026-10-18 13:07:36.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93f0a6b5e12'
+down_revision: Union[str, Sequence[str], None] = '8b41e6d2c7a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('hackathons', sa.Column('content_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('hackathons', 'content_version')
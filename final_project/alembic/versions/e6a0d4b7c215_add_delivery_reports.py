@@ -0,0 +1,33 @@
+"""add delivery_reports
+
+Revision ID: e6a0d4b7c215
+Revises: 4b8e2d6f1a93
+Create Date: 2026-10-18 23:41:09.512734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a0d4b7c215'
+down_revision: Union[str, Sequence[str], None] = '4b8e2d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('delivery_reports',
+    sa.Column('message_key', sa.String(length=128), nullable=False),
+    sa.Column('chat_id', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('message_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('delivery_reports')
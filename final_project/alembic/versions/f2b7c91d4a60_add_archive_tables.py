@@ -0,0 +1,69 @@
+"""add archive tables
+
+Revision ID: f2b7c91d4a60
+Revises: d93f0a6b5e12
+Create Date: 2026-10-18 15:20:41.118273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7c91d4a60'
+down_revision: Union[str, Sequence[str], None] = 'd93f0a6b5e12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('archived_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('hackathon_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    # тип eventtype уже создан вместе с events
+    sa.Column('type', postgresql.ENUM('CHECKPOINT', 'DEADLINE', 'MEETUP', 'LECTURE', 'OTHER', name='eventtype', create_type=False), nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('ends_at', sa.DateTime(), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_archived_events_hackathon_id'), 'archived_events', ['hackathon_id'], unique=False)
+    op.create_table('archived_faq_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('hackathon_id', sa.Integer(), nullable=False),
+    sa.Column('question', sa.Text(), nullable=False),
+    sa.Column('answer', sa.Text(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_archived_faq_items_hackathon_id'), 'archived_faq_items', ['hackathon_id'], unique=False)
+    op.create_table('archived_reminder_subscriptions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('hackathon_id', sa.Integer(), nullable=False),
+    sa.Column('enabled', sa.Boolean(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['hackathon_id'], ['hackathons.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_archived_reminder_subscriptions_hackathon_id'), 'archived_reminder_subscriptions', ['hackathon_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_archived_reminder_subscriptions_hackathon_id'), table_name='archived_reminder_subscriptions')
+    op.drop_table('archived_reminder_subscriptions')
+    op.drop_index(op.f('ix_archived_faq_items_hackathon_id'), table_name='archived_faq_items')
+    op.drop_table('archived_faq_items')
+    op.drop_index(op.f('ix_archived_events_hackathon_id'), table_name='archived_events')
+    op.drop_table('archived_events')
@@ -0,0 +1,172 @@
+"""
+Row -> dataclass mapping: to_dataclass vs RowMapper (validated / trusted), and ORM vs Core reads.
+
+Usage (from final_project, with src on PYTHONPATH):
+    python benchmarks/bench_mappers.py [--rows 100000] [--repeat 5]
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/bench_mappers.py
+
+The first block maps in-memory rows only. The second reads the same rows from
+the database: select(EventORM) + to_dataclass(orm.__dict__) as the repositories
+did before, against select(*table.c) + RowMapper. Without DATABASE_URL a
+temporary SQLite file is used; the inserted rows are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from hackathon_assistant.adapters.db.models import Base, EventORM, HackathonORM
+from hackathon_assistant.adapters.db.repositories import HackathonRepo
+from hackathon_assistant.adapters.db.repositories.mappers import RowMapper, to_dataclass
+from hackathon_assistant.domain.models import Event, EventType, Hackathon
+
+_COLUMNS = tuple(EventORM.__table__.c)
+
+
+def _report(title: str, timings: dict[str, list[float]], baseline: str) -> None:
+    print(title)
+    best = {name: min(values) for name, values in timings.items()}
+    for name, values in timings.items():
+        print(
+            f"  {name:<26} {best[name] * 1000:8.1f} ms  {statistics.median(values) * 1000:8.1f} ms"
+            f"  x{best[baseline] / best[name]:.1f}"
+        )
+
+
+def _time(func, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_mapping(rows: int, repeat: int) -> None:
+    keys = [c.key for c in _COLUMNS]
+    start = datetime(2025, 1, 1, 9)
+    data = [
+        (
+            i + 1,
+            1,
+            f"Event {i}",
+            EventType.OTHER,
+            start + timedelta(minutes=i),
+            start + timedelta(minutes=i + 30),
+            "Room",
+            "x" * 50,
+        )
+        for i in range(rows)
+    ]
+    dicts = [dict(zip(keys, row, strict=True)) for row in data]
+    validated = RowMapper(Event, _COLUMNS, trusted=False)
+    trusted = RowMapper(Event, _COLUMNS)
+    timings = {
+        "to_dataclass": _time(lambda: [to_dataclass(Event, d) for d in dicts], repeat),
+        "RowMapper validated": _time(lambda: validated.all(data), repeat),
+        "RowMapper trusted": _time(lambda: trusted.all(data), repeat),
+    }
+    _report(f"mapping only: {rows} rows, best/median of {repeat}", timings, "to_dataclass")
+
+
+async def _timed_read(session_factory, read) -> float:
+    async with session_factory() as session:
+        started = time.perf_counter()
+        await read(session)
+        return time.perf_counter() - started
+
+
+async def _orm_read(session, hackathon_id: int) -> list[Event]:
+    stmt = select(EventORM).where(EventORM.hackathon_id == hackathon_id)
+    items = (await session.execute(stmt)).scalars().all()
+    return [to_dataclass(Event, o.__dict__) for o in items]
+
+
+async def _core_read(session, hackathon_id: int, mapper: RowMapper[Event]) -> list[Event]:
+    stmt = select(*_COLUMNS).where(EventORM.hackathon_id == hackathon_id)
+    return mapper.all(await session.execute(stmt))
+
+
+async def bench_reads(database_url: str, rows: int, repeat: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        hackathon = await HackathonRepo(session).save(
+            Hackathon(
+                code=f"BENCH-{os.getpid()}-{time.time_ns()}",
+                name="Benchmark",
+                start_at=datetime(2025, 1, 1),
+                end_at=datetime(2025, 1, 2),
+            )
+        )
+        start = datetime(2025, 1, 1, 9)
+        await session.execute(
+            insert(EventORM),
+            [
+                {
+                    "hackathon_id": hackathon.id,
+                    "title": f"Event {i}",
+                    "type": EventType.OTHER,
+                    "starts_at": start + timedelta(minutes=i),
+                    "ends_at": start + timedelta(minutes=i + 30),
+                    "location": "Room",
+                    "description": "x" * 50,
+                }
+                for i in range(rows)
+            ],
+        )
+        await session.commit()
+
+    validated = RowMapper(Event, _COLUMNS, trusted=False)
+    trusted = RowMapper(Event, _COLUMNS)
+    cases = {
+        "ORM + to_dataclass": lambda s: _orm_read(s, hackathon.id),
+        "Core + RowMapper validated": lambda s: _core_read(s, hackathon.id, validated),
+        "Core + RowMapper trusted": lambda s: _core_read(s, hackathon.id, trusted),
+    }
+    timings = {
+        name: [await _timed_read(session_factory, read) for _ in range(repeat)]
+        for name, read in cases.items()
+    }
+    _report(
+        f"{engine.dialect.name} read: {rows} rows, best/median of {repeat}",
+        timings,
+        "ORM + to_dataclass",
+    )
+
+    async with session_factory() as session:
+        await session.execute(delete(EventORM).where(EventORM.hackathon_id == hackathon.id))
+        await session.execute(delete(HackathonORM).where(HackathonORM.id == hackathon.id))
+        await session.commit()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bench_mapping(args.rows, args.repeat)
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url:
+        asyncio.run(bench_reads(database_url, args.rows, args.repeat))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(bench_reads(f"sqlite+aiosqlite:///{tmp}/bench.db", args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
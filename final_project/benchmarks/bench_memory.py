@@ -0,0 +1,192 @@
+"""
+Memory of bulk reads: dataclasses with __dict__ vs slotted domain models.
+
+Usage (from final_project, with src on PYTHONPATH):
+    python benchmarks/bench_memory.py [--rows 100000]
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/bench_memory.py
+
+"retained" is what the resulting list keeps alive, "peak" is the tracemalloc peak
+while it is built. The "__dict__" variants are copies of the domain classes
+without slots, read the way the repositories did before: select(ORM entity) and
+to_dataclass(orm.__dict__). Without DATABASE_URL a temporary SQLite file is used;
+the inserted rows are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from hackathon_assistant.adapters.db.models import Base, EventORM, HackathonORM, UserORM
+from hackathon_assistant.adapters.db.repositories import EventRepo, HackathonRepo
+from hackathon_assistant.adapters.db.repositories.mappers import RowMapper, to_dataclass
+from hackathon_assistant.domain.models import Event, EventType, Hackathon, User, UserRole
+
+
+def _with_dict(cls: type) -> type:
+    """The same fields as cls in a dataclass without __slots__ (and without validation)."""
+    spec = [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(cls)
+    ]
+    return make_dataclass(f"{cls.__name__}WithDict", spec)
+
+
+def _measure(build) -> tuple[float, float, float, int]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / 2**20, peak / 2**20, elapsed, len(result)
+
+
+async def _ameasure(session_factory, read) -> tuple[float, float, float, int]:
+    async with session_factory() as session:
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        result = await read(session)
+        elapsed = time.perf_counter() - started
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return retained / 2**20, peak / 2**20, elapsed, len(result)
+
+
+def _print(name: str, measured: tuple[float, float, float, int]) -> None:
+    retained, peak, elapsed, count = measured
+    print(
+        f"  {name:<34} retained {retained:7.1f} MiB  peak {peak:7.1f} MiB"
+        f"  {elapsed * 1000:8.1f} ms  ({count} objects)"
+    )
+
+
+def bench_mapping(rows: int) -> None:
+    columns = tuple(UserORM.__table__.c)
+    data = [
+        (i, 10_000 + i, f"user{i}", "First", "Last", UserRole.PARTICIPANT, 1, None, None)
+        for i in range(1, rows + 1)
+    ]
+    user_with_dict = _with_dict(User)
+    print(f"mapping only: {rows} User rows")
+    _print("__dict__", _measure(lambda: RowMapper(user_with_dict, columns).all(data)))
+    _print("slots, validated", _measure(lambda: RowMapper(User, columns, trusted=False).all(data)))
+    _print("slots, trusted", _measure(lambda: RowMapper(User, columns).all(data)))
+
+
+async def _seed(session_factory, rows: int) -> Hackathon:
+    async with session_factory() as session:
+        hackathon = await HackathonRepo(session).save(
+            Hackathon(
+                code=f"BENCH-{os.getpid()}-{time.time_ns()}",
+                name="Benchmark",
+                start_at=datetime(2025, 1, 1),
+                end_at=datetime(2025, 1, 2),
+            )
+        )
+        base = time.time_ns() % 10**9 * 1000
+        await session.execute(
+            insert(UserORM),
+            [
+                {
+                    "telegram_id": base + i,
+                    "username": f"user{i}",
+                    "first_name": "First",
+                    "last_name": "Last",
+                    "role": UserRole.PARTICIPANT,
+                    "current_hackathon_id": hackathon.id,
+                }
+                for i in range(1, rows + 1)
+            ],
+        )
+        start = datetime(2025, 1, 1, 9)
+        await session.execute(
+            insert(EventORM),
+            [
+                {
+                    "hackathon_id": hackathon.id,
+                    "title": f"Event {i}",
+                    "type": EventType.OTHER,
+                    "starts_at": start + timedelta(minutes=i),
+                    "ends_at": start + timedelta(minutes=i + 30),
+                    "location": "Room",
+                }
+                for i in range(rows)
+            ],
+        )
+        await session.commit()
+    return hackathon
+
+
+async def bench_reads(database_url: str, rows: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    hackathon = await _seed(session_factory, rows)
+    user_with_dict = _with_dict(User)
+    event_with_dict = _with_dict(Event)
+
+    async def users_before(session):
+        stmt = select(UserORM).where(UserORM.current_hackathon_id == hackathon.id)
+        items = (await session.execute(stmt)).scalars().all()
+        return [to_dataclass(user_with_dict, o.__dict__) for o in items]
+
+    user_columns = tuple(UserORM.__table__.c)
+    to_user = RowMapper(User, user_columns)
+
+    async def users_after(session):
+        # what the UserRepo read methods do: Core rows and a trusted RowMapper
+        stmt = select(*user_columns).where(UserORM.current_hackathon_id == hackathon.id)
+        return to_user.all(await session.execute(stmt))
+
+    async def events_before(session):
+        stmt = select(EventORM).where(EventORM.hackathon_id == hackathon.id)
+        items = (await session.execute(stmt)).scalars().all()
+        return [to_dataclass(event_with_dict, o.__dict__) for o in items]
+
+    print(f"{engine.dialect.name} read: {rows} rows")
+    _print("users: ORM + __dict__", await _ameasure(session_factory, users_before))
+    _print("users: Core rows + RowMapper", await _ameasure(session_factory, users_after))
+    _print("events: ORM + __dict__", await _ameasure(session_factory, events_before))
+    _print(
+        "events: EventRepo.get_by_hackathon",
+        await _ameasure(session_factory, lambda s: EventRepo(s).get_by_hackathon(hackathon.id)),
+    )
+
+    async with session_factory() as session:
+        await session.execute(delete(EventORM).where(EventORM.hackathon_id == hackathon.id))
+        await session.execute(delete(UserORM).where(UserORM.current_hackathon_id == hackathon.id))
+        await session.execute(delete(HackathonORM).where(HackathonORM.id == hackathon.id))
+        await session.commit()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    bench_mapping(args.rows)
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url:
+        asyncio.run(bench_reads(database_url, args.rows))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(bench_reads(f"sqlite+aiosqlite:///{tmp}/bench.db", args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+EventRepo.save_all / FAQRepo.save_all: bulk INSERT ... RETURNING vs per-row flush.
+
+Usage (from final_project, with src on PYTHONPATH):
+    python benchmarks/bench_save_all.py [--rows 500] [--repeat 5]
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/bench_save_all.py
+
+Without DATABASE_URL a temporary SQLite file is used. The schema is created in
+the target database and every run deletes the rows it inserted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from hackathon_assistant.adapters.db.models import Base, EventORM, FAQItemORM, HackathonORM
+from hackathon_assistant.adapters.db.repositories import EventRepo, FAQRepo, HackathonRepo
+from hackathon_assistant.adapters.db.repositories.mappers import to_dataclass
+from hackathon_assistant.domain.models import Event, FAQItem, Hackathon
+
+
+async def _per_row_events(session, events: list[Event]) -> list[Event]:
+    """The previous EventRepo.save_all: one flush (round trip) per row."""
+    saved = []
+    for event in events:
+        orm_obj = EventORM(
+            hackathon_id=event.hackathon_id,
+            title=event.title,
+            type=event.type,
+            starts_at=event.starts_at,
+            ends_at=event.ends_at,
+            location=event.location,
+            description=event.description,
+        )
+        session.add(orm_obj)
+        await session.flush()
+        saved.append(to_dataclass(Event, orm_obj.__dict__))
+    return saved
+
+
+async def _per_row_faq(session, items: list[FAQItem]) -> list[FAQItem]:
+    saved = []
+    for item in items:
+        orm_obj = FAQItemORM(
+            hackathon_id=item.hackathon_id, question=item.question, answer=item.answer
+        )
+        session.add(orm_obj)
+        await session.flush()
+        saved.append(to_dataclass(FAQItem, orm_obj.__dict__))
+    return saved
+
+
+async def _timed(session_factory, hackathon_id: int, save) -> float:
+    async with session_factory() as session:
+        started = time.perf_counter()
+        await save(session)
+        await session.commit()
+        elapsed = time.perf_counter() - started
+        await session.execute(delete(EventORM).where(EventORM.hackathon_id == hackathon_id))
+        await session.execute(delete(FAQItemORM).where(FAQItemORM.hackathon_id == hackathon_id))
+        await session.commit()
+    return elapsed
+
+
+async def run(database_url: str, rows: int, repeat: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        hackathon = await HackathonRepo(session).save(
+            Hackathon(
+                code=f"BENCH-{os.getpid()}-{time.time_ns()}",
+                name="Benchmark",
+                start_at=datetime(2025, 1, 1),
+                end_at=datetime(2025, 1, 2),
+            )
+        )
+        await session.commit()
+
+    start = datetime(2025, 1, 1, 9)
+    events = [
+        Event(
+            hackathon_id=hackathon.id,
+            title=f"Event {i}",
+            starts_at=start + timedelta(minutes=i),
+            ends_at=start + timedelta(minutes=i + 30),
+            description="x" * 200,
+        )
+        for i in range(rows)
+    ]
+    faq = [
+        FAQItem(hackathon_id=hackathon.id, question=f"Question {i}?", answer="y" * 200)
+        for i in range(rows)
+    ]
+
+    cases = {
+        "events per-row": lambda s: _per_row_events(s, events),
+        "events bulk": lambda s: EventRepo(s).save_all(events),
+        "faq per-row": lambda s: _per_row_faq(s, faq),
+        "faq bulk": lambda s: FAQRepo(s).save_all(faq),
+    }
+    print(f"{engine.dialect.name}: {rows} rows, best/median of {repeat}")
+    results = {}
+    for name, save in cases.items():
+        timings = [await _timed(session_factory, hackathon.id, save) for _ in range(repeat)]
+        results[name] = min(timings)
+        print(
+            f"  {name:<15} {min(timings) * 1000:8.1f} ms  {statistics.median(timings) * 1000:8.1f} ms"
+        )
+    for kind in ("events", "faq"):
+        speedup = results[f"{kind} per-row"] / results[f"{kind} bulk"]
+        print(f"  {kind} speedup: x{speedup:.1f}")
+
+    async with session_factory() as session:
+        await session.execute(delete(HackathonORM).where(HackathonORM.id == hackathon.id))
+        await session.commit()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url:
+        asyncio.run(run(database_url, args.rows, args.repeat))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite+aiosqlite:///{tmp}/bench.db", args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from hackathon_assistant.infra.usecase_provider import UseCaseProvider
 from hackathon_assistant.use_cases.dto import BroadcastResultDTO
 
+from .broadcast import BroadcastDispatcher
+from .delivery import DeliveryWorker
 from .formatters import (
     format_admin_stats,
     format_broadcast_preview,
@@ -30,22 +32,18 @@ class BroadcastStates(StatesGroup):
 @admin_router.message(Command("admin_stats"))
 async def cmd_admin_stats(message: types.Message, use_cases: UseCaseProvider) -> None:
     try:
-        parts = message.text.split(maxsplit=1)
-
-        if len(parts) > 1:
-            hack_code = parts[1].strip()
-            hackathon = await use_cases.select_hackathon_by_code.execute(
-                telegram_id=message.from_user.id, hackathon_code=hack_code
-            )
-            if not hackathon:
-                await message.answer(f"❌ Хакатон с кодом '{hack_code}' не найден.")
-                return
-
         if not await is_organizer(message.from_user.id, use_cases):
             await message.answer("❌ Эта команда доступна только организаторам.")
             return
 
-        stats = await use_cases.get_admin_stats.execute()
+        parts = message.text.split(maxsplit=1)
+        hack_code = parts[1].strip() if len(parts) > 1 else None
+
+        stats = await use_cases.get_admin_stats.execute(hackathon_code=hack_code)
+        if stats is None:
+            await message.answer(f"❌ Хакатон с кодом '{hack_code}' не найден.")
+            return
+
         text = format_admin_stats(stats)
         await message.answer(text)
 
@@ -55,8 +53,22 @@ async def cmd_admin_stats(message: types.Message, use_cases: UseCaseProvider) ->
 
 
 @admin_router.message(Command("admin_broadcast"))
-async def cmd_admin_broadcast(message: types.Message, use_cases: UseCaseProvider) -> None:
-    """Обработчик команды /admin_broadcast"""
+async def cmd_admin_broadcast(
+    message: types.Message,
+    use_cases: UseCaseProvider,
+    broadcast_dispatcher: BroadcastDispatcher | None = None,
+    delivery_worker: DeliveryWorker | None = None,
+) -> None:
+    """Обработчик команды /admin_broadcast
+
+    Сама отправка идёт в фоне, итог приходит отдельным сообщением. Если запущен
+    DeliveryWorker, рассылка сначала сохраняется в delivery_outbox и переживает рестарт.
+
+    broadcast_dispatcher — общий на процесс (infra.main): у своего диспетчера был бы
+    свой TokenBucket, и параллельные рассылки вместе превысили бы лимит бота.
+    """
+    if broadcast_dispatcher is None:
+        raise RuntimeError("broadcast_dispatcher is not configured in the Dispatcher data")
     try:
         parts = message.text.split(maxsplit=2)
 
@@ -83,6 +95,19 @@ async def cmd_admin_broadcast(message: types.Message, use_cases: UseCaseProvider
             await message.answer("❌ Эта команда доступна только организаторам.")
             return
 
+        if delivery_worker is not None:
+            job = await use_cases.enqueue_broadcast.execute(
+                hackathon_id=hackathon.id,
+                message=broadcast_message,
+                report_chat_id=message.chat.id,
+            )
+            delivery_worker.notify()
+            await message.answer(
+                f"🔄 Рассылка для хакатона: {hackathon.name} "
+                f"({job.recipients} получателей) поставлена в очередь"
+            )
+            return
+
         targets = await use_cases.send_broadcast.execute(
             hackathon_id=hackathon.id,
             message=broadcast_message,
@@ -92,24 +117,15 @@ async def cmd_admin_broadcast(message: types.Message, use_cases: UseCaseProvider
             f"🔄 Рассылка для хакатона: {hackathon.name} ({len(targets)} получателей)"
         )
 
-        sent_count = 0
-        failed_count = 0
-
-        for target in targets:
-            try:
-                await message.bot.send_message(
-                    target.telegram_id, broadcast_message, parse_mode="Markdown"
-                )
-                sent_count += 1
-
-            except Exception as e:
-                logger.exception("Failed to send to %s: %r", target.telegram_id, e)
-                failed_count += 1
+        async def report(result: BroadcastResultDTO) -> None:
+            result_text = format_broadcast_result(
+                sent=result.sent_successfully,
+                failed=result.failed,
+                total=result.total_recipients,
+            )
+            await message.answer(result_text, parse_mode="Markdown")
 
-        result_text = format_broadcast_result(
-            sent=sent_count, failed=failed_count, total=len(targets)
-        )
-        await message.answer(result_text, parse_mode="Markdown")
+        broadcast_dispatcher.start(targets.telegram_ids, broadcast_message, on_done=report)
 
     except Exception as e:
         logger.exception("Error in /admin_broadcast: %r", e)
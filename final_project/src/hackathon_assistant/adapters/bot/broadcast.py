@@ -0,0 +1,266 @@
+"""Рассылка сообщений с учётом лимитов Telegram"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from enum import StrEnum
+from typing import TypeVar
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+
+from hackathon_assistant.use_cases.dto import BroadcastResultDTO
+from hackathon_assistant.use_cases.send_reminder import is_unreachable_error
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# Лимиты Bot API: ~30 сообщений в секунду на бота и ~1 сообщение в секунду в один чат
+DEFAULT_RATE_PER_SECOND = 30.0
+DEFAULT_PER_CHAT_INTERVAL = 1.0
+DEFAULT_MAX_CONCURRENCY = 20
+
+
+class SendOutcome(StrEnum):
+    SENT = "sent"
+    # повтор не поможет: чат недоступен, сообщение отклонено
+    FAILED = "failed"
+    # временная ошибка (сеть, 5xx, таймаут, исчерпаны повторы RetryAfter): можно позже
+    RETRY = "retry"
+    # отправка остановлена до попытки (should_stop): сообщение не отправлялось
+    CANCELLED = "cancelled"
+
+
+def is_transient_error(e: Exception) -> bool:
+    """Ошибка, после которой отправку стоит повторить позже"""
+    return isinstance(e, TelegramNetworkError | TelegramServerError | TimeoutError)
+
+
+class TokenBucket:
+    """Глобальный лимит отправки: rate токенов в секунду, не больше capacity подряд"""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else rate
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Остановить выдачу токенов (TelegramRetryAfter)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                elapsed = now - self._updated
+                self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class ChatRateLimiter:
+    """Минимальный интервал между сообщениями в один и тот же чат"""
+
+    _PRUNE_THRESHOLD = 10_000
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._next_allowed: dict[int, float] = {}
+
+    async def wait(self, chat_id: int) -> None:
+        now = time.monotonic()
+        ready_at = self._next_allowed.get(chat_id, 0.0)
+        self._next_allowed[chat_id] = max(now, ready_at) + self._interval
+        if len(self._next_allowed) > self._PRUNE_THRESHOLD:
+            self._prune(now)
+        if ready_at > now:
+            await asyncio.sleep(ready_at - now)
+
+    def _prune(self, now: float) -> None:
+        self._next_allowed = {k: v for k, v in self._next_allowed.items() if v > now}
+
+
+class BroadcastDispatcher:
+    """
+    Отправляет сообщения пачке получателей с ограниченной конкурентностью.
+
+    Все отправки проходят через общий TokenBucket, поэтому параллельные рассылки
+    вместе не превышают лимит бота. TelegramRetryAfter ставит на паузу весь bucket,
+    а получатель отправляется повторно. Недоступные чаты после каждой пачки
+    передаются в on_unreachable, чтобы следующие рассылки их не выбирали.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        per_chat_interval: float = DEFAULT_PER_CHAT_INTERVAL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = 5,
+        on_unreachable: Callable[[list[int]], Awaitable[None]] | None = None,
+    ) -> None:
+        self._bot = bot
+        self._bucket = TokenBucket(rate_per_second)
+        self._chat_limiter = ChatRateLimiter(per_chat_interval)
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._tasks: set[asyncio.Task] = set()
+        self._on_unreachable = on_unreachable
+        self._unreachable: set[int] = set()
+
+    async def send_one(self, chat_id: int, text: str, parse_mode: str | None = "Markdown") -> bool:
+        return await self.deliver(chat_id, text, parse_mode=parse_mode) is SendOutcome.SENT
+
+    async def deliver(
+        self,
+        chat_id: int,
+        text: str,
+        parse_mode: str | None = "Markdown",
+        should_stop: Callable[[], bool] | None = None,
+    ) -> SendOutcome:
+        """Отправить одно сообщение; RETRY — ошибка временная, отправку можно повторить"""
+        for _ in range(self._max_retries + 1):
+            await self._chat_limiter.wait(chat_id)
+            await self._bucket.acquire()
+            # ожидание токена может затянуться (пауза RetryAfter): проверяем после него
+            if should_stop is not None and should_stop():
+                return SendOutcome.CANCELLED
+            try:
+                await self._bot.send_message(chat_id, text, parse_mode=parse_mode)
+                return SendOutcome.SENT
+            except TelegramRetryAfter as e:
+                logger.warning("Flood control, pausing sends for %ss", e.retry_after)
+                self._bucket.pause(e.retry_after)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Failed to send to %s: %r", chat_id, e)
+                if is_transient_error(e):
+                    return SendOutcome.RETRY
+                if is_unreachable_error(e):
+                    self._unreachable.add(chat_id)
+                return SendOutcome.FAILED
+
+        logger.error("Giving up on %s after %s retries", chat_id, self._max_retries)
+        return SendOutcome.RETRY
+
+    async def _run_pool(self, items: Iterable[T], handle: Callable[[T], Awaitable[None]]) -> None:
+        """Обработать items не более чем max_concurrency корутинами одновременно"""
+        it = iter(items)
+
+        async def worker() -> None:
+            for item in it:
+                await handle(item)
+
+        await asyncio.gather(*(worker() for _ in range(self._max_concurrency)))
+
+    async def send_many(
+        self, chat_ids: Iterable[int], text: str, parse_mode: str | None = "Markdown"
+    ) -> BroadcastResultDTO:
+        sent = 0
+        failed = 0
+
+        async def handle(chat_id: int) -> None:
+            nonlocal sent, failed
+            if await self.send_one(chat_id, text, parse_mode=parse_mode):
+                sent += 1
+            else:
+                failed += 1
+
+        await self._run_pool(chat_ids, handle)
+        await self._flush_unreachable()
+
+        total = sent + failed
+        return BroadcastResultDTO(
+            total_recipients=total,
+            sent_successfully=sent,
+            failed=failed,
+            success_rate=sent / total if total else 0.0,
+        )
+
+    async def send_keyed(
+        self,
+        messages: Iterable[tuple[K, int, str]],
+        parse_mode: str | None = "Markdown",
+        should_stop: Callable[[], bool] | None = None,
+    ) -> dict[SendOutcome, list[K]]:
+        """
+        Отправить (key, chat_id, text); вернуть ключи по исходу отправки
+
+        Когда should_stop() становится истинным, ещё не отправленные сообщения
+        попадают в CANCELLED без попытки отправки.
+        """
+        outcomes: dict[SendOutcome, list[K]] = {outcome: [] for outcome in SendOutcome}
+
+        async def handle(message: tuple[K, int, str]) -> None:
+            key, chat_id, text = message
+            if should_stop is not None and should_stop():
+                outcomes[SendOutcome.CANCELLED].append(key)
+                return
+            outcome = await self.deliver(
+                chat_id, text, parse_mode=parse_mode, should_stop=should_stop
+            )
+            outcomes[outcome].append(key)
+
+        await self._run_pool(messages, handle)
+        await self._flush_unreachable()
+        return outcomes
+
+    async def _flush_unreachable(self) -> None:
+        if not self._unreachable or self._on_unreachable is None:
+            return
+        chat_ids, self._unreachable = list(self._unreachable), set()
+        try:
+            await self._on_unreachable(chat_ids)
+        except Exception as e:  # noqa: BLE001
+            logger.exception("Failed to record unreachable chats: %r", e)
+
+    def start(
+        self,
+        chat_ids: Iterable[int],
+        text: str,
+        on_done: Callable[[BroadcastResultDTO], Awaitable[None]] | None = None,
+        parse_mode: str | None = "Markdown",
+    ) -> asyncio.Task:
+        """Запустить рассылку в фоне; on_done получит итог после завершения"""
+
+        async def run() -> BroadcastResultDTO:
+            result = await self.send_many(chat_ids, text, parse_mode=parse_mode)
+            logger.info(
+                "Broadcast finished: %s sent, %s failed",
+                result.sent_successfully,
+                result.failed,
+            )
+            if on_done is not None:
+                try:
+                    await on_done(result)
+                except Exception as e:  # noqa: BLE001
+                    logger.exception("Broadcast on_done callback failed: %r", e)
+            return result
+
+        task = asyncio.create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def shutdown(self) -> None:
+        """Отменить незавершённые фоновые рассылки"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,268 @@
+"""Фоновая доставка сообщений из delivery_outbox"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from hackathon_assistant.domain.models import DeliveryStatus, OutboxMessage
+from hackathon_assistant.use_cases.dto import BroadcastResultDTO
+from hackathon_assistant.use_cases.ports import OutboxRepository
+
+from .broadcast import BroadcastDispatcher, SendOutcome
+from .formatters import format_broadcast_result
+
+logger = logging.getLogger(__name__)
+
+# пауза перед повтором растёт вдвое с каждой попыткой, но не дольше часа
+_MAX_RETRY_DELAY_SECONDS = 3600
+_PRUNE_CHUNK = 1000
+
+
+class DeliveryWorker:
+    """
+    Забирает строки delivery_outbox пачками и отправляет их через BroadcastDispatcher.
+
+    Строка забирается с арендой на lease_seconds: если процесс упал посреди пачки,
+    после истечения аренды её подхватит любой воркер (доставка at-least-once).
+    Пока пачка отправляется (в т.ч. стоит на паузе после RetryAfter), аренда строк
+    и аренда отправителя продлеваются, поэтому строку не заберут и не отправят дважды.
+    Если продлить аренду отправителя не удалось (её забрал другой процесс), остаток
+    пачки не отправляется и возвращается в очередь: два отправителя сразу вместе
+    превысили бы лимит.
+
+    Временные ошибки (сеть, 5xx, таймаут) не делают сообщение недоставленным: оно
+    возвращается в очередь с паузой retry_base_seconds * 2**(попытка - 1) и только
+    после max_attempts попыток отмечается FAILED. Завершённые строки старше
+    retention_hours удаляются раз в prune_interval_seconds (0 — хранить всё).
+
+    Отправляет один процесс: лимит Telegram общий на бота, а TokenBucket диспетчера
+    живёт в процессе, и N процессов слали бы в N раз быстрее. Перед каждой пачкой
+    воркер берёт или продлевает аренду отправителя в БД; воркеры других процессов
+    ждут, пока она истечёт (процесс-держатель упал) или будет отпущена в stop().
+    Внутри процесса воркеров может быть несколько (start(workers=...)): они делят
+    один TokenBucket и не пересекаются по строкам.
+
+    Итог рассылки (EnqueueBroadcastUseCase с report_chat_id) присылает тоже
+    отправитель: адресат итога хранится в delivery_reports, поэтому итог не теряется,
+    если /admin_broadcast принял другой процесс или аренда перешла посреди рассылки.
+    """
+
+    def __init__(
+        self,
+        dispatcher: BroadcastDispatcher,
+        session_cm_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+        repo_factory: Callable[[AsyncSession], OutboxRepository],
+        batch_size: int = 200,
+        lease_seconds: int = 300,
+        idle_seconds: float = 2.0,
+        holder: str | None = None,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 30.0,
+        retention_hours: float = 72.0,
+        prune_interval_seconds: float = 3600.0,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._session_cm_factory = session_cm_factory
+        self._repo_factory = repo_factory
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._idle_seconds = idle_seconds
+        self._holder = holder or uuid.uuid4().hex
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retention_hours = retention_hours
+        self._prune_interval_seconds = prune_interval_seconds
+        self._next_prune = 0.0
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def notify(self) -> None:
+        """Разбудить воркеры: в очереди появились новые сообщения"""
+        self._wakeup.set()
+
+    async def run_once(self) -> int:
+        """Обработать одну пачку; вернуть количество обработанных строк"""
+        async with self._session_cm_factory() as session:
+            repo = self._repo_factory(session)
+            is_sender = await repo.acquire_sender_lease(self._holder, self._lease_seconds)
+            batch = (
+                await repo.claim_batch(self._batch_size, self._lease_seconds) if is_sender else []
+            )
+            await session.commit()
+        if not is_sender:
+            return 0
+        if batch:
+            await self._send(batch)
+        await self._report_finished()
+        return len(batch)
+
+    async def _send(self, batch: list[OutboxMessage]) -> None:
+        # соединение с БД не держим, пока идёт отправка
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._extend_leases([m.id for m in batch], lease_lost))
+        try:
+            outcomes = await self._dispatcher.send_keyed(
+                ((m.id, m.telegram_id, m.text) for m in batch), should_stop=lease_lost.is_set
+            )
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        by_id = {m.id: m for m in batch}
+        async with self._session_cm_factory() as session:
+            repo = self._repo_factory(session)
+            await repo.mark_sent(outcomes[SendOutcome.SENT])
+            await repo.mark_failed(outcomes[SendOutcome.FAILED], "delivery failed")
+            await self._retry_later(repo, [by_id[i] for i in outcomes[SendOutcome.RETRY]])
+            await repo.release(outcomes[SendOutcome.CANCELLED])
+            await session.commit()
+        if outcomes[SendOutcome.CANCELLED]:
+            logger.warning(
+                "Delivery sender lease lost, %s messages returned to the queue",
+                len(outcomes[SendOutcome.CANCELLED]),
+            )
+
+    async def _extend_leases(self, ids: list[int], lease_lost: asyncio.Event) -> None:
+        """
+        Продлевать аренду строк пачки и аренду отправителя, пока идёт отправка
+
+        Аренду отправителя забрал другой процесс или её не удалось продлить до
+        истечения — выставить lease_lost и выйти.
+        """
+        expires_at = time.monotonic() + self._lease_seconds
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            try:
+                async with self._session_cm_factory() as session:
+                    repo = self._repo_factory(session)
+                    is_sender = await repo.acquire_sender_lease(self._holder, self._lease_seconds)
+                    if is_sender:
+                        await repo.extend_lease(ids, self._lease_seconds)
+                    await session.commit()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Failed to extend delivery leases: %r", e)
+                # аренда вот-вот истечёт, и отправлять может начать другой процесс
+                is_sender = time.monotonic() + self._lease_seconds / 3 < expires_at
+            else:
+                expires_at = time.monotonic() + self._lease_seconds
+            if not is_sender:
+                logger.warning("Delivery sender lease was taken over by another process")
+                lease_lost.set()
+                return
+
+    async def _retry_later(self, repo: OutboxRepository, messages: list[OutboxMessage]) -> None:
+        exhausted = [m.id for m in messages if m.attempts >= self._max_attempts]
+        if exhausted:
+            await repo.mark_failed(
+                exhausted, f"delivery failed after {self._max_attempts} attempts"
+            )
+
+        by_delay: dict[float, list[int]] = defaultdict(list)
+        for m in messages:
+            if m.attempts < self._max_attempts:
+                by_delay[self.retry_delay(m.attempts)].append(m.id)
+        for delay, ids in by_delay.items():
+            await repo.retry_later(ids, delay, "transient error, will retry")
+
+    def retry_delay(self, attempts: int) -> float:
+        """Пауза перед следующей попыткой после attempts неудачных"""
+        delay = self._retry_base_seconds * 2 ** max(attempts - 1, 0)
+        return min(delay, _MAX_RETRY_DELAY_SECONDS)
+
+    async def prune(self) -> int:
+        """Удалить завершённые строки старше retention_hours; вернуть число удалённых"""
+        older_than = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=self._retention_hours)
+        deleted = 0
+        while True:
+            # частями и с commit после каждой: не держим блокировки на всю очистку
+            async with self._session_cm_factory() as session:
+                chunk = await self._repo_factory(session).delete_finished(older_than, _PRUNE_CHUNK)
+                await session.commit()
+            deleted += chunk
+            if chunk < _PRUNE_CHUNK:
+                break
+        if deleted:
+            logger.info("Delivery outbox pruned: %s rows", deleted)
+        return deleted
+
+    async def _prune_if_due(self) -> None:
+        if self._retention_hours <= 0 or time.monotonic() < self._next_prune:
+            return
+        self._next_prune = time.monotonic() + self._prune_interval_seconds
+        try:
+            await self.prune()
+        except Exception as e:  # noqa: BLE001
+            logger.exception("Delivery outbox pruning failed: %r", e)
+
+    async def _report_finished(self) -> None:
+        async with self._session_cm_factory() as session:
+            repo = self._repo_factory(session)
+            reports = [
+                (chat_id, await repo.count_by_status(message_key))
+                for message_key, chat_id in await repo.take_finished_reports()
+            ]
+            # итог отправляется не больше одного раза, даже если отправка ниже упадёт
+            await session.commit()
+
+        for chat_id, counts in reports:
+            sent = counts.get(DeliveryStatus.SENT, 0)
+            failed = counts.get(DeliveryStatus.FAILED, 0)
+            total = sent + failed
+            result = BroadcastResultDTO(
+                total_recipients=total,
+                sent_successfully=sent,
+                failed=failed,
+                success_rate=sent / total if total else 0.0,
+            )
+            text = format_broadcast_result(
+                sent=result.sent_successfully, failed=result.failed, total=result.total_recipients
+            )
+            await self._dispatcher.send_one(chat_id, text)
+
+    async def _loop(self) -> None:
+        while True:
+            await self._prune_if_due()
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001
+                logger.exception("Delivery worker error: %r", e)
+                processed = 0
+
+            if processed:
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._idle_seconds)
+            self._wakeup.clear()
+
+    def start(self, workers: int = 1) -> None:
+        if self._tasks:
+            logger.warning("Delivery workers already running")
+            return
+        self._tasks = [asyncio.create_task(self._loop()) for _ in range(workers)]
+        logger.info("Delivery workers started: %s, sender lease holder %s", workers, self._holder)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # другой процесс начнёт отправку сразу, не дожидаясь истечения аренды
+        try:
+            async with self._session_cm_factory() as session:
+                await self._repo_factory(session).release_sender_lease(self._holder)
+                await session.commit()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to release delivery sender lease: %r", e)
+        logger.info("Delivery workers stopped")
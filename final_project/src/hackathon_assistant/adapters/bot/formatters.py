@@ -17,38 +17,27 @@ def format_schedule(items: list[ScheduleItemDTO]) -> str:
             "Следите за обновлениями!"
         )
 
-    items_by_day = {}
+    items_by_day: dict[str, list[ScheduleItemDTO]] = {}
     for item in items:
-        day_key = item.starts_at.strftime("%d.%m.%Y")
-        if day_key not in items_by_day:
-            items_by_day[day_key] = []
-        items_by_day[day_key].append(item)
-
-    result = "📅 *Расписание:*\n\n"
+        items_by_day.setdefault(item.starts_at.strftime("%d.%m.%Y"), []).append(item)
 
+    parts = ["📅 *Расписание:*\n\n"]
     for day, day_items in sorted(items_by_day.items()):
-        result += f"*📆 {day}:*\n"
-
+        parts.append(f"*📆 {day}:*\n")
         day_items.sort(key=lambda x: x.starts_at)
 
         for item in day_items:
-            time_str = f"{item.starts_at.strftime('%H:%M')}–{item.ends_at.strftime('%H:%M')}"
-
-            result += f"  • *{item.title}* ({time_str})\n"
-
+            parts.append(f"  • *{item.title}* " f"({item.starts_at:%H:%M}–{item.ends_at:%H:%M})\n")
             if item.location:
-                result += f"    📍 {item.location}\n"
+                parts.append(f"    📍 {item.location}\n")
             if item.description:
-                desc = (
-                    item.description[:100] + "..."
-                    if len(item.description) > 100
-                    else item.description
-                )
-                result += f"    📝 {desc}\n"
+                desc = item.description
+                if len(desc) > 100:
+                    desc = desc[:100] + "..."
+                parts.append(f"    📝 {desc}\n")
+            parts.append("\n")
 
-            result += "\n"
-
-    return result
+    return "".join(parts)
 
 
 def format_faq(items: list[FAQItemDTO]) -> str:
@@ -59,13 +48,9 @@ def format_faq(items: list[FAQItemDTO]) -> str:
             "Если у вас есть вопросы, обратитесь к организаторам напрямую."
         )
 
-    result = "❓ *Часто задаваемые вопросы:*\n\n"
-
-    for i, item in enumerate(items, 1):
-        result += f"*{i}. {item.question}*\n"
-        result += f"{item.answer}\n\n"
-
-    return result
+    parts = ["❓ *Часто задаваемые вопросы:*\n\n"]
+    parts.extend(f"*{i}. {item.question}*\n{item.answer}\n\n" for i, item in enumerate(items, 1))
+    return "".join(parts)
 
 
 def format_rules(rules: RulesDTO | None) -> str:
@@ -133,6 +118,14 @@ def format_admin_stats(stats: AdminStatsDTO) -> str:
         f"Организаторов: {stats.organizers}",
         f"Подписаны на напоминания: {stats.subscribed_users}",
     ]
+    if stats.hackathons:
+        lines.append("")
+        lines.append("По хакатонам:")
+        for h in stats.hackathons:
+            lines.append(
+                f"{h.code} — {h.name}: {h.total_users} польз. "
+                f"({h.participants} уч., {h.organizers} орг.), подписаны: {h.subscribed_users}"
+            )
     return "\n".join(lines)
 
 
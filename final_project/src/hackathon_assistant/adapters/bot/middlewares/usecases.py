@@ -13,6 +13,12 @@ class UseCasesMiddleware(BaseMiddleware):
     Builds UseCaseProvider per update and puts it into handler data.
 
     We pass factories from infra, so adapters/bot doesn't import infra.
+    Use cases that write (registration, hackathon choice, subscriptions) commit
+    themselves before the handler replies, so row locks taken by the counter
+    triggers are not held across Telegram calls; anything left is committed
+    once, after the handler returns.
+    Opening the session is cheap: AsyncSession takes a pooled connection only
+    when the first query runs, and the provider builds use cases on first access.
     """
 
     def __init__(
@@ -34,4 +40,8 @@ class UseCasesMiddleware(BaseMiddleware):
     ) -> Any:
         async with self._session_cm_factory() as session:
             data[self._data_key] = self._provider_factory(session)
-            return await handler(event, data)
+            result = await handler(event, data)
+            # одна фиксация на апдейт; при исключении get_session откатывает транзакцию
+            if session.in_transaction():
+                await session.commit()
+            return result
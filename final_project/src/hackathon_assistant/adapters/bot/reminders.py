@@ -1,15 +1,78 @@
 import asyncio
+import contextlib
+import heapq
 import logging
+from collections.abc import Collection, Iterable
+from datetime import UTC, datetime, timedelta
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.exceptions import TelegramBadRequest
 
+from hackathon_assistant.domain.models import Event
 from hackathon_assistant.infra.db import get_session
-from hackathon_assistant.use_cases.process_reminder import ProcessRemindersUseCase
-from hackathon_assistant.use_cases.send_reminder import SendRemindersUseCase
+from hackathon_assistant.use_cases.send_reminder import SendRemindersUseCase, is_unreachable_error
+
+from .delivery import DeliveryWorker
 
 logger = logging.getLogger(__name__)
 
+# за сколько часов до начала события отправляется напоминание
+REMINDER_HOURS_AHEAD = 1
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class ReminderSchedule:
+    """
+    Min-heap моментов отправки напоминаний: (starts_at - offset, event_id, hackathon_id).
+
+    Время наивное, в UTC, как и в БД. Запланированное событие с тем же временем
+    начала не добавляется дважды, поэтому повторная загрузка расписания безопасна.
+    Сработавшее напоминание забывается: перечитывание события, ещё не вышедшего из
+    окна напоминания, делает его наступившим снова. Кому оно ещё причитается (например,
+    подписавшимся после срабатывания), решает журнал sent_reminders: получившим
+    напоминание оно повторно не планируется.
+    """
+
+    def __init__(self, offset: timedelta) -> None:
+        self._offset = offset
+        self._heap: list[tuple[datetime, int, int]] = []
+        self._scheduled: set[tuple[int, datetime]] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._scheduled.clear()
+
+    def add(self, events: Iterable[Event], now: datetime) -> None:
+        for event in events:
+            starts_at = event.starts_at
+            if starts_at.tzinfo is not None:
+                starts_at = starts_at.astimezone(UTC).replace(tzinfo=None)
+            if event.id is None or starts_at < now:
+                continue
+            key = (event.id, starts_at)
+            if key in self._scheduled:
+                continue
+            self._scheduled.add(key)
+            heapq.heappush(self._heap, (starts_at - self._offset, event.id, event.hackathon_id))
+
+    def next_due(self) -> datetime | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> set[int]:
+        """Снять наступившие напоминания; вернуть id хакатонов, которые пора обработать"""
+        hackathon_ids: set[int] = set()
+        while self._heap and self._heap[0][0] <= now:
+            due_at, event_id, hackathon_id = heapq.heappop(self._heap)
+            self._scheduled.discard((event_id, due_at + self._offset))
+            hackathon_ids.add(hackathon_id)
+        return hackathon_ids
+
 
 class _AiogramNotifier:
     def __init__(self, bot: Bot):
@@ -19,22 +82,62 @@ class _AiogramNotifier:
         try:
             await self._bot.send_message(telegram_id, text, parse_mode="Markdown")
         except TelegramBadRequest as e:
-            msg = str(e).lower()
-            if "chat not found" in msg or "bot was blocked" in msg:
-                logger.warning("User %s not available: %s", telegram_id, e)
-            else:
-                logger.error("Telegram error for user %s: %s", telegram_id, e)
-        except TelegramForbiddenError as e:
-            logger.warning("User %s blocked the bot: %s", telegram_id, e)
+            # недоступный чат обрабатывает SendRemindersUseCase: он отмечает пользователя
+            if is_unreachable_error(e):
+                raise
+            logger.error("Telegram error for user %s: %s", telegram_id, e)
 
 
 class ReminderService:
-    def __init__(self, bot: Bot, use_case_provider_factory):
+    def __init__(
+        self,
+        bot: Bot,
+        use_case_provider_factory,
+        delivery_worker: DeliveryWorker | None = None,
+        digest: bool = False,
+    ):
         self.bot = bot
         self.use_case_provider_factory = use_case_provider_factory
+        self.delivery_worker = delivery_worker
+        # одно сообщение на пользователя за тик вместо сообщения на каждое событие
+        self.digest = digest
         self._task: asyncio.Task | None = None
+        self._schedule = ReminderSchedule(timedelta(hours=REMINDER_HOURS_AHEAD))
+        self._scheduled = False
+        self._schedule_changed = asyncio.Event()
         logger.info("ReminderService initialized")
 
+    def events_saved(self, events: list[Event]) -> None:
+        """EventScheduleListener: добавить новые события в расписание без запроса к БД"""
+        if not self._scheduled:
+            return
+        self._schedule.add(events, _utc_now())
+        self._schedule_changed.set()
+
+    async def start_scheduled_reminders(
+        self, lookahead_hours: int = 24, resync_minutes: int = 30
+    ) -> None:
+        """
+        Отправлять напоминания ровно в момент starts_at - REMINDER_HOURS_AHEAD.
+
+        Между напоминаниями сервис спит и к БД не обращается. Расписание и подписки
+        меняются в основном из CLI и обработчиков бота, о которых сервис не знает,
+        поэтому их подхватывает только перечитывание раз в resync_minutes: новые и
+        перенесённые события, а также подписчики, появившиеся после срабатывания
+        напоминания, — события ещё в окне срабатывают снова, и журнал sent_reminders
+        отправляет напоминание только тем, кто его не получал. events_saved ускоряет
+        лишь события, сохранённые в этом же процессе.
+        """
+        if self._task and not self._task.done():
+            logger.warning("Reminder task already running")
+            return
+
+        self._scheduled = True
+        self._task = asyncio.create_task(
+            self._scheduled_reminder_task(lookahead_hours, resync_minutes)
+        )
+        logger.info("Scheduled reminders started (resync: %s min)", resync_minutes)
+
     async def start_periodic_reminders(self, interval_minutes: int = 5):
         if self._task and not self._task.done():
             logger.warning("Reminder task already running")
@@ -51,6 +154,7 @@ class ReminderService:
             except asyncio.CancelledError:
                 pass
             logger.info("Periodic reminders stopped")
+        self._scheduled = False
 
     async def _periodic_reminder_task(self, interval_minutes: int):
         try:
@@ -62,33 +166,82 @@ class ReminderService:
         except Exception as e:
             logger.error("Reminder task error: %s", e)
 
-    async def send_upcoming_event_reminders(self):
+    async def _reload_schedule(self, lookahead_hours: int) -> None:
+        async with get_session() as session:
+            use_cases = self.use_case_provider_factory(session)
+            events = await use_cases.repos.event_repo().get_upcoming_for_active(
+                hours_ahead=lookahead_hours
+            )
+        # только добавляем: устаревшие записи (событие перенесли или удалили) при
+        # срабатывании дадут пустую выборку, а events_saved во время запроса не теряются
+        self._schedule.add(events, _utc_now())
+        logger.info("Reminder schedule reloaded: %s pending", len(self._schedule))
+
+    async def _scheduled_reminder_task(self, lookahead_hours: int, resync_minutes: int):
+        resync = timedelta(minutes=resync_minutes)
+        next_resync = _utc_now()
+        try:
+            while True:
+                if _utc_now() >= next_resync:
+                    try:
+                        await self._reload_schedule(lookahead_hours)
+                    except Exception as e:
+                        logger.error("Reminder schedule reload failed: %s", e)
+                    next_resync = _utc_now() + resync
+
+                due = self._schedule.pop_due(_utc_now())
+                if due:
+                    await self.send_upcoming_event_reminders(hackathon_ids=due)
+                    continue
+
+                wake_at = next_resync
+                next_due = self._schedule.next_due()
+                if next_due is not None and next_due < wake_at:
+                    wake_at = next_due
+                timeout = max((wake_at - _utc_now()).total_seconds(), 0.0)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._schedule_changed.wait(), timeout=timeout)
+                self._schedule_changed.clear()
+        except asyncio.CancelledError:
+            logger.info("Reminder task cancelled")
+
+    async def send_upcoming_event_reminders(self, hackathon_ids: Collection[int] | None = None):
         logger.info("Checking for upcoming events...")
         try:
             async with get_session() as session:
                 use_cases = self.use_case_provider_factory(session)
 
-                hackathons = await use_cases.list_hackathons.execute(active_only=True)
-                if not hackathons:
-                    logger.info("No active hackathons, skip reminders")
-                    return
-
-                process_uc = ProcessRemindersUseCase(
-                    event_repo=use_cases.get_upcoming_events.event_repo,
-                    subscription_repo=use_cases.subscribe_notifications.subscription_repo,
-                )
-                send_uc = SendRemindersUseCase(notifier=_AiogramNotifier(self.bot))
-
-                all_piles = []
-                for h in hackathons:
-                    piles = await process_uc.execute(hackathon_id=h.id, hours_ahead=1)
-                    all_piles.extend(piles)
-
-                if not all_piles:
+                process_uc = use_cases.process_reminders
+                if self.delivery_worker is not None:
+                    send_uc = SendRemindersUseCase(
+                        outbox_repo=use_cases.repos.outbox_repo(),
+                        uow=use_cases.uow,
+                        digest=self.digest,
+                    )
+                else:
+                    send_uc = SendRemindersUseCase(
+                        notifier=_AiogramNotifier(self.bot),
+                        user_repo=use_cases.repos.user_repo(),
+                        uow=use_cases.uow,
+                        digest=self.digest,
+                    )
+
+                # выборка по всем активным хакатонам частями: отправка первой части
+                # начинается до того, как прочитана вся выборка; для дайджеста части
+                # идут по пользователям, и каждая содержит все события своих получателей
+                planned = 0
+                async for piles in process_uc.plan_chunks(
+                    hours_ahead=REMINDER_HOURS_AHEAD,
+                    hackathon_ids=hackathon_ids,
+                    by_user=self.digest,
+                ):
+                    planned += len(piles)
+                    await send_uc.execute(piles)
+                    if self.delivery_worker is not None:
+                        self.delivery_worker.notify()
+
+                if not planned:
                     logger.info("No reminder piles, nothing to send")
-                    return
-
-                await send_uc.execute(all_piles)
 
         except Exception as e:
             logger.error(f"Error in send_upcoming_event_reminders: {e}")
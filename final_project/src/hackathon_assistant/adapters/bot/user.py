@@ -4,8 +4,9 @@ from datetime import datetime, timedelta
 from aiogram import Router, types
 from aiogram.filters import Command
 
+from hackathon_assistant.adapters.db.repositories import ContentCache
 from hackathon_assistant.infra.usecase_provider import UseCaseProvider
-from hackathon_assistant.use_cases.dto import ScheduleItemDTO
+from hackathon_assistant.use_cases.dto import HackathonDTO, ScheduleItemDTO
 
 from .formatters import (
     format_faq,
@@ -21,10 +22,12 @@ logger = logging.getLogger(__name__)
 user_router = Router(name="user_router")
 
 
-async def require_hackathon_selected(message: types.Message, use_cases: UseCaseProvider) -> bool:
+async def require_hackathon_selected(
+    message: types.Message, use_cases: UseCaseProvider
+) -> HackathonDTO | None:
     """
-    Проверяет, выбран ли у пользователя хакатон.
-    Если нет - отправляет сообщение и возвращает False.
+    Проверяет, выбран ли у пользователя хакатон, и возвращает его.
+    Если нет - отправляет сообщение и возвращает None.
     """
     try:
         hackathon_dto, _ = await use_cases.get_hackathon_info.execute(
@@ -43,8 +46,8 @@ async def require_hackathon_selected(message: types.Message, use_cases: UseCaseP
                 "Код хакатона можно получить у организаторов.",
                 parse_mode="Markdown",
             )
-            return False
-        return True
+            return None
+        return hackathon_dto
 
     except Exception as e:
         print(f"Error checking hackathon: {e}")
@@ -56,7 +59,25 @@ async def require_hackathon_selected(message: types.Message, use_cases: UseCaseP
             "3. Обратиться к организаторам",
             parse_mode="Markdown",
         )
-        return False
+        return None
+
+
+def _cached_reply(
+    rendered_cache: ContentCache | None, hackathon: HackathonDTO, section: str
+) -> str | None:
+    """Готовый текст ответа, если контент хакатона не менялся с прошлого рендера"""
+    if rendered_cache is None:
+        return None
+    rendered_cache.observe_version(hackathon.id, hackathon.content_version)
+    text = rendered_cache.get((hackathon.id, section, hackathon.content_version))
+    return None if text is ContentCache.MISSING else text
+
+
+def _store_reply(
+    rendered_cache: ContentCache | None, hackathon: HackathonDTO, section: str, text: str
+) -> None:
+    if rendered_cache is not None:
+        rendered_cache.set((hackathon.id, section, hackathon.content_version), text)
 
 
 # ========== Основные команды ==========
@@ -141,23 +162,26 @@ async def cmd_hackathon(message: types.Message, use_cases: UseCaseProvider) -> N
 
 
 @user_router.message(Command("schedule"))
-async def cmd_schedule(message: types.Message, use_cases: UseCaseProvider) -> None:
+async def cmd_schedule(
+    message: types.Message,
+    use_cases: UseCaseProvider,
+    rendered_cache: ContentCache | None = None,
+) -> None:
     """Обработчик команды /schedule"""
     # Проверка выбранного хакатона
-    if not await require_hackathon_selected(message, use_cases):
+    hackathon = await require_hackathon_selected(message, use_cases)
+    if not hackathon:
         return
 
     try:
-        schedule_items = await use_cases.get_schedule.execute(message.from_user.id)
-
-        if not schedule_items:
-            await message.answer(
-                "📅 *Расписание:*\n\nПока что для выбранного хакатона нет событий.",
-                parse_mode="Markdown",
-            )
-            return
-
-        schedule_text = format_schedule(schedule_items)
+        schedule_text = _cached_reply(rendered_cache, hackathon, "schedule")
+        if schedule_text is None:
+            schedule_items = await use_cases.get_schedule.execute(message.from_user.id)
+            if not schedule_items:
+                schedule_text = "📅 *Расписание:*\n\nПока что для выбранного хакатона нет событий."
+            else:
+                schedule_text = format_schedule(schedule_items)
+            _store_reply(rendered_cache, hackathon, "schedule", schedule_text)
 
         await message.answer(schedule_text, parse_mode="Markdown")
     except Exception as e:
@@ -177,15 +201,23 @@ async def cmd_schedule(message: types.Message, use_cases: UseCaseProvider) -> No
 
 
 @user_router.message(Command("rules"))
-async def cmd_rules(message: types.Message, use_cases: UseCaseProvider) -> None:
+async def cmd_rules(
+    message: types.Message,
+    use_cases: UseCaseProvider,
+    rendered_cache: ContentCache | None = None,
+) -> None:
     """Обработчик команды /rules"""
     # Проверка выбранного хакатона
-    if not await require_hackathon_selected(message, use_cases):
+    hackathon = await require_hackathon_selected(message, use_cases)
+    if not hackathon:
         return
 
     try:
-        rules_dto = await use_cases.get_rules.execute(message.from_user.id)
-        rules_text = format_rules(rules_dto)
+        rules_text = _cached_reply(rendered_cache, hackathon, "rules")
+        if rules_text is None:
+            rules_dto = await use_cases.get_rules.execute(message.from_user.id)
+            rules_text = format_rules(rules_dto)
+            _store_reply(rendered_cache, hackathon, "rules", rules_text)
         await message.answer(rules_text, parse_mode="Markdown")
     except Exception as e:
         print(f"Error in /rules: {e}")
@@ -197,15 +229,23 @@ async def cmd_rules(message: types.Message, use_cases: UseCaseProvider) -> None:
 
 
 @user_router.message(Command("faq"))
-async def cmd_faq(message: types.Message, use_cases: UseCaseProvider) -> None:
+async def cmd_faq(
+    message: types.Message,
+    use_cases: UseCaseProvider,
+    rendered_cache: ContentCache | None = None,
+) -> None:
     """Обработчик команды /faq"""
     # Проверка выбранного хакатона
-    if not await require_hackathon_selected(message, use_cases):
+    hackathon = await require_hackathon_selected(message, use_cases)
+    if not hackathon:
         return
 
     try:
-        faq_items = await use_cases.get_faq.execute(message.from_user.id)
-        faq_text = format_faq(faq_items)
+        faq_text = _cached_reply(rendered_cache, hackathon, "faq")
+        if faq_text is None:
+            faq_items = await use_cases.get_faq.execute(message.from_user.id)
+            faq_text = format_faq(faq_items)
+            _store_reply(rendered_cache, hackathon, "faq", faq_text)
         await message.answer(faq_text, parse_mode="Markdown")
     except Exception as e:
         print(f"Error in /faq: {e}")
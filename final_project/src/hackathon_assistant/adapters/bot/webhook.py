@@ -0,0 +1,174 @@
+"""Приём апдейтов через webhook: aiohttp-сервер с ограниченной обработкой"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_HANDLER_KEY: web.AppKey[BoundedRequestHandler] = web.AppKey("webhook_handler")
+
+
+class BoundedRequestHandler(SimpleRequestHandler):
+    """
+    Webhook-обработчик aiogram, который не запускает задачу на каждый апдейт.
+
+    Апдейт кладётся в очередь на queue_size мест, и Telegram сразу получает ответ;
+    очередь разбирают max_in_flight воркеров. Если очередь полна, запрос ждёт места
+    до enqueue_timeout секунд: Telegram держит не больше max_connections запросов
+    одновременно, поэтому ожидание притормаживает и его. Не дождался — 503,
+    и Telegram повторит апдейт позже.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        max_in_flight: int = 20,
+        queue_size: int = 1000,
+        enqueue_timeout: float = 5.0,
+        secret_token: str | None = None,
+        **data: Any,
+    ) -> None:
+        super().__init__(dispatcher, bot, secret_token=secret_token, **data)
+        self._max_in_flight = max_in_flight
+        self._queue_size = queue_size
+        self._enqueue_timeout = enqueue_timeout
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._in_flight = 0
+
+    def register(self, app: web.Application, /, path: str, **kwargs: Any) -> None:
+        app.on_startup.append(self._on_startup)
+        super().register(app, path=path, **kwargs)
+
+    async def _on_startup(self, app: web.Application) -> None:
+        self.start()
+
+    def start(self) -> None:
+        if self._workers:
+            logger.warning("Webhook workers already running")
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._max_in_flight)]
+        logger.info(
+            "Webhook workers started: %s, queue size %s", self._max_in_flight, self._queue_size
+        )
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Дообработать очередь (не дольше drain_timeout) и остановить воркеры"""
+        if self._queue is not None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Webhook workers stopped")
+
+    async def close(self) -> None:
+        # сначала очередь, потом сессия бота: обработчикам ещё нужно отвечать
+        await self.stop()
+        await super().close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": self._in_flight,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        secret = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+        if not self.verify_secret(secret, self.bot):
+            return web.Response(body="Unauthorized", status=401)
+        if self._queue is None:
+            return web.Response(text="Not started", status=503)
+
+        update = await request.json(loads=self.bot.session.json_loads)
+        try:
+            await asyncio.wait_for(self._queue.put(update), timeout=self._enqueue_timeout)
+        except TimeoutError:
+            logger.warning("Webhook queue is full, update %s rejected", update.get("update_id"))
+            return web.Response(text="Too many pending updates", status=503)
+        return web.json_response({}, dumps=self.bot.session.json_dumps)
+
+    __call__ = handle
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            update = await self._queue.get()
+            self._in_flight += 1
+            try:
+                result = await self.dispatcher.feed_raw_update(
+                    bot=self.bot, update=update, **self.data
+                )
+                if isinstance(result, TelegramMethod):
+                    await self.dispatcher.silent_call_request(bot=self.bot, result=result)
+            except Exception as e:  # noqa: BLE001
+                logger.exception("Error processing update %s: %r", update.get("update_id"), e)
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+
+
+def build_webhook_app(
+    dispatcher: Dispatcher,
+    bot: Bot,
+    path: str,
+    max_in_flight: int = 20,
+    queue_size: int = 1000,
+    enqueue_timeout: float = 5.0,
+    secret_token: str | None = None,
+) -> web.Application:
+    """aiohttp-приложение с webhook-обработчиком на path и хуками startup/shutdown aiogram"""
+    app = web.Application()
+    handler = BoundedRequestHandler(
+        dispatcher,
+        bot,
+        max_in_flight=max_in_flight,
+        queue_size=queue_size,
+        enqueue_timeout=enqueue_timeout,
+        secret_token=secret_token,
+    )
+    handler.register(app, path=path)
+    setup_application(app, dispatcher, bot=bot)
+    app[WEBHOOK_HANDLER_KEY] = handler
+    return app
+
+
+async def run_webhook(
+    dispatcher: Dispatcher,
+    bot: Bot,
+    url: str,
+    path: str,
+    host: str,
+    port: int,
+    max_connections: int = 40,
+    **handler_options: Any,
+) -> None:
+    """Зарегистрировать webhook в Telegram и обслуживать его до отмены задачи"""
+    app = build_webhook_app(dispatcher, bot, path, **handler_options)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+        await bot.set_webhook(
+            url.rstrip("/") + path,
+            secret_token=handler_options.get("secret_token"),
+            max_connections=max_connections,
+            allowed_updates=dispatcher.resolve_used_update_types(),
+        )
+        logger.info("Webhook server listening on %s:%s%s", host, port, path)
+        await asyncio.Event().wait()
+    finally:
+        # on_shutdown: обработчик дообрабатывает очередь и закрывает сессию бота
+        await runner.cleanup()
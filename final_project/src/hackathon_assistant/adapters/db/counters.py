@@ -0,0 +1,232 @@
+"""
+Triggers that keep hackathon_counters in step with users and reminder_subscriptions.
+
+Every change applies a delta to the counters of the affected hackathon (0 for users
+without a current hackathon): old rows are subtracted, new ones added. Because this
+happens inside the writing transaction, every write path (bot, CLI, archiving,
+manual SQL) is covered; HackathonCountersRepo.reconcile fixes any drift left by
+writes made while the triggers were absent.
+
+A hackathon's counters are spread over COUNTER_SHARDS rows picked by user id, and
+readers sum them. With a single row per hackathon every sign-up would update the
+same row and hold its lock until commit, serialising concurrent sign-ups.
+
+On PostgreSQL the triggers are statement-level: the transition tables of one
+statement are grouped into a single delta per (hackathon, shard), so a bulk UPDATE
+such as disable_all_for_hackathon costs one upsert per shard, not one per row.
+SQLite has only row-level triggers; it serialises all writers anyway.
+
+counter_trigger_ddl is also used by the migration that shards the table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+_NO_HACKATHON = 0
+COUNTER_SHARDS = 16
+
+_USER_TRIGGERS = ("users_counters_insert", "users_counters_update", "users_counters_delete")
+_SUBSCRIPTION_TRIGGERS = (
+    "subscriptions_counters_insert",
+    "subscriptions_counters_update",
+    "subscriptions_counters_delete",
+)
+_POSTGRESQL_FUNCTIONS = ("hackathon_counters_users", "hackathon_counters_subscriptions")
+# row-level triggers of the first PostgreSQL version, dropped on reinstall
+_LEGACY_POSTGRESQL_TRIGGERS = (
+    ("users_hackathon_counters", "users"),
+    ("subscriptions_hackathon_counters", "reminder_subscriptions"),
+)
+
+# (hackathon_id, shard, {counter: value}) of a row, as SQL over the row alias
+Counts = Callable[[str], tuple[str, str, dict[str, str]]]
+
+
+def _user_counts(row: str) -> tuple[str, str, dict[str, str]]:
+    return (
+        f"COALESCE({row}.current_hackathon_id, {_NO_HACKATHON})",
+        f"{row}.id % {COUNTER_SHARDS}",
+        {
+            "total_users": "1",
+            "participants": f"CASE WHEN {row}.role = 'PARTICIPANT' THEN 1 ELSE 0 END",
+            "organizers": f"CASE WHEN {row}.role = 'ORGANIZER' THEN 1 ELSE 0 END",
+        },
+    )
+
+
+def _subscription_counts(row: str) -> tuple[str, str, dict[str, str]]:
+    return (
+        f"{row}.hackathon_id",
+        f"{row}.user_id % {COUNTER_SHARDS}",
+        {"subscribed_users": f"CASE WHEN {row}.enabled THEN 1 ELSE 0 END"},
+    )
+
+
+def _upsert(columns: list[str], source: str) -> str:
+    updates = ", ".join(f"{c} = hackathon_counters.{c} + excluded.{c}" for c in columns)
+    return (
+        f"INSERT INTO hackathon_counters (hackathon_id, shard, {', '.join(columns)}) {source} "
+        f"ON CONFLICT (hackathon_id, shard) DO UPDATE SET {updates};"
+    )
+
+
+def _row_delta(counts: Counts, row: str, sign: str) -> str:
+    hackathon_id, shard, values = counts(row)
+    deltas = ", ".join(f"{sign}({v})" for v in values.values())
+    return _upsert(list(values), f"VALUES ({hackathon_id}, {shard}, {deltas})")
+
+
+def _statement_delta(counts: Counts, sources: list[tuple[str, str]]) -> str:
+    """One grouped upsert for the (transition table, sign) pairs of a statement."""
+    parts = []
+    for table, sign in sources:
+        hackathon_id, shard, values = counts(table)
+        deltas = ", ".join(f"{sign}({v}) AS {c}" for c, v in values.items())
+        parts.append(
+            f"SELECT {hackathon_id} AS hackathon_id, {shard} AS shard, {deltas} FROM {table}"
+        )
+    columns = list(values)
+    sums = ", ".join(f"SUM({c})" for c in columns)
+    # an UPDATE that did not touch the counted columns nets to zero: nothing to write
+    changed = " OR ".join(f"SUM({c}) <> 0" for c in columns)
+    return _upsert(
+        columns,
+        f"SELECT hackathon_id, shard, {sums} FROM ({' UNION ALL '.join(parts)}) AS delta "
+        f"GROUP BY hackathon_id, shard HAVING {changed}",
+    )
+
+
+_USERS_CHANGED = (
+    "OLD.current_hackathon_id IS DISTINCT FROM NEW.current_hackathon_id "
+    "OR OLD.role IS DISTINCT FROM NEW.role"
+)
+_SUBSCRIPTION_CHANGED = (
+    "OLD.hackathon_id IS DISTINCT FROM NEW.hackathon_id "
+    "OR OLD.enabled IS DISTINCT FROM NEW.enabled"
+)
+
+
+def _sqlite_ddl() -> list[str]:
+    def trigger(name: str, timing: str, table: str, when: str | None, body: list[str]) -> str:
+        when_sql = f" WHEN {when}" if when else ""
+        statements = " ".join(body)
+        return (
+            f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {timing} ON {table} "
+            f"FOR EACH ROW{when_sql} BEGIN {statements} END"
+        )
+
+    # SQLite has IS / IS NOT with the semantics of IS [NOT] DISTINCT FROM
+    users_changed = _USERS_CHANGED.replace("IS DISTINCT FROM", "IS NOT")
+    subscription_changed = _SUBSCRIPTION_CHANGED.replace("IS DISTINCT FROM", "IS NOT")
+    return [
+        trigger(_USER_TRIGGERS[0], "INSERT", "users", None, [_row_delta(_user_counts, "NEW", "+")]),
+        trigger(
+            _USER_TRIGGERS[1],
+            "UPDATE OF current_hackathon_id, role",
+            "users",
+            users_changed,
+            [_row_delta(_user_counts, "OLD", "-"), _row_delta(_user_counts, "NEW", "+")],
+        ),
+        trigger(_USER_TRIGGERS[2], "DELETE", "users", None, [_row_delta(_user_counts, "OLD", "-")]),
+        trigger(
+            _SUBSCRIPTION_TRIGGERS[0],
+            "INSERT",
+            "reminder_subscriptions",
+            "NEW.enabled",
+            [_row_delta(_subscription_counts, "NEW", "+")],
+        ),
+        trigger(
+            _SUBSCRIPTION_TRIGGERS[1],
+            "UPDATE OF hackathon_id, enabled",
+            "reminder_subscriptions",
+            subscription_changed,
+            [
+                _row_delta(_subscription_counts, "OLD", "-"),
+                _row_delta(_subscription_counts, "NEW", "+"),
+            ],
+        ),
+        trigger(
+            _SUBSCRIPTION_TRIGGERS[2],
+            "DELETE",
+            "reminder_subscriptions",
+            "OLD.enabled",
+            [_row_delta(_subscription_counts, "OLD", "-")],
+        ),
+    ]
+
+
+def _postgresql_ddl() -> list[str]:
+    def function(name: str, counts: Counts) -> str:
+        return (
+            f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$ BEGIN "
+            f"IF TG_OP = 'INSERT' THEN {_statement_delta(counts, [('new_rows', '+')])} "
+            f"ELSIF TG_OP = 'DELETE' THEN {_statement_delta(counts, [('old_rows', '-')])} "
+            "ELSE "
+            f"{_statement_delta(counts, [('old_rows', '-'), ('new_rows', '+')])} "
+            "END IF; RETURN NULL; END $$ LANGUAGE plpgsql"
+        )
+
+    # transition tables allow neither several events per trigger nor UPDATE OF columns,
+    # so there are three triggers per table and the UPDATE one fires on any update
+    def triggers(names: tuple[str, str, str], table: str, func: str) -> list[str]:
+        events = (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        )
+        statements = []
+        for name, (event, referencing) in zip(names, events, strict=True):
+            statements += [
+                f"DROP TRIGGER IF EXISTS {name} ON {table}",
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {func}()",
+            ]
+        return statements
+
+    users_func, subscriptions_func = _POSTGRESQL_FUNCTIONS
+    return [
+        *(
+            f"DROP TRIGGER IF EXISTS {name} ON {table}"
+            for name, table in _LEGACY_POSTGRESQL_TRIGGERS
+        ),
+        function(users_func, _user_counts),
+        function(subscriptions_func, _subscription_counts),
+        *triggers(_USER_TRIGGERS, "users", users_func),
+        *triggers(_SUBSCRIPTION_TRIGGERS, "reminder_subscriptions", subscriptions_func),
+    ]
+
+
+def counter_trigger_ddl(dialect_name: str) -> list[str]:
+    """CREATE statements for the counter triggers; empty for unsupported dialects."""
+    if dialect_name == "sqlite":
+        return _sqlite_ddl()
+    if dialect_name == "postgresql":
+        return _postgresql_ddl()
+    return []
+
+
+def drop_counter_trigger_ddl(dialect_name: str) -> list[str]:
+    if dialect_name == "sqlite":
+        return [f"DROP TRIGGER IF EXISTS {n}" for n in _USER_TRIGGERS + _SUBSCRIPTION_TRIGGERS]
+    if dialect_name == "postgresql":
+        return [
+            *(f"DROP TRIGGER IF EXISTS {n} ON users" for n in _USER_TRIGGERS),
+            *(
+                f"DROP TRIGGER IF EXISTS {n} ON reminder_subscriptions"
+                for n in _SUBSCRIPTION_TRIGGERS
+            ),
+            *(
+                f"DROP TRIGGER IF EXISTS {name} ON {table}"
+                for name, table in _LEGACY_POSTGRESQL_TRIGGERS
+            ),
+            *(f"DROP FUNCTION IF EXISTS {name}()" for name in _POSTGRESQL_FUNCTIONS),
+        ]
+    return []
+
+
+def install_counter_triggers(target: Any, connection: Any, **kw: Any) -> None:
+    """metadata.create_all hook: tables created outside Alembic get the triggers too."""
+    for statement in counter_trigger_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
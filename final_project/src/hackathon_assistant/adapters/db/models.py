@@ -1,3 +1,5 @@
+from datetime import UTC, datetime
+
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -9,14 +11,21 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
+    text,
 )
 from sqlalchemy.orm import declarative_base
 
-from ...domain.models import EventType, UserRole
+from ...domain.models import DeliveryStatus, EventType, UserRole
+from .counters import install_counter_triggers
 
 Base = declarative_base()
 
 
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class UserORM(Base):
     __tablename__ = "users"
     id = Column(Integer, primary_key=True)
@@ -25,7 +34,10 @@ class UserORM(Base):
     first_name = Column(String(255), default="")
     last_name = Column(String(255), default="")
     role = Column(Enum(UserRole), nullable=True)
-    current_hackathon_id = Column(Integer, ForeignKey("hackathons.id"))
+    current_hackathon_id = Column(Integer, ForeignKey("hackathons.id"), index=True)
+    unreachable_since = Column(DateTime, nullable=True)
+    # время регистрации; NULL у пользователей, созданных до появления колонки
+    created_at = Column(DateTime, nullable=True, default=_utc_now)
 
 
 class HackathonORM(Base):
@@ -37,6 +49,7 @@ class HackathonORM(Base):
     start_at = Column(DateTime, nullable=False)
     end_at = Column(DateTime, nullable=False)
     is_active = Column(Boolean, default=True)
+    content_version = Column(Integer, nullable=False, default=0, server_default="0")
 
 
 class EventORM(Base):
@@ -49,12 +62,14 @@ class EventORM(Base):
     ends_at = Column(DateTime, nullable=False)
     location = Column(String(255))
     description = Column(Text)
+    # расписание и окна напоминаний: фильтр по хакатону + диапазон/сортировка по началу
+    __table_args__ = (Index("ix_events_hackathon_id_starts_at", "hackathon_id", "starts_at"),)
 
 
 class FAQItemORM(Base):
     __tablename__ = "faq_items"
     id = Column(Integer, primary_key=True)
-    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False)
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
 
@@ -72,4 +87,112 @@ class ReminderSubscriptionORM(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False)
     enabled = Column(Boolean, default=True)
-    __table_args__ = (Index("uq_user_hackathon", "user_id", "hackathon_id", unique=True),)
+    __table_args__ = (
+        Index("uq_user_hackathon", "user_id", "hackathon_id", unique=True),
+        # только включённые подписки (получатели напоминаний); условие записано так же,
+        # как в запросах (enabled == True), иначе SQLite не применит частичный индекс
+        Index(
+            "ix_reminder_subscriptions_enabled_hackathon_id",
+            "hackathon_id",
+            "user_id",
+            sqlite_where=text("enabled = 1"),
+            postgresql_where=text("enabled"),
+        ),
+    )
+
+
+class SentReminderORM(Base):
+    __tablename__ = "sent_reminders"
+    id = Column(Integer, primary_key=True)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    offset_minutes = Column(Integer, nullable=False)
+    sent_at = Column(DateTime, nullable=False)
+    __table_args__ = (
+        Index("uq_sent_reminder", "event_id", "user_id", "offset_minutes", unique=True),
+    )
+
+
+class DeliveryOutboxORM(Base):
+    __tablename__ = "delivery_outbox"
+    id = Column(Integer, primary_key=True)
+    message_key = Column(String(128), nullable=False)
+    user_id = Column(Integer, nullable=True)
+    telegram_id = Column(BigInteger, nullable=False)
+    text = Column(Text, nullable=False)
+    status = Column(Enum(DeliveryStatus), nullable=False, default=DeliveryStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    locked_until = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    __table_args__ = (
+        Index("uq_outbox_message_recipient", "message_key", "telegram_id", unique=True),
+        Index("ix_delivery_outbox_status_id", "status", "id"),
+    )
+
+
+# кому прислать итог рассылки message_key; хранится в БД, потому что итог отправляет
+# процесс-держатель аренды отправителя, а не тот, что принял /admin_broadcast
+class DeliveryReportORM(Base):
+    __tablename__ = "delivery_reports"
+    message_key = Column(String(128), primary_key=True)
+    chat_id = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+# аренда права отправлять delivery_outbox: лимит Telegram общий на бота, поэтому
+# отправляет один процесс (см. DeliveryWorker)
+class DeliverySenderLeaseORM(Base):
+    __tablename__ = "delivery_sender_lease"
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(64), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+# счётчики /admin_stats, ведутся триггерами на users и reminder_subscriptions (см. counters.py);
+# hackathon_id = 0 — пользователи без выбранного хакатона, поэтому без внешнего ключа
+class HackathonCountersORM(Base):
+    __tablename__ = "hackathon_counters"
+    hackathon_id = Column(Integer, primary_key=True, autoincrement=False)
+    # счётчики хакатона разложены по нескольким строкам (см. counters.py), читаются суммой
+    shard = Column(Integer, primary_key=True, autoincrement=False, default=0, server_default="0")
+    total_users = Column(Integer, nullable=False, default=0, server_default="0")
+    participants = Column(Integer, nullable=False, default=0, server_default="0")
+    organizers = Column(Integer, nullable=False, default=0, server_default="0")
+    subscribed_users = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+event.listen(Base.metadata, "after_create", install_counter_triggers)
+
+
+# архив завершённых хакатонов: те же колонки (id сохраняются) + archived_at
+class ArchivedEventORM(Base):
+    __tablename__ = "archived_events"
+    id = Column(Integer, primary_key=True)
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    type = Column(Enum(EventType), nullable=False)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False)
+    location = Column(String(255))
+    description = Column(Text)
+    archived_at = Column(DateTime, nullable=False)
+
+
+class ArchivedFAQItemORM(Base):
+    __tablename__ = "archived_faq_items"
+    id = Column(Integer, primary_key=True)
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    question = Column(Text, nullable=False)
+    answer = Column(Text, nullable=False)
+    archived_at = Column(DateTime, nullable=False)
+
+
+class ArchivedReminderSubscriptionORM(Base):
+    __tablename__ = "archived_reminder_subscriptions"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    hackathon_id = Column(Integer, ForeignKey("hackathons.id"), nullable=False, index=True)
+    enabled = Column(Boolean)
+    archived_at = Column(DateTime, nullable=False)
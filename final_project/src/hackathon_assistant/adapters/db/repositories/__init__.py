@@ -1,15 +1,28 @@
+from .archive_repo import ArchiveRepo
+from .cached import CachedEventRepo, CachedFAQRepo, CachedRulesRepo, ContentCache
+from .counters_repo import HackathonCountersRepo
 from .event_repo import EventRepo
 from .faq_repo import FAQRepo
 from .hackathon_repo import HackathonRepo
+from .outbox_repo import OutboxRepo
 from .rules_repo import RulesRepo
+from .sent_reminder_repo import SentReminderRepo
 from .subscription_repo import SubscriptionRepo
 from .user_repo import UserRepo
 
 __all__ = [
+    "ArchiveRepo",
+    "CachedEventRepo",
+    "CachedFAQRepo",
+    "CachedRulesRepo",
+    "ContentCache",
     "EventRepo",
     "FAQRepo",
+    "HackathonCountersRepo",
     "HackathonRepo",
+    "OutboxRepo",
     "RulesRepo",
+    "SentReminderRepo",
     "SubscriptionRepo",
     "UserRepo",
 ]
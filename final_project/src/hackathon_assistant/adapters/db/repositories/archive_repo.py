@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Table, delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....use_cases.ports import ArchiveRepository
+from ..models import (
+    ArchivedEventORM,
+    ArchivedFAQItemORM,
+    ArchivedReminderSubscriptionORM,
+    EventORM,
+    FAQItemORM,
+    ReminderSubscriptionORM,
+    SentReminderORM,
+)
+from ..repositories_base import SQLAlchemyRepository
+from .hackathon_repo import bump_content_version
+
+# (горячая таблица, архивная)
+_ARCHIVED = (
+    (EventORM.__table__, ArchivedEventORM.__table__),
+    (FAQItemORM.__table__, ArchivedFAQItemORM.__table__),
+    (ReminderSubscriptionORM.__table__, ArchivedReminderSubscriptionORM.__table__),
+)
+
+
+class ArchiveRepo(SQLAlchemyRepository, ArchiveRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def archive_hackathon(self, hackathon_id: int) -> dict[str, int]:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        # журнал напоминаний ссылается на события; по прошедшему хакатону он больше не нужен
+        await self.session.execute(
+            delete(SentReminderORM).where(
+                SentReminderORM.event_id.in_(
+                    select(EventORM.id).where(EventORM.hackathon_id == hackathon_id)
+                )
+            )
+        )
+        moved: dict[str, int] = {}
+        for hot, archive in _ARCHIVED:
+            moved[hot.name] = await self._move(hot, archive, hackathon_id, now)
+        await bump_content_version(self.session, [hackathon_id])
+        return moved
+
+    async def _move(self, hot: Table, archive: Table, hackathon_id: int, now: datetime) -> int:
+        columns = [c.name for c in hot.columns]
+        rows = select(*hot.columns, literal(now).label("archived_at")).where(
+            hot.c.hackathon_id == hackathon_id
+        )
+        await self.session.execute(insert(archive).from_select([*columns, "archived_at"], rows))
+        result = await self.session.execute(delete(hot).where(hot.c.hackathon_id == hackathon_id))
+        return max(result.rowcount or 0, 0)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Collection, Hashable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....domain.models import Event, FAQItem, Rules
+from ....use_cases.ports import EventRepository, FAQRepository, RulesRepository
+
+
+class ContentCache:
+    """
+    Process-wide LRU + TTL cache for hackathon content (schedule, rules, FAQ).
+
+    Entries are keyed by (section, hackathon_id). At most max_entries are kept;
+    the least recently used entry is evicted first, and an entry older than
+    ttl_seconds is treated as a miss. The cache outlives DB sessions, so it is
+    created once per process and handed to RepositoryProvider.
+
+    The bot also keeps rendered replies here under (hackathon_id, section,
+    content_version). Writes made in this process invalidate explicitly (again
+    after commit, see _CachedSection); writes
+    from another process (the CLI) bump hackathons.content_version, and
+    observe_version drops the stale repository entries once the bot sees it.
+    """
+
+    MISSING: Any = object()
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._versions: dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """Cached value, or ContentCache.MISSING."""
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return self.MISSING
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def invalidate(self, section: str, hackathon_ids: Collection[int]) -> None:
+        for hackathon_id in hackathon_ids:
+            self._data.pop((section, hackathon_id), None)
+
+    def observe_version(self, hackathon_id: int, content_version: int) -> None:
+        """
+        Drop the hackathon's entries if its content changed since last seen.
+
+        That is the repository entries (section, hackathon_id) and the rendered
+        replies of older versions (hackathon_id, section, content_version): nobody
+        asks for an old version again, and left to LRU they would push out live entries.
+        """
+        known = self._versions.get(hackathon_id)
+        self._versions[hackathon_id] = content_version
+        if known is None or known == content_version:
+            return
+
+        def stale(key: Hashable) -> bool:
+            if not isinstance(key, tuple):
+                return False
+            if len(key) == 2:
+                return key[1] == hackathon_id
+            return len(key) == 3 and key[0] == hackathon_id and key[2] != content_version
+
+        for key in [k for k in self._data if stale(k)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._data)}
+
+
+class _CachedSection:
+    SECTION: str
+
+    def __init__(self, cache: ContentCache, session: AsyncSession | None) -> None:
+        self._cache = cache
+        self._session = session
+
+    def _invalidate(self, hackathon_ids: Collection[int]) -> None:
+        """
+        Drop the section now and once more after the session commits.
+
+        Until the commit another session still reads the old rows and may put
+        them back into the cache; the second drop removes them.
+        """
+        self._cache.invalidate(self.SECTION, hackathon_ids)
+        if self._session is None:
+            return
+        ids = list(hackathon_ids)
+
+        def invalidate(_session) -> None:
+            self._cache.invalidate(self.SECTION, ids)
+
+        event.listen(self._session.sync_session, "after_commit", invalidate, once=True)
+
+
+class CachedEventRepo(_CachedSection, EventRepository):
+    """EventRepository with get_by_hackathon served from ContentCache."""
+
+    SECTION = "events"
+
+    def __init__(
+        self, inner: EventRepository, cache: ContentCache, session: AsyncSession | None = None
+    ) -> None:
+        super().__init__(cache, session)
+        self._inner = inner
+
+    async def get_by_hackathon(self, hackathon_id: int) -> list[Event]:
+        key = (self.SECTION, hackathon_id)
+        events = self._cache.get(key)
+        if events is ContentCache.MISSING:
+            events = await self._inner.get_by_hackathon(hackathon_id)
+            self._cache.set(key, events)
+        return list(events)
+
+    async def get_upcoming_events(self, hackathon_id: int, hours_ahead: int) -> list[Event]:
+        return await self._inner.get_upcoming_events(hackathon_id, hours_ahead)
+
+    async def get_upcoming_for_active(self, hours_ahead: int) -> list[Event]:
+        return await self._inner.get_upcoming_for_active(hours_ahead)
+
+    async def save_all(self, events: list[Event]) -> list[Event]:
+        saved = await self._inner.save_all(events)
+        self._invalidate({e.hackathon_id for e in events})
+        return saved
+
+
+class CachedRulesRepo(_CachedSection, RulesRepository):
+    """RulesRepository with get_for_hackathon served from ContentCache."""
+
+    SECTION = "rules"
+
+    def __init__(
+        self, inner: RulesRepository, cache: ContentCache, session: AsyncSession | None = None
+    ) -> None:
+        super().__init__(cache, session)
+        self._inner = inner
+
+    async def get_for_hackathon(self, hackathon_id: int) -> Rules | None:
+        key = (self.SECTION, hackathon_id)
+        rules = self._cache.get(key)
+        if rules is ContentCache.MISSING:
+            # None (no rules yet) is cached too
+            rules = await self._inner.get_for_hackathon(hackathon_id)
+            self._cache.set(key, rules)
+        return rules
+
+    async def save(self, rules: Rules) -> Rules:
+        saved = await self._inner.save(rules)
+        self._invalidate([rules.hackathon_id])
+        return saved
+
+
+class CachedFAQRepo(_CachedSection, FAQRepository):
+    """FAQRepository with get_by_hackathon served from ContentCache."""
+
+    SECTION = "faq"
+
+    def __init__(
+        self, inner: FAQRepository, cache: ContentCache, session: AsyncSession | None = None
+    ) -> None:
+        super().__init__(cache, session)
+        self._inner = inner
+
+    async def get_by_hackathon(self, hackathon_id: int) -> list[FAQItem]:
+        key = (self.SECTION, hackathon_id)
+        items = self._cache.get(key)
+        if items is ContentCache.MISSING:
+            items = await self._inner.get_by_hackathon(hackathon_id)
+            self._cache.set(key, items)
+        return list(items)
+
+    async def save_all(self, faq_items: list[FAQItem]) -> list[FAQItem]:
+        saved = await self._inner.save_all(faq_items)
+        self._invalidate({item.hackathon_id for item in faq_items})
+        return saved
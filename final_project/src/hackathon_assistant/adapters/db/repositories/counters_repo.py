@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from sqlalchemy import Select, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....use_cases.dto import HackathonStatsDTO
+from ....use_cases.ports import HackathonCountersRepository
+from ..models import HackathonCountersORM, HackathonORM
+from ..repositories_base import SQLAlchemyRepository
+from .user_repo import hackathon_stats_select
+
+_COUNTERS = ("total_users", "participants", "organizers", "subscribed_users")
+# строка счётчиков пользователей без выбранного хакатона (см. counters.py)
+_NO_HACKATHON = 0
+
+
+class HackathonCountersRepo(SQLAlchemyRepository, HackathonCountersRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    def _select(self) -> Select:
+        # счётчики хакатона лежат в нескольких строках (по shard) — суммируем
+        counters = HackathonCountersORM
+        return (
+            select(
+                counters.hackathon_id,
+                HackathonORM.code,
+                HackathonORM.name,
+                *(func.sum(getattr(counters, c)).label(c) for c in _COUNTERS),
+            )
+            .outerjoin(HackathonORM, HackathonORM.id == counters.hackathon_id)
+            .group_by(counters.hackathon_id, HackathonORM.code, HackathonORM.name)
+        )
+
+    @staticmethod
+    def _to_dto(row) -> HackathonStatsDTO:
+        data = dict(row._mapping)
+        if data["hackathon_id"] == _NO_HACKATHON:
+            data["hackathon_id"] = None
+        return HackathonStatsDTO(**data)
+
+    async def get_by_hackathon(self, hackathon_id: int) -> HackathonStatsDTO | None:
+        stmt = self._select().where(HackathonCountersORM.hackathon_id == hackathon_id)
+        row = (await self.session.execute(stmt)).first()
+        return None if row is None else self._to_dto(row)
+
+    async def get_all(self) -> list[HackathonStatsDTO]:
+        stmt = self._select().order_by(HackathonCountersORM.hackathon_id)
+        return [self._to_dto(row) for row in await self.session.execute(stmt)]
+
+    async def reconcile(self) -> int:
+        if self.dialect_name == "postgresql":
+            # триггеры пишущих транзакций ждут конца пересчёта: их дельты не теряются
+            # и не считаются дважды (агрегат ниже видит только закоммиченные строки)
+            await self.session.execute(
+                text("LOCK TABLE hackathon_counters IN SHARE ROW EXCLUSIVE MODE")
+            )
+        zeros = (0,) * len(_COUNTERS)
+        actual = {
+            row.hackathon_id or _NO_HACKATHON: tuple(getattr(row, c) for c in _COUNTERS)
+            for row in await self.session.execute(hackathon_stats_select())
+        }
+        stored_stmt = select(
+            HackathonCountersORM.hackathon_id,
+            *(func.sum(getattr(HackathonCountersORM, c)) for c in _COUNTERS),
+        ).group_by(HackathonCountersORM.hackathon_id)
+        stored = {row[0]: tuple(row[1:]) for row in await self.session.execute(stored_stmt)}
+
+        drifted = sorted(
+            hackathon_id
+            for hackathon_id in actual.keys() | stored.keys()
+            if actual.get(hackathon_id, zeros) != stored.get(hackathon_id, zeros)
+        )
+        if not drifted:
+            return 0
+        # расходящийся хакатон переписываем целиком: все его строки заменяет одна (shard 0)
+        await self.session.execute(
+            delete(HackathonCountersORM).where(HackathonCountersORM.hackathon_id.in_(drifted))
+        )
+        rows = [
+            {
+                "hackathon_id": h,
+                "shard": 0,
+                **dict(zip(_COUNTERS, actual.get(h, zeros), strict=True)),
+            }
+            for h in drifted
+        ]
+        await self.session.execute(insert(HackathonCountersORM).values(rows))
+        return len(drifted)
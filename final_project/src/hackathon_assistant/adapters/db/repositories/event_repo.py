@@ -1,35 +1,74 @@
 from __future__ import annotations
 
+import logging
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.models import Event
-from ....use_cases.ports import EventRepository
-from ..models import EventORM
+from ....use_cases.ports import EventRepository, EventScheduleListener
+from ..models import EventORM, HackathonORM
 from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass, to_utc_naive
+from .hackathon_repo import bump_content_version
+from .mappers import RowMapper, to_dataclass, to_utc_naive
+
+logger = logging.getLogger(__name__)
+
+_INSERT_CHUNK = 1000
+_COLUMNS = tuple(EventORM.__table__.c)
+_to_event = RowMapper(Event, _COLUMNS)
+
+
+def _notify_after_commit(
+    session: AsyncSession, listener: EventScheduleListener, events: list[Event]
+) -> None:
+    """
+    Передать события слушателю после commit сессии; при откате — забыть
+
+    До фиксации другие сессии (планировщик напоминаний) событий не видят.
+    """
+    pending: list[tuple[EventScheduleListener, list[Event]]] | None = session.info.get(
+        "saved_events"
+    )
+    if pending is None:
+        pending = session.info["saved_events"] = []
+
+        def deliver(_session) -> None:
+            saved, pending[:] = pending[:], []
+            for saved_listener, saved_events in saved:
+                try:
+                    saved_listener.events_saved(saved_events)
+                except Exception as e:  # noqa: BLE001
+                    # commit уже прошёл, ошибку слушателя вызывающему не отдаём
+                    logger.exception("Event schedule listener failed: %r", e)
+
+        def discard(_session) -> None:
+            pending.clear()
+
+        event.listen(session.sync_session, "after_commit", deliver)
+        event.listen(session.sync_session, "after_rollback", discard)
+    pending.append((listener, events))
 
 
 class EventRepo(SQLAlchemyRepository, EventRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, listener: EventScheduleListener | None = None):
         super().__init__(session)
+        self._listener = listener
 
     async def get_by_hackathon(self, hackathon_id: int) -> list[Event]:
         stmt = (
-            select(EventORM)
+            select(*_COLUMNS)
             .where(EventORM.hackathon_id == hackathon_id)
             .order_by(EventORM.starts_at)
         )
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(Event, o.__dict__) for o in items]
+        return _to_event.all(await self.session.execute(stmt))
 
     async def get_upcoming_events(self, hackathon_id: int, hours_ahead: int) -> list[Event]:
         now = datetime.now(UTC).replace(tzinfo=None)
         upper = now + timedelta(hours=hours_ahead)
         stmt = (
-            select(EventORM)
+            select(*_COLUMNS)
             .where(
                 and_(
                     EventORM.hackathon_id == hackathon_id,
@@ -39,23 +78,41 @@ class EventRepo(SQLAlchemyRepository, EventRepository):
             )
             .order_by(EventORM.starts_at)
         )
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(Event, o.__dict__) for o in items]
+        return _to_event.all(await self.session.execute(stmt))
 
-    async def save_all(self, events: list[Event]) -> list[Event]:
-        saved_events = []
-        for event in events:
-            orm_obj = EventORM(
-                hackathon_id=event.hackathon_id,
-                title=event.title,
-                type=event.type,
-                starts_at=to_utc_naive(event.starts_at),
-                ends_at=to_utc_naive(event.ends_at),
-                location=event.location,
-                description=event.description,
+    async def get_upcoming_for_active(self, hours_ahead: int) -> list[Event]:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        upper = now + timedelta(hours=hours_ahead)
+        stmt = (
+            select(*_COLUMNS)
+            .join(HackathonORM, HackathonORM.id == EventORM.hackathon_id)
+            .where(
+                HackathonORM.is_active == True,  # noqa: E712
+                EventORM.starts_at >= now,
+                EventORM.starts_at <= upper,
             )
-            self.session.add(orm_obj)
-            await self.session.flush()
-            saved_events.append(to_dataclass(Event, orm_obj.__dict__))
-        await self.session.commit()
+            .order_by(EventORM.starts_at)
+        )
+        return _to_event.all(await self.session.execute(stmt))
+
+    async def save_all(self, events: list[Event]) -> list[Event]:
+        rows = [
+            {
+                "hackathon_id": event.hackathon_id,
+                "title": event.title,
+                "type": event.type,
+                "starts_at": to_utc_naive(event.starts_at),
+                "ends_at": to_utc_naive(event.ends_at),
+                "location": event.location,
+                "description": event.description,
+            }
+            for event in events
+        ]
+        ids = await self.insert_returning_ids(EventORM, rows, chunk_size=_INSERT_CHUNK)
+        saved_events = [
+            to_dataclass(Event, {**row, "id": id_}) for row, id_ in zip(rows, ids, strict=True)
+        ]
+        await bump_content_version(self.session, {e.hackathon_id for e in events})
+        if self._listener is not None and saved_events:
+            _notify_after_commit(self.session, self._listener, saved_events)
         return saved_events
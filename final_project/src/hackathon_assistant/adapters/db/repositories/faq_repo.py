@@ -7,7 +7,12 @@ from ....domain.models import FAQItem
 from ....use_cases.ports import FAQRepository
 from ..models import FAQItemORM
 from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass
+from .hackathon_repo import bump_content_version
+from .mappers import RowMapper, to_dataclass
+
+_INSERT_CHUNK = 1000
+_COLUMNS = tuple(FAQItemORM.__table__.c)
+_to_faq_item = RowMapper(FAQItem, _COLUMNS)
 
 
 class FAQRepo(SQLAlchemyRepository, FAQRepository):
@@ -16,23 +21,18 @@ class FAQRepo(SQLAlchemyRepository, FAQRepository):
 
     async def get_by_hackathon(self, hackathon_id: int) -> list[FAQItem]:
         stmt = (
-            select(FAQItemORM)
-            .where(FAQItemORM.hackathon_id == hackathon_id)
-            .order_by(FAQItemORM.id)
+            select(*_COLUMNS).where(FAQItemORM.hackathon_id == hackathon_id).order_by(FAQItemORM.id)
         )
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(FAQItem, o.__dict__) for o in items]
+        return _to_faq_item.all(await self.session.execute(stmt))
 
     async def save_all(self, faq_items: list[FAQItem]) -> list[FAQItem]:
-        saved_items = []
-        for item in faq_items:
-            orm_obj = FAQItemORM(
-                hackathon_id=item.hackathon_id,
-                question=item.question,
-                answer=item.answer,
-            )
-            self.session.add(orm_obj)
-            await self.session.flush()
-            saved_items.append(to_dataclass(FAQItem, orm_obj.__dict__))
-        await self.session.commit()
+        rows = [
+            {"hackathon_id": item.hackathon_id, "question": item.question, "answer": item.answer}
+            for item in faq_items
+        ]
+        ids = await self.insert_returning_ids(FAQItemORM, rows, chunk_size=_INSERT_CHUNK)
+        saved_items = [
+            to_dataclass(FAQItem, {**row, "id": id_}) for row, id_ in zip(rows, ids, strict=True)
+        ]
+        await bump_content_version(self.session, {item.hackathon_id for item in faq_items})
         return saved_items
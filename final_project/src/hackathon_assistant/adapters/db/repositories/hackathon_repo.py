@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+from dataclasses import fields
+
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....domain.models import Hackathon
 from ....use_cases.ports import HackathonRepository
 from ..models import HackathonORM
-from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass, to_utc_naive
+from ..repositories_base import SQLAlchemyRepository, identity_map
+from .mappers import RowMapper, to_dataclass, to_utc_naive
+
+_COLUMNS = tuple(HackathonORM.__table__.c)
+_to_hackathon = RowMapper(Hackathon, _COLUMNS)
+
+
+async def bump_content_version(session: AsyncSession, hackathon_ids: Collection[int]) -> None:
+    """Увеличить content_version в текущей транзакции"""
+    if not hackathon_ids:
+        return
+    stmt = (
+        update(HackathonORM)
+        .where(HackathonORM.id.in_(list(hackathon_ids)))
+        .values(content_version=HackathonORM.content_version + 1)
+    )
+    await session.execute(stmt)
+    identity_map(session).evict(Hackathon)
 
 
 class HackathonRepo(SQLAlchemyRepository, HackathonRepository):
@@ -15,33 +34,55 @@ class HackathonRepo(SQLAlchemyRepository, HackathonRepository):
         super().__init__(session)
 
     async def get_by_code(self, code: str) -> Hackathon | None:
-        stmt = select(HackathonORM).where(HackathonORM.code == code)
-        orm_obj = (await self.session.execute(stmt)).scalars().first()
-        return None if orm_obj is None else to_dataclass(Hackathon, orm_obj.__dict__)
+        hackathon = self.identity_map.get(Hackathon, "code", code)
+        if hackathon is not self.identity_map.MISSING:
+            return hackathon
+        stmt = select(*_COLUMNS).where(HackathonORM.code == code)
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            self.identity_map.put(Hackathon, "code", code, None)
+            return None
+        return self._remember(_to_hackathon(row))
 
     async def get_all_active(self) -> list[Hackathon]:
-        stmt = select(HackathonORM).where(HackathonORM.is_active == True)  # noqa: E712
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(Hackathon, o.__dict__) for o in items]
+        stmt = select(*_COLUMNS).where(HackathonORM.is_active == True)  # noqa: E712
+        return _to_hackathon.all(await self.session.execute(stmt))
 
     async def get_by_id(self, hackathon_id: int) -> Hackathon | None:
-        stmt = select(HackathonORM).where(HackathonORM.id == hackathon_id)
-        orm_obj = (await self.session.execute(stmt)).scalars().first()
-        return None if orm_obj is None else to_dataclass(Hackathon, orm_obj.__dict__)
+        hackathon = self.identity_map.get(Hackathon, "id", hackathon_id)
+        if hackathon is not self.identity_map.MISSING:
+            return hackathon
+        stmt = select(*_COLUMNS).where(HackathonORM.id == hackathon_id)
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            self.identity_map.put(Hackathon, "id", hackathon_id, None)
+            return None
+        return self._remember(_to_hackathon(row))
 
     async def save(self, hackathon: Hackathon) -> Hackathon:
-        data = {k: v for k, v in hackathon.__dict__.items() if hasattr(HackathonORM, k)}
+        data = {
+            f.name: getattr(hackathon, f.name)
+            for f in fields(hackathon)
+            if hasattr(HackathonORM, f.name)
+        }
         data["start_at"] = to_utc_naive(data.get("start_at"))
         data["end_at"] = to_utc_naive(data.get("end_at"))
+        # версию контента меняют только записи расписания, правил и FAQ
+        data.pop("content_version", None)
 
         if getattr(hackathon, "id", None) is None:
             orm_obj = HackathonORM(**data)
             self.session.add(orm_obj)
-            await self.session.commit()
-            await self.session.refresh(orm_obj)
-            return to_dataclass(Hackathon, orm_obj.__dict__)
+            await self.session.flush()
+            return self._remember(to_dataclass(Hackathon, orm_obj.__dict__))
 
         stmt = update(HackathonORM).where(HackathonORM.id == hackathon.id).values(**data)
         await self.session.execute(stmt)
-        await self.session.commit()
+        # code мог измениться, а content_version в hackathon не пишется
+        self.identity_map.evict(Hackathon)
+        return hackathon
+
+    def _remember(self, hackathon: Hackathon) -> Hackathon:
+        self.identity_map.put(Hackathon, "id", hackathon.id, hackathon)
+        self.identity_map.put(Hackathon, "code", hackathon.code, hackathon)
         return hackathon
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import fields, is_dataclass
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import MISSING, fields, is_dataclass
 from datetime import UTC, datetime
-from typing import Any, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -16,6 +17,66 @@ def to_dataclass(dc_cls: type[T], data: dict[str, Any]) -> T:
     return dc_cls(**filtered)  # type: ignore[arg-type]
 
 
+class RowMapper(Generic[T]):
+    """
+    Row -> dataclass builder compiled once for a fixed column list.
+
+    The generated function reads the row by position, so there is no per-row
+    fields() call, dict building or key filtering, and it works on Core Row
+    tuples (select(*table.c)) without loading ORM instances. Columns that are
+    not fields are skipped; fields without a column get their default.
+
+    trusted=True is for rows read from our own tables: the instance is created
+    without calling __init__, so __post_init__ validation does not run again
+    (attributes are set one by one, which also fills the slots of slots=True models).
+    trusted=False calls the constructor with keyword arguments.
+    """
+
+    def __init__(self, dc_cls: type[T], columns: Iterable[str | Any], trusted: bool = True) -> None:
+        if not is_dataclass(dc_cls):
+            raise TypeError(f"{dc_cls} is not a dataclass")
+        self.dc_cls = dc_cls
+        self.columns = tuple(c if isinstance(c, str) else c.key for c in columns)
+        self.trusted = trusted
+        self._build = self._compile()
+
+    def __call__(self, row: Sequence[Any]) -> T:
+        return self._build(row)
+
+    def all(self, rows: Iterable[Sequence[Any]]) -> list[T]:
+        return list(map(self._build, rows))
+
+    def _compile(self) -> Callable[[Sequence[Any]], T]:
+        position = {name: i for i, name in enumerate(self.columns)}
+        namespace: dict[str, Any] = {"_cls": self.dc_cls, "_new": object.__new__}
+        values: list[tuple[str, str]] = []
+        for f in fields(self.dc_cls):
+            if f.name in position:
+                values.append((f.name, f"row[{position[f.name]}]"))
+            elif not self.trusted:
+                continue  # the constructor fills defaults itself
+            elif f.default is not MISSING:
+                namespace[f"_default_{f.name}"] = f.default
+                values.append((f.name, f"_default_{f.name}"))
+            elif f.default_factory is not MISSING:
+                namespace[f"_factory_{f.name}"] = f.default_factory
+                values.append((f.name, f"_factory_{f.name}()"))
+            else:
+                raise ValueError(f"{self.dc_cls.__name__}.{f.name} has no column and no default")
+
+        if self.trusted:
+            body = ["    obj = _new(_cls)"]
+            body += [f"    obj.{name} = {value}" for name, value in values]
+            body.append("    return obj")
+        else:
+            args = ", ".join(f"{name}={value}" for name, value in values)
+            body = [f"    return _cls({args})"]
+        source = "def build(row):\n" + "\n".join(body)
+        # source is built from dataclass field names and column positions only
+        exec(source, namespace)
+        return namespace["build"]
+
+
 def to_utc_naive(dt: datetime | None) -> datetime | None:
     """
     Convert timezone-aware datetime -> naive UTC datetime.
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....domain.models import DeliveryStatus, OutboxMessage
+from ....use_cases.ports import OutboxRepository
+from ..models import DeliveryOutboxORM, DeliveryReportORM, DeliverySenderLeaseORM
+from ..repositories_base import SQLAlchemyRepository
+
+_INSERT_CHUNK = 1000
+_SENDER_LEASE = "outbox"
+_OUTBOX_COLUMNS = (
+    DeliveryOutboxORM.id,
+    DeliveryOutboxORM.message_key,
+    DeliveryOutboxORM.user_id,
+    DeliveryOutboxORM.telegram_id,
+    DeliveryOutboxORM.text,
+    DeliveryOutboxORM.status,
+    DeliveryOutboxORM.attempts,
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class OutboxRepo(SQLAlchemyRepository, OutboxRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def enqueue(self, messages: list[OutboxMessage]) -> int:
+        now = _utc_now()
+        inserted = 0
+        for start in range(0, len(messages), _INSERT_CHUNK):
+            rows = [
+                {
+                    "message_key": m.message_key,
+                    "user_id": m.user_id,
+                    "telegram_id": m.telegram_id,
+                    "text": m.text,
+                    "status": DeliveryStatus.PENDING,
+                    "attempts": 0,
+                    "created_at": now,
+                }
+                for m in messages[start : start + _INSERT_CHUNK]
+            ]
+            # повторная постановка того же сообщения тому же получателю игнорируется
+            stmt = (
+                self.upsert_insert(DeliveryOutboxORM)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["message_key", "telegram_id"])
+            )
+            result = await self.session.execute(stmt)
+            inserted += max(result.rowcount or 0, 0)
+        return inserted
+
+    async def claim_batch(self, limit: int, lease_seconds: int) -> list[OutboxMessage]:
+        now = _utc_now()
+        candidates = (
+            select(DeliveryOutboxORM.id)
+            .where(
+                DeliveryOutboxORM.status.in_([DeliveryStatus.PENDING, DeliveryStatus.IN_PROGRESS]),
+                # у PENDING — время следующей попытки после временной ошибки; у IN_PROGRESS
+                # истёкшая аренда упавшего воркера — строку можно забрать снова
+                or_(
+                    DeliveryOutboxORM.locked_until.is_(None),
+                    DeliveryOutboxORM.locked_until < now,
+                ),
+            )
+            .order_by(DeliveryOutboxORM.id)
+            .limit(limit)
+        )
+        if self.dialect_name == "postgresql":
+            # параллельные воркеры не ждут друг друга и не берут одни и те же строки
+            candidates = candidates.with_for_update(skip_locked=True)
+        # SQLite сериализует запись целиком, поэтому UPDATE ... WHERE id IN (...) атомарен и так
+
+        stmt = (
+            update(DeliveryOutboxORM)
+            .where(DeliveryOutboxORM.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=DeliveryStatus.IN_PROGRESS,
+                locked_until=now + timedelta(seconds=lease_seconds),
+                attempts=DeliveryOutboxORM.attempts + 1,
+            )
+            .returning(*_OUTBOX_COLUMNS)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return sorted((OutboxMessage(**row._mapping) for row in rows), key=lambda m: m.id)
+
+    async def mark_sent(self, ids: list[int]) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(DeliveryOutboxORM)
+            .where(DeliveryOutboxORM.id.in_(ids))
+            .values(status=DeliveryStatus.SENT, sent_at=_utc_now(), locked_until=None)
+        )
+        await self.session.execute(stmt)
+
+    async def mark_failed(self, ids: list[int], error: str) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(DeliveryOutboxORM)
+            .where(DeliveryOutboxORM.id.in_(ids))
+            .values(status=DeliveryStatus.FAILED, last_error=error, locked_until=None)
+        )
+        await self.session.execute(stmt)
+
+    async def retry_later(self, ids: list[int], delay_seconds: float, error: str) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(DeliveryOutboxORM)
+            .where(DeliveryOutboxORM.id.in_(ids))
+            .values(
+                status=DeliveryStatus.PENDING,
+                last_error=error,
+                locked_until=_utc_now() + timedelta(seconds=delay_seconds),
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def release(self, ids: list[int]) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(DeliveryOutboxORM).where(
+                DeliveryOutboxORM.id.in_(ids),
+                DeliveryOutboxORM.status == DeliveryStatus.IN_PROGRESS,
+            )
+            # попытки не было: claim_batch её уже посчитал
+            .values(
+                status=DeliveryStatus.PENDING,
+                locked_until=None,
+                attempts=DeliveryOutboxORM.attempts - 1,
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def extend_lease(self, ids: list[int], lease_seconds: int) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(DeliveryOutboxORM)
+            .where(
+                DeliveryOutboxORM.id.in_(ids),
+                DeliveryOutboxORM.status == DeliveryStatus.IN_PROGRESS,
+            )
+            .values(locked_until=_utc_now() + timedelta(seconds=lease_seconds))
+        )
+        await self.session.execute(stmt)
+
+    async def delete_finished(self, older_than: datetime, limit: int) -> int:
+        # старые строки — с меньшими id: просмотр (status, id) останавливается после limit
+        candidates = (
+            select(DeliveryOutboxORM.id)
+            .where(
+                DeliveryOutboxORM.status.in_([DeliveryStatus.SENT, DeliveryStatus.FAILED]),
+                DeliveryOutboxORM.created_at < older_than,
+            )
+            .order_by(DeliveryOutboxORM.id)
+            .limit(limit)
+        )
+        stmt = delete(DeliveryOutboxORM).where(
+            DeliveryOutboxORM.id.in_(candidates.scalar_subquery())
+        )
+        result = await self.session.execute(stmt)
+        return max(result.rowcount or 0, 0)
+
+    async def count_by_status(self, message_key: str) -> dict[DeliveryStatus, int]:
+        stmt = (
+            select(DeliveryOutboxORM.status, func.count(DeliveryOutboxORM.id))
+            .where(DeliveryOutboxORM.message_key == message_key)
+            .group_by(DeliveryOutboxORM.status)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return {DeliveryStatus(status): int(count) for status, count in rows}
+
+    async def add_report(self, message_key: str, chat_id: int) -> None:
+        stmt = self.upsert_insert(DeliveryReportORM).values(
+            message_key=message_key, chat_id=chat_id, created_at=_utc_now()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["message_key"], set_={"chat_id": stmt.excluded.chat_id}
+        )
+        await self.session.execute(stmt)
+
+    async def take_finished_reports(self) -> list[tuple[str, int]]:
+        queued = exists().where(
+            DeliveryOutboxORM.message_key == DeliveryReportORM.message_key,
+            DeliveryOutboxORM.status.in_([DeliveryStatus.PENDING, DeliveryStatus.IN_PROGRESS]),
+        )
+        # DELETE ... RETURNING: из параллельных воркеров строку получит только один
+        stmt = (
+            delete(DeliveryReportORM)
+            .where(~queued)
+            .returning(DeliveryReportORM.message_key, DeliveryReportORM.chat_id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(message_key, int(chat_id)) for message_key, chat_id in rows]
+
+    async def acquire_sender_lease(self, holder: str, seconds: int) -> bool:
+        now = _utc_now()
+        insert_stmt = self.upsert_insert(DeliverySenderLeaseORM).values(
+            name=_SENDER_LEASE, holder=holder, expires_at=now + timedelta(seconds=seconds)
+        )
+        lease = DeliverySenderLeaseORM.__table__
+        # продлить свою аренду или забрать истёкшую; чужая действующая не трогается,
+        # и RETURNING тогда пуст
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "holder": insert_stmt.excluded.holder,
+                "expires_at": insert_stmt.excluded.expires_at,
+            },
+            where=or_(lease.c.holder == insert_stmt.excluded.holder, lease.c.expires_at < now),
+        ).returning(lease.c.holder)
+        return (await self.session.execute(stmt)).first() is not None
+
+    async def release_sender_lease(self, holder: str) -> None:
+        stmt = delete(DeliverySenderLeaseORM).where(
+            DeliverySenderLeaseORM.name == _SENDER_LEASE, DeliverySenderLeaseORM.holder == holder
+        )
+        await self.session.execute(stmt)
@@ -7,7 +7,11 @@ from ....domain.models import Rules
 from ....use_cases.ports import RulesRepository
 from ..models import RulesORM
 from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass
+from .hackathon_repo import bump_content_version
+from .mappers import RowMapper, to_dataclass
+
+_COLUMNS = tuple(RulesORM.__table__.c)
+_to_rules = RowMapper(Rules, _COLUMNS)
 
 
 class RulesRepo(SQLAlchemyRepository, RulesRepository):
@@ -15,9 +19,9 @@ class RulesRepo(SQLAlchemyRepository, RulesRepository):
         super().__init__(session)
 
     async def get_for_hackathon(self, hackathon_id: int) -> Rules | None:
-        stmt = select(RulesORM).where(RulesORM.hackathon_id == hackathon_id)
-        orm_obj = (await self.session.execute(stmt)).scalars().first()
-        return None if orm_obj is None else to_dataclass(Rules, orm_obj.__dict__)
+        stmt = select(*_COLUMNS).where(RulesORM.hackathon_id == hackathon_id)
+        row = (await self.session.execute(stmt)).first()
+        return None if row is None else _to_rules(row)
 
     async def save(self, rules: Rules) -> Rules:
         stmt = select(RulesORM).where(RulesORM.hackathon_id == rules.hackathon_id)
@@ -33,6 +37,6 @@ class RulesRepo(SQLAlchemyRepository, RulesRepository):
         else:
             orm_obj.content = rules.content
 
-        await self.session.commit()
-        await self.session.refresh(orm_obj)
+        await self.session.flush()
+        await bump_content_version(self.session, [rules.hackathon_id])
         return to_dataclass(Rules, orm_obj.__dict__)
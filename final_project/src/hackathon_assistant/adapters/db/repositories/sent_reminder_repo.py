@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Collection
+from datetime import UTC, datetime
+
+from sqlalchemy import Select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....domain.models import Event, SentReminder
+from ....use_cases.ports import SentReminderRepository
+from ..models import EventORM, SentReminderORM, UserORM
+from ..repositories_base import SQLAlchemyRepository
+from .subscription_repo import (
+    reminder_target_paging,
+    reminder_targets_select,
+    to_reminder_targets,
+)
+
+_INSERT_CHUNK = 1000
+
+
+class SentReminderRepo(SQLAlchemyRepository, SentReminderRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    def _owed_select(
+        self, hours_ahead: int, offset_minutes: int, hackathon_ids: Collection[int] | None
+    ) -> Select:
+        already_sent = exists().where(
+            SentReminderORM.event_id == EventORM.id,
+            SentReminderORM.user_id == UserORM.id,
+            SentReminderORM.offset_minutes == offset_minutes,
+        )
+        return reminder_targets_select(hours_ahead, hackathon_ids).where(~already_sent)
+
+    async def get_owed(
+        self,
+        hours_ahead: int,
+        offset_minutes: int,
+        hackathon_ids: Collection[int] | None = None,
+    ) -> list[tuple[Event, int, int]]:
+        stmt = self._owed_select(hours_ahead, offset_minutes, hackathon_ids)
+        return to_reminder_targets((await self.session.execute(stmt)).all())
+
+    async def iter_owed(
+        self,
+        hours_ahead: int,
+        offset_minutes: int,
+        hackathon_ids: Collection[int] | None = None,
+        chunk_size: int = 1000,
+        by_user: bool = False,
+    ) -> AsyncIterator[list[tuple[Event, int, int]]]:
+        stmt = self._owed_select(hours_ahead, offset_minutes, hackathon_ids)
+        keys, key_of = reminder_target_paging(by_user)
+        async for rows in self.iter_keyset(stmt, keys, key_of, chunk_size):
+            yield to_reminder_targets(rows)
+
+    async def record(self, reminders: list[SentReminder]) -> int:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        inserted = 0
+        for start in range(0, len(reminders), _INSERT_CHUNK):
+            rows = [
+                {
+                    "event_id": r.event_id,
+                    "user_id": r.user_id,
+                    "offset_minutes": r.offset_minutes,
+                    "sent_at": now,
+                }
+                for r in reminders[start : start + _INSERT_CHUNK]
+            ]
+            stmt = (
+                self.upsert_insert(SentReminderORM)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["event_id", "user_id", "offset_minutes"])
+            )
+            result = await self.session.execute(stmt)
+            inserted += max(result.rowcount or 0, 0)
+        return inserted
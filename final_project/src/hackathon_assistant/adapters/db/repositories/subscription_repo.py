@@ -1,13 +1,90 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select, update
+from collections.abc import AsyncIterator, Callable, Collection, Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import Row, Select, and_, func, select, true, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....domain.models import ReminderSubscription, User
+from ....domain.models import Event, ReminderSubscription, User
 from ....use_cases.ports import SubscriptionRepository
-from ..models import ReminderSubscriptionORM, UserORM
+from ..models import EventORM, HackathonORM, ReminderSubscriptionORM, UserORM
 from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass
+from .mappers import RowMapper, to_dataclass
+
+_COLUMNS = tuple(ReminderSubscriptionORM.__table__.c)
+_USER_COLUMNS = tuple(UserORM.__table__.c)
+_EVENT_COLUMNS = tuple(EventORM.__table__.c)
+_to_subscription = RowMapper(ReminderSubscription, _COLUMNS)
+_to_user = RowMapper(User, _USER_COLUMNS)
+# строка reminder_targets_select начинается с колонок события
+_to_event = RowMapper(Event, _EVENT_COLUMNS)
+
+
+def reminder_targets_select(
+    hours_ahead: int, hackathon_ids: Collection[int] | None = None
+) -> Select:
+    """
+    (колонки events..., user_id, telegram_id) для событий активных хакатонов в окне
+    [now, now + hours_ahead] и всех включённых подписок на эти хакатоны — одним JOIN
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    upper = now + timedelta(hours=hours_ahead)
+    stmt = (
+        select(*_EVENT_COLUMNS, UserORM.id.label("user_id"), UserORM.telegram_id)
+        .join(HackathonORM, HackathonORM.id == EventORM.hackathon_id)
+        .join(
+            ReminderSubscriptionORM,
+            and_(
+                ReminderSubscriptionORM.hackathon_id == EventORM.hackathon_id,
+                ReminderSubscriptionORM.enabled == True,  # noqa: E712
+            ),
+        )
+        .join(UserORM, UserORM.id == ReminderSubscriptionORM.user_id)
+        .where(
+            HackathonORM.is_active == True,  # noqa: E712
+            UserORM.unreachable_since.is_(None),
+            EventORM.starts_at >= now,
+            EventORM.starts_at <= upper,
+        )
+        .order_by(EventORM.starts_at, EventORM.id, UserORM.id)
+    )
+    if hackathon_ids is not None:
+        stmt = stmt.where(EventORM.hackathon_id.in_(list(hackathon_ids)))
+    return stmt
+
+
+# порядок выдачи reminder_targets_select при чтении по частям (keyset)
+REMINDER_TARGET_KEYS = (EventORM.starts_at, EventORM.id, UserORM.id)
+# то же по получателям: все события пользователя идут подряд (дайджест)
+REMINDER_TARGET_USER_KEYS = (UserORM.id, EventORM.starts_at, EventORM.id)
+
+
+def reminder_target_key(row: Row) -> tuple:
+    return row.starts_at, row.id, row.user_id
+
+
+def reminder_target_user_key(row: Row) -> tuple:
+    return row.user_id, row.starts_at, row.id
+
+
+def reminder_target_paging(by_user: bool) -> tuple[tuple, Callable[[Row], tuple]]:
+    """Ключи keyset и извлечение ключа из строки для чтения по частям"""
+    if by_user:
+        return REMINDER_TARGET_USER_KEYS, reminder_target_user_key
+    return REMINDER_TARGET_KEYS, reminder_target_key
+
+
+def to_reminder_targets(rows: Sequence[Row]) -> list[tuple[Event, int, int]]:
+    """Строки reminder_targets_select в (событие, user_id, telegram_id); Event на событие один"""
+    events: dict[int, Event] = {}
+    result: list[tuple[Event, int, int]] = []
+    for row in rows:
+        event = events.get(row.id)
+        if event is None:
+            event = events[row.id] = _to_event(row)
+        result.append((event, row.user_id, row.telegram_id))
+    return result
 
 
 class SubscriptionRepo(SQLAlchemyRepository, SubscriptionRepository):
@@ -17,12 +94,49 @@ class SubscriptionRepo(SQLAlchemyRepository, SubscriptionRepository):
     async def get_user_subscription(
         self, user_id: int, hackathon_id: int
     ) -> ReminderSubscription | None:
-        stmt = select(ReminderSubscriptionORM).where(
+        key = (user_id, hackathon_id)
+        subscription = self.identity_map.get(ReminderSubscription, "user_hackathon", key)
+        if subscription is not self.identity_map.MISSING:
+            return subscription
+        stmt = select(*_COLUMNS).where(
             ReminderSubscriptionORM.user_id == user_id,
             ReminderSubscriptionORM.hackathon_id == hackathon_id,
         )
-        orm_obj = (await self.session.execute(stmt)).scalars().first()
-        return None if orm_obj is None else to_dataclass(ReminderSubscription, orm_obj.__dict__)
+        row = (await self.session.execute(stmt)).first()
+        subscription = None if row is None else _to_subscription(row)
+        self.identity_map.put(ReminderSubscription, "user_hackathon", key, subscription)
+        return subscription
+
+    async def set_subscription(self, telegram_id: int, enabled: bool) -> bool:
+        current = select(UserORM.id, UserORM.current_hackathon_id).where(
+            UserORM.telegram_id == telegram_id, UserORM.current_hackathon_id.is_not(None)
+        )
+        if enabled:
+            # INSERT ... SELECT: пользователя и его хакатон находит сама вставка,
+            # повторное нажатие упирается в uq_user_hackathon и становится UPDATE
+            insert_stmt = self.upsert_insert(ReminderSubscriptionORM).from_select(
+                ["user_id", "hackathon_id", "enabled"], current.add_columns(true())
+            )
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["user_id", "hackathon_id"], set_={"enabled": True}
+            ).returning(*_COLUMNS)
+        else:
+            # выключение не создаёт подписку, которой не было
+            stmt = (
+                update(ReminderSubscriptionORM)
+                .where(
+                    tuple_(
+                        ReminderSubscriptionORM.user_id, ReminderSubscriptionORM.hackathon_id
+                    ).in_(current)
+                )
+                .values(enabled=False)
+                .returning(*_COLUMNS)
+            )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return False
+        self._remember(_to_subscription(row))
+        return True
 
     async def save(self, subscription: ReminderSubscription) -> ReminderSubscription:
         if getattr(subscription, "id", None) is None:
@@ -32,9 +146,10 @@ class SubscriptionRepo(SQLAlchemyRepository, SubscriptionRepository):
                 enabled=subscription.enabled,
             )
             self.session.add(orm_obj)
-            await self.session.commit()
-            await self.session.refresh(orm_obj)
-            return to_dataclass(ReminderSubscription, orm_obj.__dict__)
+            await self.session.flush()
+            saved = to_dataclass(ReminderSubscription, orm_obj.__dict__)
+            self._remember(saved)
+            return saved
 
         stmt = (
             update(ReminderSubscriptionORM)
@@ -42,27 +157,59 @@ class SubscriptionRepo(SQLAlchemyRepository, SubscriptionRepository):
             .values(enabled=subscription.enabled)
         )
         await self.session.execute(stmt)
-        await self.session.commit()
+        self._remember(subscription)
         return subscription
 
+    def _remember(self, subscription: ReminderSubscription) -> None:
+        key = (subscription.user_id, subscription.hackathon_id)
+        self.identity_map.put(ReminderSubscription, "user_hackathon", key, subscription)
+
     async def get_by_hackathon(self, hackathon_id: int) -> list[ReminderSubscription]:
-        stmt = select(ReminderSubscriptionORM).where(
-            ReminderSubscriptionORM.hackathon_id == hackathon_id
+        stmt = select(*_COLUMNS).where(ReminderSubscriptionORM.hackathon_id == hackathon_id)
+        return _to_subscription.all(await self.session.execute(stmt))
+
+    async def disable_all_for_hackathon(self, hackathon_id: int) -> int:
+        stmt = (
+            update(ReminderSubscriptionORM)
+            .where(
+                ReminderSubscriptionORM.hackathon_id == hackathon_id,
+                ReminderSubscriptionORM.enabled == True,  # noqa: E712
+            )
+            .values(enabled=False)
         )
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(ReminderSubscription, o.__dict__) for o in items]
+        result = await self.session.execute(stmt)
+        self.identity_map.evict(ReminderSubscription)
+        return max(result.rowcount or 0, 0)
 
     async def get_subscribed_users(self, hackathon_id: int) -> list[User]:
         stmt = (
-            select(UserORM)
+            select(*_USER_COLUMNS)
             .join(ReminderSubscriptionORM, ReminderSubscriptionORM.user_id == UserORM.id)
             .where(
                 ReminderSubscriptionORM.hackathon_id == hackathon_id,
                 ReminderSubscriptionORM.enabled == True,  # noqa: E712
+                UserORM.unreachable_since.is_(None),
             )
         )
-        users = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(User, u.__dict__) for u in users]
+        return _to_user.all(await self.session.execute(stmt))
+
+    async def get_reminder_targets(
+        self, hours_ahead: int, hackathon_ids: Collection[int] | None = None
+    ) -> list[tuple[Event, int, int]]:
+        stmt = reminder_targets_select(hours_ahead, hackathon_ids)
+        return to_reminder_targets((await self.session.execute(stmt)).all())
+
+    async def iter_reminder_targets(
+        self,
+        hours_ahead: int,
+        hackathon_ids: Collection[int] | None = None,
+        chunk_size: int = 1000,
+        by_user: bool = False,
+    ) -> AsyncIterator[list[tuple[Event, int, int]]]:
+        stmt = reminder_targets_select(hours_ahead, hackathon_ids)
+        keys, key_of = reminder_target_paging(by_user)
+        async for rows in self.iter_keyset(stmt, keys, key_of, chunk_size):
+            yield to_reminder_targets(rows)
 
     async def count_subscribed_users(self, hackathon_id: int) -> int:
         stmt = select(func.count(ReminderSubscriptionORM.id)).where(
@@ -1,13 +1,79 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select, update
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+from sqlalchemy import Select, and_, cast, false, func, null, or_, select, true, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....domain.models import User
+from ....domain.models import User, UserRole
+from ....use_cases.dto import AudienceSegmentDTO, RecipientBatch
 from ....use_cases.ports import UserRepository
-from ..models import UserORM
+from ..models import HackathonORM, ReminderSubscriptionORM, UserORM
 from ..repositories_base import SQLAlchemyRepository
-from .mappers import to_dataclass
+from .mappers import RowMapper, to_dataclass, to_utc_naive
+
+_COLUMNS = tuple(UserORM.__table__.c)
+_to_user = RowMapper(User, _COLUMNS)
+
+
+def hackathon_stats_select() -> Select:
+    """
+    Фактические счётчики /admin_stats по хакатонам (колонки HackathonStatsDTO) для сверки
+    hackathon_counters одним GROUP BY:
+    пользователи по текущему хакатону и включённые подписки — в один поток строк,
+    дальше count(*) FILTER (WHERE ...)
+    """
+    users = select(
+        UserORM.current_hackathon_id.label("hackathon_id"),
+        UserORM.role.label("role"),
+        false().label("subscribed"),
+    )
+    subscriptions = select(
+        ReminderSubscriptionORM.hackathon_id, cast(null(), UserORM.role.type), true()
+    ).where(
+        ReminderSubscriptionORM.enabled == True,  # noqa: E712
+    )
+    rows = union_all(users, subscriptions).subquery()
+
+    return (
+        select(
+            rows.c.hackathon_id,
+            HackathonORM.code,
+            HackathonORM.name,
+            func.count().filter(rows.c.subscribed.is_(False)).label("total_users"),
+            func.count().filter(rows.c.role == UserRole.PARTICIPANT).label("participants"),
+            func.count().filter(rows.c.role == UserRole.ORGANIZER).label("organizers"),
+            func.count().filter(rows.c.subscribed.is_(True)).label("subscribed_users"),
+        )
+        .outerjoin(HackathonORM, HackathonORM.id == rows.c.hackathon_id)
+        .group_by(rows.c.hackathon_id, HackathonORM.code, HackathonORM.name)
+        .order_by(rows.c.hackathon_id)
+    )
+
+
+def audience_select(hackathon_id: int, segment: AudienceSegmentDTO) -> Select:
+    """(user_id, telegram_id) получателей рассылки по хакатону с фильтрами сегмента"""
+    stmt = select(UserORM.id, UserORM.telegram_id).where(
+        UserORM.current_hackathon_id == hackathon_id
+    )
+    if segment.role is not None:
+        stmt = stmt.where(UserORM.role == segment.role)
+    if segment.joined_after is not None:
+        stmt = stmt.where(UserORM.created_at > to_utc_naive(segment.joined_after))
+    if segment.reachable_only:
+        stmt = stmt.where(UserORM.unreachable_since.is_(None))
+    if segment.subscribed_only:
+        # uq_user_hackathon: не больше одной подписки, JOIN не размножает строки
+        stmt = stmt.join(
+            ReminderSubscriptionORM,
+            and_(
+                ReminderSubscriptionORM.user_id == UserORM.id,
+                ReminderSubscriptionORM.hackathon_id == hackathon_id,
+                ReminderSubscriptionORM.enabled == True,  # noqa: E712
+            ),
+        )
+    return stmt
 
 
 class UserRepo(SQLAlchemyRepository, UserRepository):
@@ -15,11 +81,14 @@ class UserRepo(SQLAlchemyRepository, UserRepository):
         super().__init__(session)
 
     async def get_by_telegram_id(self, telegram_id: int) -> User | None:
-        stmt = select(UserORM).where(UserORM.telegram_id == telegram_id)
-        orm_obj = (await self.session.execute(stmt)).scalars().first()
-        if orm_obj is None:
-            return None
-        return to_dataclass(User, orm_obj.__dict__)
+        user = self.identity_map.get(User, "telegram_id", telegram_id)
+        if user is not self.identity_map.MISSING:
+            return user
+        stmt = select(*_COLUMNS).where(UserORM.telegram_id == telegram_id)
+        row = (await self.session.execute(stmt)).first()
+        user = None if row is None else _to_user(row)
+        self.identity_map.put(User, "telegram_id", telegram_id, user)
+        return user
 
     async def save(self, user: User) -> User:
         # upsert по id (если есть) иначе insert
@@ -31,11 +100,13 @@ class UserRepo(SQLAlchemyRepository, UserRepository):
                 last_name=getattr(user, "last_name", "") or "",
                 role=user.role,
                 current_hackathon_id=getattr(user, "current_hackathon_id", None),
+                unreachable_since=user.unreachable_since,
             )
             self.session.add(orm_obj)
-            await self.session.commit()
-            await self.session.refresh(orm_obj)
-            return to_dataclass(User, orm_obj.__dict__)
+            await self.session.flush()
+            saved = to_dataclass(User, orm_obj.__dict__)
+            self.identity_map.put(User, "telegram_id", saved.telegram_id, saved)
+            return saved
 
         # update existing
         stmt = (
@@ -47,10 +118,45 @@ class UserRepo(SQLAlchemyRepository, UserRepository):
                 last_name=getattr(user, "last_name", "") or "",
                 role=user.role,
                 current_hackathon_id=getattr(user, "current_hackathon_id", None),
+                unreachable_since=user.unreachable_since,
             )
         )
         await self.session.execute(stmt)
-        await self.session.commit()
+        self.identity_map.put(User, "telegram_id", user.telegram_id, user)
+        return user
+
+    async def upsert_profile(
+        self, telegram_id: int, username: str, first_name: str, last_name: str
+    ) -> User:
+        profile = {
+            "username": username or "",
+            "first_name": first_name or "",
+            "last_name": last_name or "",
+        }
+        insert_stmt = self.upsert_insert(UserORM).values(
+            telegram_id=telegram_id, role=UserRole.PARTICIPANT, **profile
+        )
+        table = UserORM.__table__
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["telegram_id"],
+            # пишущий пользователь снова доступен
+            set_={**{k: insert_stmt.excluded[k] for k in profile}, "unreachable_since": None},
+            # без изменений строка не обновляется: ни записи, ни новой версии строки
+            where=or_(
+                *(table.c[k].is_distinct_from(insert_stmt.excluded[k]) for k in profile),
+                table.c.unreachable_since.is_not(None),
+            ),
+        ).returning(*_COLUMNS)
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            # конфликт без изменений: RETURNING пуст, берём строку как есть
+            row = (
+                await self.session.execute(
+                    select(*_COLUMNS).where(UserORM.telegram_id == telegram_id)
+                )
+            ).one()
+        user = _to_user(row)
+        self.identity_map.put(User, "telegram_id", telegram_id, user)
         return user
 
     async def update_current_hackathon(self, user_id: int, hackathon_id: int) -> None:
@@ -58,7 +164,19 @@ class UserRepo(SQLAlchemyRepository, UserRepository):
             update(UserORM).where(UserORM.id == user_id).values(current_hackathon_id=hackathon_id)
         )
         await self.session.execute(stmt)
-        await self.session.commit()
+        self.identity_map.evict(User)
+
+    async def mark_unreachable(self, telegram_ids: list[int]) -> None:
+        if not telegram_ids:
+            return
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = (
+            update(UserORM)
+            .where(UserORM.telegram_id.in_(telegram_ids), UserORM.unreachable_since.is_(None))
+            .values(unreachable_since=now)
+        )
+        await self.session.execute(stmt)
+        self.identity_map.evict(User)
 
     # --- методы для админки
     async def count_all(self) -> int:
@@ -70,11 +188,16 @@ class UserRepo(SQLAlchemyRepository, UserRepository):
         return int((await self.session.execute(stmt)).scalar_one())
 
     async def get_all(self) -> list[User]:
-        stmt = select(UserORM)
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(User, o.__dict__) for o in items]
-
-    async def get_by_hackathon(self, hackathon_id: int) -> list[User]:
-        stmt = select(UserORM).where(UserORM.current_hackathon_id == hackathon_id)
-        items = (await self.session.execute(stmt)).scalars().all()
-        return [to_dataclass(User, o.__dict__) for o in items]
+        stmt = select(*_COLUMNS)
+        return _to_user.all(await self.session.execute(stmt))
+
+    async def get_audience(self, hackathon_id: int, segment: AudienceSegmentDTO) -> RecipientBatch:
+        stmt = audience_select(hackathon_id, segment).order_by(UserORM.id)
+        return RecipientBatch.from_pairs(await self.session.execute(stmt))
+
+    async def iter_audience(
+        self, hackathon_id: int, segment: AudienceSegmentDTO, chunk_size: int = 1000
+    ) -> AsyncIterator[RecipientBatch]:
+        stmt = audience_select(hackathon_id, segment)
+        async for rows in self.iter_keyset(stmt, [UserORM.id], lambda row: (row.id,), chunk_size):
+            yield RecipientBatch.from_pairs(rows)
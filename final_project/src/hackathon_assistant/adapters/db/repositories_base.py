@@ -1,8 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable, Hashable, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select, insert, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+class IdentityMap:
+    """
+    Per-session map of already loaded rows: (model, lookup, value) -> dataclass.
+
+    One bot update runs several use cases on the same session, and most of them
+    start by loading the same user (and hackathon). Repositories consult the map
+    before querying and keep it current on their own writes, so repeated lookups
+    within one session are served from memory. Misses (None) are remembered too.
+
+    It lives in session.info, so its lifetime is exactly the session's.
+    """
+
+    MISSING: Any = object()
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[type, str, Hashable], Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, model: type, lookup: str, value: Hashable) -> Any:
+        """Remembered object (or None), or IdentityMap.MISSING."""
+        return self._objects.get((model, lookup, value), self.MISSING)
+
+    def put(self, model: type, lookup: str, value: Hashable, obj: Any) -> None:
+        self._objects[(model, lookup, value)] = obj
+
+    def evict(self, model: type) -> None:
+        """Forget every object of model (after a bulk UPDATE)."""
+        for key in [k for k in self._objects if k[0] is model]:
+            del self._objects[key]
+
+
+def identity_map(session: AsyncSession) -> IdentityMap:
+    """IdentityMap bound to session, created on first use."""
+    return session.info.setdefault("identity_map", IdentityMap())
+
+
 class SQLAlchemyRepository:
     """
     Base class for SQLAlchemy repositories (adapters layer).
@@ -14,3 +57,64 @@ class SQLAlchemyRepository:
     @property
     def session(self) -> AsyncSession:
         return self._session
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        return identity_map(self._session)
+
+    @property
+    def dialect_name(self) -> str:
+        """Dialect of the bound engine ("postgresql", "sqlite", ...)."""
+        return self._session.get_bind().dialect.name
+
+    def upsert_insert(self, model: Any) -> Any:
+        """
+        Dialect-specific INSERT that supports ON CONFLICT (PostgreSQL and SQLite).
+        """
+        if self.dialect_name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
+    async def insert_returning_ids(
+        self, model: Any, rows: list[dict[str, Any]], chunk_size: int = 1000
+    ) -> list[int]:
+        """
+        INSERT rows as executemany batches of chunk_size and return their new ids.
+
+        SQLAlchemy turns each batch into multi-row INSERT ... RETURNING statements
+        ("insertmanyvalues"), and sort_by_parameter_order keeps the ids in the
+        order of rows.
+        """
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        ids: list[int] = []
+        for start in range(0, len(rows), chunk_size):
+            result = await self.session.execute(stmt, rows[start : start + chunk_size])
+            ids.extend(result.scalars().all())
+        return ids
+
+    async def iter_keyset(
+        self,
+        stmt: Select,
+        keys: Sequence[ColumnElement],
+        key_of: Callable[[Row], tuple],
+        chunk_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yield the rows of stmt in chunks of chunk_size, ordered by keys.
+
+        Each chunk is a separate short query continuing after the last key seen
+        (keyset pagination), so no cursor or transaction stays open between chunks
+        and the caller may commit while iterating.
+        """
+        last: tuple | None = None
+        while True:
+            page = stmt.order_by(None).order_by(*keys).limit(chunk_size)
+            if last is not None:
+                page = page.where(tuple_(*keys) > tuple_(*last))
+            rows = (await self.session.execute(page)).all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last = key_of(rows[-1])
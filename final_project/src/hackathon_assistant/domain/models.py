@@ -19,6 +19,13 @@ class EventType(StrEnum):
     OTHER = "other"
 
 
+class DeliveryStatus(StrEnum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    SENT = "sent"
+    FAILED = "failed"
+
+
 def _enum_values(enum_cls: type[Enum]) -> str:
     return ", ".join([e.value for e in enum_cls])  # type: ignore[attr-defined]
 
@@ -33,7 +40,7 @@ def _require_positive_int(value: Any, message: str) -> None:
         raise ValueError(message)
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     telegram_id: int
     username: str = ""
@@ -42,6 +49,10 @@ class User:
     role: UserRole = UserRole.PARTICIPANT
     current_hackathon_id: int | None = None
     id: int | None = None
+    # когда Telegram ответил, что чат недоступен (бот заблокирован, чат удалён)
+    unreachable_since: datetime | None = None
+    # когда пользователь впервые написал боту (None — зарегистрирован до учёта)
+    created_at: datetime | None = None
 
     def __post_init__(self) -> None:
         _require_positive_int(self.telegram_id, "telegram_id должен быть положительным числом")
@@ -53,7 +64,7 @@ class User:
         return self.role == UserRole.ORGANIZER
 
 
-@dataclass
+@dataclass(slots=True)
 class Hackathon:
     code: str
     name: str
@@ -63,6 +74,8 @@ class Hackathon:
     is_active: bool = True
     id: int | None = None
     location: str | None = None
+    # растёт при каждом изменении расписания, правил или FAQ
+    content_version: int = 0
 
     def __post_init__(self) -> None:
         _require_non_empty(self.code, "Код хакатона не может быть пустым")
@@ -75,7 +88,7 @@ class Hackathon:
             raise ValueError("Дата начала должна быть раньше даты окончания")
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     hackathon_id: int
     title: str
@@ -110,7 +123,7 @@ class Event:
             raise ValueError("Начало события должно быть раньше окончания")
 
 
-@dataclass
+@dataclass(slots=True)
 class FAQItem:
     hackathon_id: int
     question: str
@@ -123,7 +136,7 @@ class FAQItem:
         _require_non_empty(self.answer, "Ответ не может быть пустым")
 
 
-@dataclass
+@dataclass(slots=True)
 class Rules:
     hackathon_id: int
     content: str
@@ -134,7 +147,7 @@ class Rules:
         _require_non_empty(self.content, "Текст правил не может быть пустым")
 
 
-@dataclass
+@dataclass(slots=True)
 class ReminderSubscription:
     user_id: int
     hackathon_id: int
@@ -144,3 +157,37 @@ class ReminderSubscription:
     def __post_init__(self) -> None:
         _require_positive_int(self.user_id, "ID пользователя должен быть положительным числом")
         _require_positive_int(self.hackathon_id, "ID хакатона должен быть положительным числом")
+
+
+@dataclass(slots=True)
+class SentReminder:
+    event_id: int
+    user_id: int
+    offset_minutes: int
+    id: int | None = None
+
+    def __post_init__(self) -> None:
+        _require_positive_int(self.event_id, "ID события должен быть положительным числом")
+        _require_positive_int(self.user_id, "ID пользователя должен быть положительным числом")
+        _require_positive_int(self.offset_minutes, "Смещение напоминания должно быть положительным")
+
+
+@dataclass(slots=True)
+class OutboxMessage:
+    message_key: str
+    telegram_id: int
+    text: str
+    user_id: int | None = None
+    status: DeliveryStatus = DeliveryStatus.PENDING
+    attempts: int = 0
+    id: int | None = None
+
+    def __post_init__(self) -> None:
+        _require_non_empty(self.message_key, "Ключ сообщения не может быть пустым")
+        _require_positive_int(self.telegram_id, "telegram_id должен быть положительным числом")
+        _require_non_empty(self.text, "Текст сообщения не может быть пустым")
+
+        if not isinstance(self.status, DeliveryStatus):
+            raise ValueError(
+                f"Статус доставки должен быть одним из: {_enum_values(DeliveryStatus)}"
+            )
@@ -14,6 +14,7 @@ from hackathon_assistant.infra.db import db_ping, get_session
 from hackathon_assistant.infra.repositories import RepositoryProvider
 from hackathon_assistant.infra.settings import get_settings
 from hackathon_assistant.use_cases.create_hackathon import CreateHackathonFromConfigUseCase
+from hackathon_assistant.use_cases.reconcile_counters import ReconcileCountersUseCase
 
 
 def _parse_dt(value: Any, field_name: str) -> datetime:
@@ -86,6 +87,11 @@ class CLI:
         create.add_argument("--config", type=Path, required=True, help="Path to JSON config file")
         create.set_defaults(_handler=self._cmd_create_hackathon)
 
+        reconcile = sub.add_parser(
+            "reconcile-counters", help="Recount /admin_stats counters and fix drift"
+        )
+        reconcile.set_defaults(_handler=self._cmd_reconcile_counters)
+
         return parser
 
     def run(self, argv: Sequence[str] | None = None) -> int:
@@ -134,10 +140,23 @@ class CLI:
                 rules_repo=repos.rules_repo(),
             )
             result = await use_case.execute(config)
+            # хакатон, расписание, правила и FAQ фиксируются вместе
+            await repos.unit_of_work().commit()
 
         print(f"Created hackathon id={result.id} code={result.code!r} name={result.name!r}")
         return 0
 
+    async def _cmd_reconcile_counters(self, _: argparse.Namespace) -> int:
+        async with get_session() as session:
+            repos = RepositoryProvider(session=session)
+            use_case = ReconcileCountersUseCase(
+                counters_repo=repos.counters_repo(), uow=repos.unit_of_work()
+            )
+            fixed = await use_case.execute()
+
+        print(f"Hackathon counters reconciled, rows corrected: {fixed}")
+        return 0
+
 
 def main(argv: Sequence[str] | None = None) -> int:
     return CLI().run(argv)
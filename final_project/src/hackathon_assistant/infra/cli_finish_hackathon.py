@@ -2,29 +2,50 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
+from ..use_cases.finish_hackathon import FinishHackathonUseCase
 from .db import get_session
-from .usecase_provider import build_use_case_provider
+from .repositories import RepositoryProvider
 
 logger = logging.getLogger(__name__)
 
 
-async def run(hackathon_id: int) -> None:
+async def run(hackathon_id: int, archive: bool = False) -> bool:
+    started = time.perf_counter()
     async with get_session() as session:
-        uc = build_use_case_provider(session)
-        await uc.finish_hackathon.execute(hackathon_id)
+        repos = RepositoryProvider(session=session)
+        use_case = FinishHackathonUseCase(
+            hackathon_repo=repos.hackathon_repo(),
+            subscription_repo=repos.subscription_repo(),
+            archive_repo=repos.archive_repo() if archive else None,
+        )
+        finished = await use_case.execute(hackathon_id)
+        await repos.unit_of_work().commit()
+
+    elapsed = time.perf_counter() - started
+    if finished:
+        logger.info("Hackathon %s finished in %.3f s", hackathon_id, elapsed)
+    else:
+        logger.error("Hackathon %s not found (%.3f s)", hackathon_id, elapsed)
+    return finished
 
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO)
     import sys
 
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    archive = "--archive" in args
+    args = [a for a in args if a != "--archive"]
+    if len(args) != 1:
         raise SystemExit(
-            "Usage: python -m hackathon_assistant.infra.cli_finish_hackathon <hackathon_id>"
+            "Usage: python -m hackathon_assistant.infra.cli_finish_hackathon "
+            "<hackathon_id> [--archive]"
         )
 
-    asyncio.run(run(int(sys.argv[1])))
+    if not asyncio.run(run(int(args[0]), archive=archive)):
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,14 @@ import logging
 
 from aiogram import Bot, Dispatcher
 
+from ..adapters.bot.broadcast import BroadcastDispatcher
+from ..adapters.bot.delivery import DeliveryWorker
 from ..adapters.bot.middlewares.usecases import UseCasesMiddleware
 from ..adapters.bot.routers import setup_routers
+from ..adapters.bot.webhook import run_webhook
+from ..adapters.db.repositories import ContentCache
 from .db import db_ping, get_session
+from .repositories import RepositoryProvider
 from .settings import get_settings
 from .usecase_provider import build_use_case_provider
 
@@ -26,8 +31,54 @@ async def main() -> None:
     bot = Bot(token=settings.bot_token)
     dp = Dispatcher()
 
+    async def mark_unreachable(telegram_ids: list[int]) -> None:
+        async with get_session() as session:
+            repos = RepositoryProvider(session=session)
+            await repos.user_repo().mark_unreachable(telegram_ids)
+            await repos.unit_of_work().commit()
+
+    broadcast_dispatcher = BroadcastDispatcher(
+        bot,
+        rate_per_second=settings.broadcast_rate_per_second,
+        per_chat_interval=settings.broadcast_per_chat_interval_seconds,
+        max_concurrency=settings.broadcast_max_concurrency,
+        on_unreachable=mark_unreachable,
+    )
+    dp["broadcast_dispatcher"] = broadcast_dispatcher
+
+    delivery_worker = None
+    if settings.delivery_outbox_enabled:
+        delivery_worker = DeliveryWorker(
+            broadcast_dispatcher,
+            session_cm_factory=get_session,
+            repo_factory=lambda session: RepositoryProvider(session=session).outbox_repo(),
+            batch_size=settings.delivery_batch_size,
+            lease_seconds=settings.delivery_lease_seconds,
+            max_attempts=settings.delivery_max_attempts,
+            retry_base_seconds=settings.delivery_retry_base_seconds,
+            retention_hours=settings.delivery_retention_hours,
+        )
+        delivery_worker.start(workers=settings.delivery_workers)
+        dp["delivery_worker"] = delivery_worker
+
+    content_cache = None
+    if settings.content_cache_enabled:
+        content_cache = ContentCache(
+            max_entries=settings.content_cache_max_entries,
+            ttl_seconds=settings.content_cache_ttl_seconds,
+        )
+
+        dp["rendered_cache"] = content_cache
+
+    reminder_service = None
+
     def provider_factory(session):
-        return build_use_case_provider(session=session, bot=bot)
+        return build_use_case_provider(
+            session=session,
+            bot=bot,
+            event_listener=reminder_service,
+            content_cache=content_cache,
+        )
 
     dp.update.outer_middleware(
         UseCasesMiddleware(
@@ -39,7 +90,21 @@ async def main() -> None:
 
     setup_routers(dp)
 
-    reminder_service = None
+    async def reconcile_counters_periodically(interval_minutes: int) -> None:
+        while True:
+            try:
+                async with get_session() as session:
+                    await provider_factory(session).reconcile_counters.execute()
+            except Exception as e:
+                logger.error("Counters reconciliation failed: %s", e)
+            await asyncio.sleep(interval_minutes * 60)
+
+    reconcile_task = None
+    if settings.counters_reconcile_minutes > 0:
+        reconcile_task = asyncio.create_task(
+            reconcile_counters_periodically(settings.counters_reconcile_minutes)
+        )
+
     try:
         from ..adapters.bot.reminders import ReminderService
 
@@ -52,9 +117,16 @@ async def main() -> None:
         try:
             from ..adapters.bot.reminders import ReminderService
 
-            reminder_service = ReminderService(bot, provider_factory)
+            reminder_service = ReminderService(
+                bot, provider_factory, delivery_worker, digest=settings.reminder_digest_enabled
+            )
 
-            if settings.reminders_enabled:
+            if settings.reminders_enabled and settings.reminder_scheduler_enabled:
+                await reminder_service.start_scheduled_reminders(
+                    lookahead_hours=settings.reminder_lookahead_hours,
+                    resync_minutes=settings.reminder_resync_minutes,
+                )
+            elif settings.reminders_enabled:
                 await reminder_service.start_periodic_reminders(
                     interval_minutes=settings.reminder_interval_minutes
                 )
@@ -64,13 +136,38 @@ async def main() -> None:
             logger.error(f"Failed to start reminder service: {e}")
             reminder_service = None
 
-    logger.info("Starting bot polling...")
     try:
-        await dp.start_polling(bot)
+        if settings.bot_mode == "webhook":
+            logger.info("Starting bot webhook...")
+            await run_webhook(
+                dp,
+                bot,
+                url=settings.webhook_base_url,
+                path=settings.webhook_path,
+                host=settings.webhook_host,
+                port=settings.webhook_port,
+                max_connections=settings.webhook_max_connections,
+                max_in_flight=settings.webhook_max_in_flight,
+                queue_size=settings.webhook_queue_size,
+                enqueue_timeout=settings.webhook_enqueue_timeout_seconds,
+                secret_token=settings.webhook_secret or None,
+            )
+        else:
+            logger.info("Starting bot polling...")
+            # после webhook-режима getUpdates не работает, пока webhook не снят
+            await bot.delete_webhook()
+            await dp.start_polling(bot)
     finally:
+        if reconcile_task is not None:
+            reconcile_task.cancel()
+        if delivery_worker:
+            await delivery_worker.stop()
+        await broadcast_dispatcher.shutdown()
         if reminder_service:
             await reminder_service.stop_periodic_reminders()
             logger.info("Reminder service stopped")
+        if content_cache is not None:
+            logger.info("Content cache stats: %s", content_cache.stats())
 
 
 if __name__ == "__main__":
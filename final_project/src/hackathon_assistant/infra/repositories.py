@@ -1,45 +1,117 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..adapters.db.repositories import (
+    ArchiveRepo,
+    CachedEventRepo,
+    CachedFAQRepo,
+    CachedRulesRepo,
+    ContentCache,
     EventRepo,
     FAQRepo,
+    HackathonCountersRepo,
     HackathonRepo,
+    OutboxRepo,
     RulesRepo,
+    SentReminderRepo,
     SubscriptionRepo,
     UserRepo,
 )
 from ..use_cases.ports import (
+    ArchiveRepository,
     EventRepository,
+    EventScheduleListener,
     FAQRepository,
+    HackathonCountersRepository,
     HackathonRepository,
+    OutboxRepository,
     RulesRepository,
+    SentReminderRepository,
     SubscriptionRepository,
+    UnitOfWork,
     UserRepository,
 )
 
 
+@dataclass(frozen=True)
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """UnitOfWork over the session shared by all repositories of a provider."""
+
+    session: AsyncSession
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+
 @dataclass(frozen=True)
 class RepositoryProvider:
     session: AsyncSession
+    event_listener: EventScheduleListener | None = None
+    content_cache: ContentCache | None = None
+    # repositories are stateless apart from the session, so one of each is enough
+    _built: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _once(self, name: str, build: Callable[[], Any]) -> Any:
+        repo = self._built.get(name)
+        if repo is None:
+            repo = self._built[name] = build()
+        return repo
+
+    def unit_of_work(self) -> UnitOfWork:
+        return self._once("uow", lambda: SQLAlchemyUnitOfWork(self.session))
 
     def user_repo(self) -> UserRepository:
-        return UserRepo(self.session)
+        return self._once("user", lambda: UserRepo(self.session))
 
     def hackathon_repo(self) -> HackathonRepository:
-        return HackathonRepo(self.session)
+        return self._once("hackathon", lambda: HackathonRepo(self.session))
 
     def event_repo(self) -> EventRepository:
-        return EventRepo(self.session)
+        return self._once("event", self._build_event_repo)
 
     def rules_repo(self) -> RulesRepository:
-        return RulesRepo(self.session)
+        return self._once("rules", self._build_rules_repo)
 
     def faq_repo(self) -> FAQRepository:
-        return FAQRepo(self.session)
+        return self._once("faq", self._build_faq_repo)
 
     def subscription_repo(self) -> SubscriptionRepository:
-        return SubscriptionRepo(self.session)
+        return self._once("subscription", lambda: SubscriptionRepo(self.session))
+
+    def outbox_repo(self) -> OutboxRepository:
+        return self._once("outbox", lambda: OutboxRepo(self.session))
+
+    def sent_reminder_repo(self) -> SentReminderRepository:
+        return self._once("sent_reminder", lambda: SentReminderRepo(self.session))
+
+    def archive_repo(self) -> ArchiveRepository:
+        return self._once("archive", lambda: ArchiveRepo(self.session))
+
+    def counters_repo(self) -> HackathonCountersRepository:
+        return self._once("counters", lambda: HackathonCountersRepo(self.session))
+
+    def _build_event_repo(self) -> EventRepository:
+        repo = EventRepo(self.session, listener=self.event_listener)
+        if self.content_cache is not None:
+            return CachedEventRepo(repo, self.content_cache, self.session)
+        return repo
+
+    def _build_rules_repo(self) -> RulesRepository:
+        repo = RulesRepo(self.session)
+        if self.content_cache is not None:
+            return CachedRulesRepo(repo, self.content_cache, self.session)
+        return repo
+
+    def _build_faq_repo(self) -> FAQRepository:
+        repo = FAQRepo(self.session)
+        if self.content_cache is not None:
+            return CachedFAQRepo(repo, self.content_cache, self.session)
+        return repo
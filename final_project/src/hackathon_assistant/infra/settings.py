@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -35,6 +35,54 @@ class Settings(BaseSettings):
 
     reminders_enabled: bool = True
     reminder_interval_minutes: int = 5
+    reminder_scheduler_enabled: bool = True
+    reminder_lookahead_hours: int = 24
+    # события из CLI и поздние подписки режим расписания видит только при перечитывании
+    reminder_resync_minutes: int = 30
+    # одно сообщение на пользователя со всеми его событиями тика
+    reminder_digest_enabled: bool = True
+
+    content_cache_enabled: bool = True
+    content_cache_max_entries: int = 1024
+    content_cache_ttl_seconds: float = 300.0
+
+    broadcast_rate_per_second: float = 30.0
+    broadcast_per_chat_interval_seconds: float = 1.0
+    broadcast_max_concurrency: int = 20
+
+    delivery_outbox_enabled: bool = True
+    # корутины одного процесса; отправляет один процесс бота (аренда в delivery_sender_lease)
+    delivery_workers: int = 1
+    delivery_batch_size: int = 200
+    delivery_lease_seconds: int = 300
+    # временные ошибки (сеть, 5xx, таймаут) повторяются с паузой base * 2**(попытка - 1)
+    delivery_max_attempts: int = 5
+    delivery_retry_base_seconds: float = 30.0
+    # доставленные и недоставленные строки очереди старше этого удаляются; 0 — хранить
+    delivery_retention_hours: float = 72.0
+
+    # сверка hackathon_counters с таблицами; 0 — не запускать в процессе бота
+    counters_reconcile_minutes: int = 60
+
+    # polling — getUpdates; webhook — aiohttp-сервер, Telegram сам присылает апдейты
+    bot_mode: Literal["polling", "webhook"] = "polling"
+    webhook_base_url: str = ""
+    webhook_path: str = "/webhook"
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8080
+    webhook_secret: str = ""
+    webhook_max_in_flight: int = 20
+    webhook_queue_size: int = 1000
+    webhook_enqueue_timeout_seconds: float = 5.0
+    webhook_max_connections: int = 40
+
+    @model_validator(mode="after")
+    def _require_webhook_url(self) -> Settings:
+        # Telegram принимает webhook только по HTTPS; без адреса set_webhook получит
+        # один путь и бот упадёт уже при запуске
+        if self.bot_mode == "webhook" and not self.webhook_base_url.startswith("https://"):
+            raise ValueError("BOT_MODE=webhook requires WEBHOOK_BASE_URL starting with https://")
+        return self
 
     model_config = SettingsConfigDict(
         env_file=_PROJECT_ROOT / ".env",
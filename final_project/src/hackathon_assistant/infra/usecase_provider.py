@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from aiogram import Bot
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..adapters.db.repositories import ContentCache
+from ..use_cases.enqueue_broadcast import EnqueueBroadcastUseCase
 from ..use_cases.get_admin_stats import GetAdminStatsUseCase
 from ..use_cases.get_faq import GetFAQUseCase
 from ..use_cases.get_hackathon_info import GetHackathonInfoUseCase
@@ -13,6 +16,9 @@ from ..use_cases.get_schedule import GetScheduleUseCase
 from ..use_cases.get_upcoming_events import GetUpcomingEventsUseCase
 from ..use_cases.list_hackathons import ListHackathonsUseCase
 from ..use_cases.notifications import SubscribeNotificationsUseCase, UnsubscribeNotificationsUseCase
+from ..use_cases.ports import EventScheduleListener, UnitOfWork
+from ..use_cases.process_reminder import ProcessRemindersUseCase
+from ..use_cases.reconcile_counters import ReconcileCountersUseCase
 from ..use_cases.select_hackathon import SelectHackathonByCodeUseCase
 from ..use_cases.send_broadcast import SendBroadcastUseCase
 from ..use_cases.send_reminder import SendRemindersUseCase
@@ -22,73 +28,129 @@ from .repositories import RepositoryProvider
 
 @dataclass(frozen=True)
 class UseCaseProvider:
-    """Container with ready-to-use participant use cases."""
-
-    start_user: StartUserUseCase
-    select_hackathon_by_code: SelectHackathonByCodeUseCase
-    get_schedule: GetScheduleUseCase
-    get_rules: GetRulesUseCase
-    get_faq: GetFAQUseCase
-    subscribe_notifications: SubscribeNotificationsUseCase
-    unsubscribe_notifications: UnsubscribeNotificationsUseCase
-    list_hackathons: ListHackathonsUseCase
-    get_hackathon_info: GetHackathonInfoUseCase
-    get_upcoming_events: GetUpcomingEventsUseCase
-    get_admin_stats: GetAdminStatsUseCase
-    send_broadcast: SendBroadcastUseCase
-    send_reminders: SendRemindersUseCase
+    """
+    Container with ready-to-use participant use cases.
+
+    A provider is built for every update, but most updates (/help, callbacks,
+    plain messages) use one use case or none, so each use case is created on
+    first access and its repositories are taken from the shared RepositoryProvider.
+    """
+
+    repos: RepositoryProvider
+    bot: Bot | None = None
+
+    @cached_property
+    def uow(self) -> UnitOfWork:
+        return self.repos.unit_of_work()
+
+    @cached_property
+    def start_user(self) -> StartUserUseCase:
+        return StartUserUseCase(user_repo=self.repos.user_repo(), uow=self.uow)
+
+    @cached_property
+    def select_hackathon_by_code(self) -> SelectHackathonByCodeUseCase:
+        return SelectHackathonByCodeUseCase(
+            user_repo=self.repos.user_repo(),
+            hackathon_repo=self.repos.hackathon_repo(),
+            uow=self.uow,
+        )
+
+    @cached_property
+    def get_schedule(self) -> GetScheduleUseCase:
+        return GetScheduleUseCase(
+            user_repo=self.repos.user_repo(),
+            event_repo=self.repos.event_repo(),
+        )
+
+    @cached_property
+    def get_rules(self) -> GetRulesUseCase:
+        return GetRulesUseCase(
+            user_repo=self.repos.user_repo(),
+            rules_repo=self.repos.rules_repo(),
+        )
+
+    @cached_property
+    def get_faq(self) -> GetFAQUseCase:
+        return GetFAQUseCase(
+            user_repo=self.repos.user_repo(),
+            faq_repo=self.repos.faq_repo(),
+        )
+
+    @cached_property
+    def subscribe_notifications(self) -> SubscribeNotificationsUseCase:
+        return SubscribeNotificationsUseCase(
+            subscription_repo=self.repos.subscription_repo(), uow=self.uow
+        )
+
+    @cached_property
+    def unsubscribe_notifications(self) -> UnsubscribeNotificationsUseCase:
+        return UnsubscribeNotificationsUseCase(
+            subscription_repo=self.repos.subscription_repo(), uow=self.uow
+        )
+
+    @cached_property
+    def list_hackathons(self) -> ListHackathonsUseCase:
+        return ListHackathonsUseCase(hackathon_repo=self.repos.hackathon_repo())
+
+    @cached_property
+    def get_hackathon_info(self) -> GetHackathonInfoUseCase:
+        return GetHackathonInfoUseCase(
+            user_repo=self.repos.user_repo(),
+            hackathon_repo=self.repos.hackathon_repo(),
+            subscription_repo=self.repos.subscription_repo(),
+        )
+
+    @cached_property
+    def get_upcoming_events(self) -> GetUpcomingEventsUseCase:
+        return GetUpcomingEventsUseCase(event_repo=self.repos.event_repo())
+
+    @cached_property
+    def process_reminders(self) -> ProcessRemindersUseCase:
+        return ProcessRemindersUseCase(
+            event_repo=self.repos.event_repo(),
+            subscription_repo=self.repos.subscription_repo(),
+            sent_reminder_repo=self.repos.sent_reminder_repo(),
+        )
+
+    @cached_property
+    def get_admin_stats(self) -> GetAdminStatsUseCase:
+        return GetAdminStatsUseCase(
+            counters_repo=self.repos.counters_repo(),
+            hackathon_repo=self.repos.hackathon_repo(),
+        )
+
+    @cached_property
+    def reconcile_counters(self) -> ReconcileCountersUseCase:
+        return ReconcileCountersUseCase(counters_repo=self.repos.counters_repo(), uow=self.uow)
+
+    @cached_property
+    def send_broadcast(self) -> SendBroadcastUseCase:
+        return SendBroadcastUseCase(user_repo=self.repos.user_repo())
+
+    @cached_property
+    def enqueue_broadcast(self) -> EnqueueBroadcastUseCase:
+        return EnqueueBroadcastUseCase(
+            user_repo=self.repos.user_repo(),
+            outbox_repo=self.repos.outbox_repo(),
+            uow=self.uow,
+        )
+
+    @cached_property
+    def send_reminders(self) -> SendRemindersUseCase:
+        return SendRemindersUseCase(bot=self.bot, user_repo=self.repos.user_repo(), uow=self.uow)
 
     async def get_user_by_telegram_id(self, telegram_id: int):
         """Получить пользователя по Telegram ID"""
         return await self.start_user.user_repo.get_by_telegram_id(telegram_id)
 
 
-def build_use_case_provider(session: AsyncSession, bot: Bot) -> UseCaseProvider:
-    repos = RepositoryProvider(session=session)
-
-    return UseCaseProvider(
-        start_user=StartUserUseCase(user_repo=repos.user_repo()),
-        select_hackathon_by_code=SelectHackathonByCodeUseCase(
-            user_repo=repos.user_repo(),
-            hackathon_repo=repos.hackathon_repo(),
-        ),
-        get_schedule=GetScheduleUseCase(
-            user_repo=repos.user_repo(),
-            event_repo=repos.event_repo(),
-        ),
-        get_rules=GetRulesUseCase(
-            user_repo=repos.user_repo(),
-            rules_repo=repos.rules_repo(),
-        ),
-        get_faq=GetFAQUseCase(
-            user_repo=repos.user_repo(),
-            faq_repo=repos.faq_repo(),
-        ),
-        subscribe_notifications=SubscribeNotificationsUseCase(
-            user_repo=repos.user_repo(),
-            subscription_repo=repos.subscription_repo(),
-        ),
-        unsubscribe_notifications=UnsubscribeNotificationsUseCase(
-            user_repo=repos.user_repo(),
-            subscription_repo=repos.subscription_repo(),
-        ),
-        list_hackathons=ListHackathonsUseCase(
-            hackathon_repo=repos.hackathon_repo(),
-        ),
-        get_hackathon_info=GetHackathonInfoUseCase(
-            user_repo=repos.user_repo(),
-            hackathon_repo=repos.hackathon_repo(),
-            subscription_repo=repos.subscription_repo(),
-        ),
-        get_upcoming_events=GetUpcomingEventsUseCase(event_repo=repos.event_repo()),
-        get_admin_stats=GetAdminStatsUseCase(
-            user_repo=repos.user_repo(),
-            subscription_repo=repos.subscription_repo(),
-            hackathon_repo=repos.hackathon_repo(),
-        ),
-        send_broadcast=SendBroadcastUseCase(
-            user_repo=repos.user_repo(),
-            subscription_repo=repos.subscription_repo(),
-        ),
-        send_reminders=SendRemindersUseCase(bot=bot),
+def build_use_case_provider(
+    session: AsyncSession,
+    bot: Bot,
+    event_listener: EventScheduleListener | None = None,
+    content_cache: ContentCache | None = None,
+) -> UseCaseProvider:
+    repos = RepositoryProvider(
+        session=session, event_listener=event_listener, content_cache=content_cache
     )
+    return UseCaseProvider(repos=repos, bot=bot)
@@ -7,6 +7,7 @@ from .get_rules import GetRulesUseCase
 from .get_schedule import GetScheduleUseCase
 from .list_hackathons import ListHackathonsUseCase
 from .notifications import SubscribeNotificationsUseCase, UnsubscribeNotificationsUseCase
+from .reconcile_counters import ReconcileCountersUseCase
 from .select_hackathon import SelectHackathonByCodeUseCase
 from .send_admin_broadcast import SendAdminBroadcastUseCase
 from .send_broadcast import SendBroadcastUseCase
@@ -26,6 +27,7 @@ __all__ = [
     "ListHackathonsUseCase",
     "SelectHackathonByCodeUseCase",
     "FinishHackathonUseCase",
+    "ReconcileCountersUseCase",
     "UseCaseError",
     "NotFoundError",
     "ForbiddenError",
@@ -1,6 +1,12 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from ..domain.models import UserRole
+
 
 @dataclass
 class ScheduleItemDTO:
@@ -28,6 +34,19 @@ class FAQItemDTO:
     answer: str
 
 
+@dataclass
+class HackathonStatsDTO:
+    """DTO для статистики по одному хакатону"""
+
+    hackathon_id: int | None
+    code: str | None
+    name: str | None
+    total_users: int
+    participants: int
+    organizers: int
+    subscribed_users: int
+
+
 @dataclass
 class AdminStatsDTO:
     """DTO для статистики администратора"""
@@ -36,6 +55,50 @@ class AdminStatsDTO:
     participants: int
     organizers: int
     subscribed_users: int
+    hackathons: list[HackathonStatsDTO] = field(default_factory=list)
+
+
+@dataclass
+class RecipientBatch:
+    """
+    Получатели напоминания или рассылки: user_id и telegram_id в двух параллельных
+    array('q') — 16 байт на получателя вместо отдельного объекта на каждого
+    """
+
+    user_ids: array = field(default_factory=lambda: array("q"))
+    telegram_ids: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[int, int]]) -> RecipientBatch:
+        """Собрать из пар (user_id, telegram_id)"""
+        batch = cls()
+        for user_id, telegram_id in pairs:
+            batch.append(user_id, telegram_id)
+        return batch
+
+    def append(self, user_id: int, telegram_id: int) -> None:
+        self.user_ids.append(user_id)
+        self.telegram_ids.append(telegram_id)
+
+    def __len__(self) -> int:
+        return len(self.telegram_ids)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Пары (user_id, telegram_id)"""
+        return zip(self.user_ids, self.telegram_ids, strict=True)
+
+
+@dataclass
+class AudienceSegmentDTO:
+    """
+    Кому уходит рассылка по хакатону; фильтры применяются в SQL
+    По умолчанию — подписанные на напоминания пользователи с доступным чатом
+    """
+
+    role: UserRole | None = None
+    subscribed_only: bool = True
+    joined_after: datetime | None = None
+    reachable_only: bool = True
 
 
 @dataclass
@@ -60,6 +123,7 @@ class HackathonDTO:
     end_at: datetime
     is_active: bool
     location: str | None = None
+    content_version: int = 0
 
 
 @dataclass
@@ -72,6 +136,14 @@ class BroadcastResultDTO:
     success_rate: float
 
 
+@dataclass
+class DeliveryJobDTO:
+    """DTO для рассылки, поставленной в очередь доставки"""
+
+    message_key: str
+    recipients: int
+
+
 @dataclass
 class EventDTO:
     """DTO для события"""
@@ -97,17 +169,9 @@ class ReminderEventDTO:
     starts_at: datetime
 
 
-@dataclass
-class ReminderParticipantDTO:
-    """DTO для напоминания об ивенте конкретному челу"""
-
-    user_id: int
-    telegram_id: int
-
-
 @dataclass
 class ReminderPileDTO:
     """DTO для напоминания об ивенте сразу пачке людей"""
 
     event: ReminderEventDTO
-    participants: list[ReminderParticipantDTO]
+    participants: RecipientBatch
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import uuid4
+
+from ..domain.models import OutboxMessage
+from .dto import AudienceSegmentDTO, DeliveryJobDTO
+from .ports import OutboxRepository, UnitOfWork, UserRepository
+from .send_broadcast import SendBroadcastUseCase
+
+
+@dataclass
+class EnqueueBroadcastUseCase:
+    """Use case для /admin_broadcast через очередь доставки"""
+
+    user_repo: UserRepository
+    outbox_repo: OutboxRepository
+    chunk_size: int = 1000
+    uow: UnitOfWork | None = None
+
+    async def execute(
+        self,
+        hackathon_id: int,
+        message: str,
+        segment: AudienceSegmentDTO | None = None,
+        report_chat_id: int | None = None,
+    ) -> DeliveryJobDTO:
+        """Поставить рассылку в очередь: по строке на каждого получателя
+        На вход
+            hackathon_id: ID хакатона
+            message: текст рассылки
+            segment: кому отправлять (по умолчанию — подписанным с доступным чатом)
+            report_chat_id: куда прислать итог доставки (его отправит воркер доставки)
+        Возвращаем DeliveryJobDTO: ключ рассылки и число получателей
+        """
+        targets = SendBroadcastUseCase(user_repo=self.user_repo)
+        message_key = f"broadcast:{hackathon_id}:{uuid4().hex}"
+        recipients = 0
+        # каждая часть коммитится сразу, и воркер доставки начинает отправку,
+        # не дожидаясь, пока будет прочитан весь список получателей
+        async for chunk in targets.iter_targets(
+            hackathon_id, chunk_size=self.chunk_size, segment=segment
+        ):
+            recipients += await self.outbox_repo.enqueue(
+                [
+                    OutboxMessage(
+                        message_key=message_key,
+                        user_id=user_id,
+                        telegram_id=telegram_id,
+                        text=message,
+                    )
+                    for user_id, telegram_id in chunk
+                ]
+            )
+            if self.uow is not None:
+                await self.uow.commit()
+        # после всех получателей: раньше воркер мог бы счесть пустую очередь завершённой
+        if report_chat_id is not None:
+            await self.outbox_repo.add_report(message_key, report_chat_id)
+            if self.uow is not None:
+                await self.uow.commit()
+        return DeliveryJobDTO(message_key=message_key, recipients=recipients)
@@ -1,12 +1,17 @@
+import logging
 from dataclasses import dataclass
 
-from .ports import HackathonRepository, SubscriptionRepository
+from .ports import ArchiveRepository, HackathonRepository, SubscriptionRepository
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class FinishHackathonUseCase:
     hackathon_repo: HackathonRepository
     subscription_repo: SubscriptionRepository
+    # если задан, события, FAQ и подписки переносятся в архивные таблицы
+    archive_repo: ArchiveRepository | None = None
 
     async def execute(self, hackathon_id: int) -> bool:
         hackathon = await self.hackathon_repo.get_by_id(hackathon_id)
@@ -14,8 +19,10 @@ class FinishHackathonUseCase:
             return False
         hackathon.is_active = False
         await self.hackathon_repo.save(hackathon)
-        subscriptions = await self.subscription_repo.get_by_hackathon(hackathon_id)
-        for subscription in subscriptions:
-            subscription.enabled = False
-            await self.subscription_repo.save(subscription)
+        disabled = await self.subscription_repo.disable_all_for_hackathon(hackathon_id)
+        logger.info("Hackathon %s finished, %s subscriptions disabled", hackathon_id, disabled)
+
+        if self.archive_repo is not None:
+            moved = await self.archive_repo.archive_hackathon(hackathon_id)
+            logger.info("Hackathon %s archived: %s", hackathon_id, moved)
         return True
@@ -1,27 +1,44 @@
 from dataclasses import dataclass
 
-from ..domain.models import UserRole
-from .dto import AdminStatsDTO
-from .ports import HackathonRepository, SubscriptionRepository, UserRepository
+from .dto import AdminStatsDTO, HackathonStatsDTO
+from .ports import HackathonCountersRepository, HackathonRepository
 
 
 @dataclass
 class GetAdminStatsUseCase:
-    user_repo: UserRepository
-    subscription_repo: SubscriptionRepository
+    counters_repo: HackathonCountersRepository
     hackathon_repo: HackathonRepository
 
-    async def execute(self) -> AdminStatsDTO:
-        """Получить общую статистику (по всем хакатонам)"""
-        total_users = await self.user_repo.count_all()
-        users = await self.user_repo.get_all()
-        participants = sum(1 for u in users if u.role == UserRole.PARTICIPANT)
-        organizers = sum(1 for u in users if u.role == UserRole.ORGANIZER)
-        subscribed_users = await self.subscription_repo.count_all_subscribed()
+    async def execute(self, hackathon_code: str | None = None) -> AdminStatsDTO | None:
+        """Получить статистику: по всем хакатонам или по одному (по коду)
+        Возвращаем
+            AdminStatsDTO: итоги и разбивка по хакатонам
+            None: если хакатон с таким кодом не найден
+        """
+        if hackathon_code:
+            hackathon = await self.hackathon_repo.get_by_code(hackathon_code)
+            if hackathon is None:
+                return None
+            row = await self.counters_repo.get_by_hackathon(hackathon.id)
+            if row is None:
+                # в хакатоне ещё никого нет
+                row = HackathonStatsDTO(
+                    hackathon_id=hackathon.id,
+                    code=hackathon.code,
+                    name=hackathon.name,
+                    total_users=0,
+                    participants=0,
+                    organizers=0,
+                    subscribed_users=0,
+                )
+            rows = [row]
+        else:
+            rows = await self.counters_repo.get_all()
 
         return AdminStatsDTO(
-            total_users=total_users,
-            participants=participants,
-            organizers=organizers,
-            subscribed_users=subscribed_users,
+            total_users=sum(r.total_users for r in rows),
+            participants=sum(r.participants for r in rows),
+            organizers=sum(r.organizers for r in rows),
+            subscribed_users=sum(r.subscribed_users for r in rows),
+            hackathons=[r for r in rows if r.hackathon_id is not None],
         )
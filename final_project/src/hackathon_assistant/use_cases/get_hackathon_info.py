@@ -33,6 +33,7 @@ class GetHackathonInfoUseCase:
             end_at=hackathon.end_at,
             is_active=hackathon.is_active,
             location=hackathon.location if hasattr(hackathon, "location") else None,
+            content_version=hackathon.content_version,
         )
 
         return hackathon_dto, is_subscribed
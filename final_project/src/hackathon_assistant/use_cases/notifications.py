@@ -1,55 +1,39 @@
 from dataclasses import dataclass
 
-from ..domain.models import ReminderSubscription
-from .ports import SubscriptionRepository, UserRepository
+from .ports import SubscriptionRepository, UnitOfWork
 
 
 @dataclass
 class SubscribeNotificationsUseCase:
-    user_repo: UserRepository
+    """Подписка фиксируется до ответа (см. StartUserUseCase)"""
+
     subscription_repo: SubscriptionRepository
+    uow: UnitOfWork | None = None
 
     async def execute(self, telegram_id: int) -> bool:
         """Включить напоминания для текущего хакатона пользователя
         На вход telegram_id: ID пользователя в tg
         Возвращаем bool: True если успешно, False если ошибка
         """
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
-        if user is None or user.current_hackathon_id is None:
-            return False
-
-        sub = await self.subscription_repo.get_user_subscription(
-            user_id=user.id, hackathon_id=user.current_hackathon_id
-        )
-        if sub is None:
-            sub = ReminderSubscription(
-                id=None, user_id=user.id, hackathon_id=user.current_hackathon_id, enabled=True
-            )
-        else:
-            sub.enabled = True
-        await self.subscription_repo.save(subscription=sub)
-        return True
+        changed = await self.subscription_repo.set_subscription(telegram_id, enabled=True)
+        if self.uow is not None:
+            await self.uow.commit()
+        return changed
 
 
 @dataclass
 class UnsubscribeNotificationsUseCase:
-    user_repo: UserRepository
+    """Отписка фиксируется до ответа (см. StartUserUseCase)"""
+
     subscription_repo: SubscriptionRepository
+    uow: UnitOfWork | None = None
 
     async def execute(self, telegram_id: int) -> bool:
         """Выключить напоминания для текущего хакатона пользователя
         На вход telegram_id: ID пользователя в tg
         Возвращаем bool: True если успешно, False если ошибка
         """
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
-        if user is None or user.current_hackathon_id is None:
-            return False
-
-        sub = await self.subscription_repo.get_user_subscription(
-            user_id=user.id, hackathon_id=user.current_hackathon_id
-        )
-        if sub is None:
-            return False
-        sub.enabled = False
-        await self.subscription_repo.save(subscription=sub)
-        return True
+        changed = await self.subscription_repo.set_subscription(telegram_id, enabled=False)
+        if self.uow is not None:
+            await self.uow.commit()
+        return changed
@@ -1,7 +1,20 @@
+from collections.abc import AsyncIterator, Collection
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol
 
-from ..domain.models import Event, FAQItem, Hackathon, ReminderSubscription, Rules, User
+from ..domain.models import (
+    DeliveryStatus,
+    Event,
+    FAQItem,
+    Hackathon,
+    OutboxMessage,
+    ReminderSubscription,
+    Rules,
+    SentReminder,
+    User,
+)
+from .dto import AudienceSegmentDTO, HackathonStatsDTO, RecipientBatch
 
 # ========== Репозитории ==========
 
@@ -17,10 +30,25 @@ class UserRepository(Protocol):
         """Сохранить нового пользователя (регистрация в /start)"""
         ...
 
+    async def upsert_profile(
+        self, telegram_id: int, username: str, first_name: str, last_name: str
+    ) -> User:
+        """
+        Зарегистрировать пользователя или обновить имя из Telegram (/start)
+
+        Одним запросом; если профиль не изменился и чат не был отмечен недоступным,
+        запись не выполняется. Роль и текущий хакатон не меняются.
+        """
+        ...
+
     async def update_current_hackathon(self, user_id: int, hackathon_id: int) -> None:
         """Обновить текущий хакатон пользователя (/hackathon)"""
         ...
 
+    async def mark_unreachable(self, telegram_ids: list[int]) -> None:
+        """Отметить, что чаты недоступны (бот заблокирован, чат удалён); снимается в /start"""
+        ...
+
     async def count_all(self) -> int:
         """Подсчитать всех пользователей (/admin_stats)"""
         ...
@@ -33,8 +61,14 @@ class UserRepository(Protocol):
         """Получить всех пользователей"""
         ...
 
-    async def get_by_hackathon(self, hackathon_id: int) -> list[User]:
-        """Получить пользователей по хакатону"""
+    async def get_audience(self, hackathon_id: int, segment: AudienceSegmentDTO) -> RecipientBatch:
+        """Получатели рассылки по хакатону: один запрос, фильтры сегмента в WHERE"""
+        ...
+
+    def iter_audience(
+        self, hackathon_id: int, segment: AudienceSegmentDTO, chunk_size: int = 1000
+    ) -> AsyncIterator[RecipientBatch]:
+        """То же, что get_audience, но частями по chunk_size"""
         ...
 
 
@@ -69,6 +103,10 @@ class EventRepository(Protocol):
         """Получить предстоящие события (для напоминаний)"""
         ...
 
+    async def get_upcoming_for_active(self, hours_ahead: int) -> list[Event]:
+        """Предстоящие события всех активных хакатонов (расписание напоминаний)"""
+        ...
+
     async def save_all(self, events: list[Event]) -> list[Event]: ...
 
 
@@ -101,6 +139,15 @@ class SubscriptionRepository(Protocol):
         """Получить подписку пользователя на хакатон (/notify_on/off)"""
         ...
 
+    async def set_subscription(self, telegram_id: int, enabled: bool) -> bool:
+        """
+        Включить/выключить напоминания по текущему хакатону пользователя (/notify_on/off)
+
+        Одним запросом. False, если пользователь не найден или хакатон не выбран;
+        при выключении — также если подписки не было.
+        """
+        ...
+
     # async def subscribe(self, user_id: int, hackathon_id: int) -> ReminderSubscription:
     #     """Создать/активировать подписку (/notify_on)."""
     #     ...
@@ -110,7 +157,27 @@ class SubscriptionRepository(Protocol):
     #     ... вроде избыточно, но это не точно
 
     async def get_subscribed_users(self, hackathon_id: int) -> list[User]:
-        """Получить подписанных пользователей (для напоминаний)"""
+        """Получить подписанных пользователей с доступным чатом (для напоминаний)"""
+        ...
+
+    async def get_reminder_targets(
+        self, hours_ahead: int, hackathon_ids: Collection[int] | None = None
+    ) -> list[tuple[Event, int, int]]:
+        """(событие, user_id, telegram_id) по всем активным хакатонам одним запросом"""
+        ...
+
+    def iter_reminder_targets(
+        self,
+        hours_ahead: int,
+        hackathon_ids: Collection[int] | None = None,
+        chunk_size: int = 1000,
+        by_user: bool = False,
+    ) -> AsyncIterator[list[tuple[Event, int, int]]]:
+        """
+        То же, что get_reminder_targets, но частями по chunk_size
+
+        by_user=True — в порядке (user_id, starts_at, event_id): события пользователя подряд
+        """
         ...
 
     async def count_subscribed_users(self, hackathon_id: int) -> int:
@@ -129,11 +196,160 @@ class SubscriptionRepository(Protocol):
         """Получить все подписки по хакатону"""
         ...
 
+    async def disable_all_for_hackathon(self, hackathon_id: int) -> int:
+        """Выключить все подписки хакатона одним UPDATE; вернуть число выключенных"""
+        ...
+
+
+class SentReminderRepository(Protocol):
+    """Для сценариев: напоминания (журнал уже отправленных)"""
+
+    async def get_owed(
+        self,
+        hours_ahead: int,
+        offset_minutes: int,
+        hackathon_ids: Collection[int] | None = None,
+    ) -> list[tuple[Event, int, int]]:
+        """Ещё не отправленные напоминания по активным хакатонам: (событие, user_id, telegram_id)"""
+        ...
+
+    def iter_owed(
+        self,
+        hours_ahead: int,
+        offset_minutes: int,
+        hackathon_ids: Collection[int] | None = None,
+        chunk_size: int = 1000,
+        by_user: bool = False,
+    ) -> AsyncIterator[list[tuple[Event, int, int]]]:
+        """
+        То же, что get_owed, но частями по chunk_size
+
+        by_user=True — в порядке (user_id, starts_at, event_id): события пользователя подряд
+        """
+        ...
+
+    async def record(self, reminders: list[SentReminder]) -> int:
+        """Записать напоминания в журнал; уже записанные игнорируются"""
+        ...
+
+
+class ArchiveRepository(Protocol):
+    """Для сценариев: завершение хакатона (перенос данных в архивные таблицы)"""
+
+    async def archive_hackathon(self, hackathon_id: int) -> dict[str, int]:
+        """
+        Перенести события, FAQ и подписки хакатона в архивные таблицы
+
+        Возвращаем число перенесённых строк по таблицам: events, faq_items,
+        reminder_subscriptions
+        """
+        ...
+
+
+class HackathonCountersRepository(Protocol):
+    """Для сценариев: /admin_stats (счётчики, которые БД ведёт при каждой записи)"""
+
+    async def get_by_hackathon(self, hackathon_id: int) -> HackathonStatsDTO | None:
+        """Счётчики хакатона — чтение по префиксу первичного ключа; None, если строк ещё нет"""
+        ...
+
+    async def get_all(self) -> list[HackathonStatsDTO]:
+        """Счётчики всех хакатонов (строка с hackathon_id=None — пользователи без хакатона)"""
+        ...
+
+    async def reconcile(self) -> int:
+        """Пересчитать счётчики по users и reminder_subscriptions; вернуть число исправленных"""
+        ...
+
+
+class OutboxRepository(Protocol):
+    """Для сценариев: /admin_broadcast, напоминания (очередь доставки)"""
+
+    async def enqueue(self, messages: list[OutboxMessage]) -> int:
+        """Поставить сообщения в очередь; повтор (message_key, telegram_id) игнорируется"""
+        ...
+
+    async def claim_batch(self, limit: int, lease_seconds: int) -> list[OutboxMessage]:
+        """Забрать пачку сообщений на отправку (не пересекается с другими воркерами)"""
+        ...
+
+    async def mark_sent(self, ids: list[int]) -> None:
+        """Отметить сообщения доставленными"""
+        ...
+
+    async def mark_failed(self, ids: list[int], error: str) -> None:
+        """Отметить сообщения недоставленными"""
+        ...
+
+    async def retry_later(self, ids: list[int], delay_seconds: float, error: str) -> None:
+        """Вернуть сообщения в очередь: claim_batch выдаст их не раньше чем через delay_seconds"""
+        ...
+
+    async def release(self, ids: list[int]) -> None:
+        """Вернуть забранные, но не отправленные сообщения в очередь без паузы"""
+        ...
+
+    async def extend_lease(self, ids: list[int], lease_seconds: int) -> None:
+        """Продлить аренду забранных сообщений (отправка пачки затянулась)"""
+        ...
+
+    async def delete_finished(self, older_than: datetime, limit: int) -> int:
+        """Удалить до limit доставленных и недоставленных сообщений, созданных до older_than"""
+        ...
+
+    async def count_by_status(self, message_key: str) -> dict[DeliveryStatus, int]:
+        """Прогресс доставки одного сообщения по статусам"""
+        ...
+
+    async def add_report(self, message_key: str, chat_id: int) -> None:
+        """Прислать итог доставки message_key в chat_id, когда очередь по нему опустеет"""
+        ...
+
+    async def take_finished_reports(self) -> list[tuple[str, int]]:
+        """
+        Забрать (message_key, chat_id) рассылок, по которым не осталось сообщений в очереди
+
+        Забранные записи удаляются: итог каждой рассылки отправляется один раз.
+        """
+        ...
+
+    async def acquire_sender_lease(self, holder: str, seconds: int) -> bool:
+        """
+        Взять или продлить аренду отправителя на seconds секунд
+
+        Лимит Telegram общий на бота, поэтому очередь отправляет один процесс.
+        False, если аренду держит другой holder и она ещё не истекла.
+        """
+        ...
+
+    async def release_sender_lease(self, holder: str) -> None:
+        """Отпустить аренду отправителя (при остановке), если её держит holder"""
+        ...
+
 
 class Notifier(Protocol):
     async def send(self, telegram_id: int, text: str) -> None: ...
 
 
+class EventScheduleListener(Protocol):
+    """Получает только что сохранённые события (перепланирование напоминаний)"""
+
+    def events_saved(self, events: list[Event]) -> None: ...
+
+
+class UnitOfWork(Protocol):
+    """
+    Граница транзакции
+
+    Репозитории не коммитят сами (только flush, когда нужны id), поэтому
+    все записи одного обновления или одной части рассылки фиксируются одним commit.
+    """
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
 # ========== Request/Response модели для use cases ==========
 
 
@@ -1,19 +1,29 @@
+from collections.abc import AsyncIterator, Collection
 from dataclasses import dataclass
 
-from .dto import (
-    ReminderEventDTO,
-    ReminderParticipantDTO,
-    ReminderPileDTO,
-)
-from .ports import EventRepository, SubscriptionRepository
+from ..domain.models import Event, SentReminder
+from .dto import RecipientBatch, ReminderEventDTO, ReminderPileDTO
+from .ports import EventRepository, SentReminderRepository, SubscriptionRepository
 
 
 @dataclass
 class ProcessRemindersUseCase:
+    """
+    Планирование напоминаний
+
+    Запланированное пишется в журнал, но не фиксируется: commit делает
+    SendRemindersUseCase в той же сессии после постановки в очередь (или отправки),
+    поэтому напоминание не может оказаться в журнале, но не в очереди.
+    """
+
     event_repo: EventRepository
     subscription_repo: SubscriptionRepository
+    sent_reminder_repo: SentReminderRepository | None = None
 
     async def execute(self, hackathon_id: int, hours_ahead: int = 1) -> list[ReminderPileDTO]:
+        if self.sent_reminder_repo is not None:
+            return await self.plan(hours_ahead=hours_ahead, hackathon_ids=[hackathon_id])
+
         events = await self.event_repo.get_upcoming_events(
             hackathon_id=hackathon_id, hours_ahead=hours_ahead
         )
@@ -22,13 +32,8 @@ class ProcessRemindersUseCase:
         users = await self.subscription_repo.get_subscribed_users(hackathon_id)
         if not users:
             return []
-        participants = [
-            ReminderParticipantDTO(
-                user_id=u.id,
-                telegram_id=u.telegram_id,
-            )
-            for u in users
-        ]
+        # одни и те же получатели у всех событий хакатона
+        participants = RecipientBatch.from_pairs((u.id, u.telegram_id) for u in users)
         result: list[ReminderPileDTO] = []
         for event in events:
             result.append(
@@ -40,3 +45,120 @@ class ProcessRemindersUseCase:
                 )
             )
         return result
+
+    async def plan(
+        self, hours_ahead: int = 1, hackathon_ids: Collection[int] | None = None
+    ) -> list[ReminderPileDTO]:
+        """
+        Напоминания сразу по всем активным хакатонам (или только по hackathon_ids)
+
+        Число запросов не зависит от количества хакатонов: одна выборка пар
+        (событие, подписчик) и, при наличии журнала, одна вставка в него.
+        """
+        if self.sent_reminder_repo is None:
+            targets = await self.subscription_repo.get_reminder_targets(
+                hours_ahead=hours_ahead, hackathon_ids=hackathon_ids
+            )
+            return _to_piles(targets)
+
+        offset_minutes = hours_ahead * 60
+        owed = await self.sent_reminder_repo.get_owed(
+            hours_ahead=hours_ahead, offset_minutes=offset_minutes, hackathon_ids=hackathon_ids
+        )
+        if not owed:
+            return []
+
+        # в журнал пишем сразу при планировании, поэтому следующий тик их уже не увидит,
+        # даже если событие всё ещё в окне hours_ahead
+        await self.sent_reminder_repo.record(
+            [
+                SentReminder(event_id=event.id, user_id=user_id, offset_minutes=offset_minutes)
+                for event, user_id, _ in owed
+            ]
+        )
+        return _to_piles(owed)
+
+    async def plan_chunks(
+        self,
+        hours_ahead: int = 1,
+        hackathon_ids: Collection[int] | None = None,
+        chunk_size: int = 1000,
+        by_user: bool = False,
+    ) -> AsyncIterator[list[ReminderPileDTO]]:
+        """
+        То же, что plan, но частями по chunk_size пар (событие, подписчик)
+
+        Каждая часть записывается в журнал до выдачи, поэтому отправку можно начинать,
+        не дочитав выборку; зафиксировать часть нужно до запроса следующей (чтение
+        по ключу, без курсора, commit между частями безопасен). Одно событие может
+        прийти в нескольких частях.
+
+        by_user=True — для дайджеста: выборка идёт по пользователям, и все события
+        пользователя попадают в одну часть (часть может быть больше chunk_size на
+        события одного пользователя).
+        """
+        if self.sent_reminder_repo is None:
+            targets = self.subscription_repo.iter_reminder_targets(
+                hours_ahead=hours_ahead,
+                hackathon_ids=hackathon_ids,
+                chunk_size=chunk_size,
+                by_user=by_user,
+            )
+            async for chunk in _whole_users(targets) if by_user else targets:
+                yield _to_piles(chunk)
+            return
+
+        offset_minutes = hours_ahead * 60
+        owed_chunks = self.sent_reminder_repo.iter_owed(
+            hours_ahead=hours_ahead,
+            offset_minutes=offset_minutes,
+            hackathon_ids=hackathon_ids,
+            chunk_size=chunk_size,
+            by_user=by_user,
+        )
+        async for owed in _whole_users(owed_chunks) if by_user else owed_chunks:
+            await self.sent_reminder_repo.record(
+                [
+                    SentReminder(event_id=event.id, user_id=user_id, offset_minutes=offset_minutes)
+                    for event, user_id, _ in owed
+                ]
+            )
+            yield _to_piles(owed)
+
+
+async def _whole_users(
+    chunks: AsyncIterator[list[tuple[Event, int, int]]],
+) -> AsyncIterator[list[tuple[Event, int, int]]]:
+    """
+    Перенарезать части, упорядоченные по user_id, так, чтобы пользователь не делился
+
+    Строки последнего пользователя части откладываются до следующей: его события
+    могут продолжиться там. В памяти — не больше части и событий одного пользователя.
+    """
+    carry: list[tuple[Event, int, int]] = []
+    async for chunk in chunks:
+        rows = carry + chunk
+        split = len(rows)
+        last_user_id = rows[-1][1]
+        while split and rows[split - 1][1] == last_user_id:
+            split -= 1
+        carry = rows[split:]
+        if split:
+            yield rows[:split]
+    if carry:
+        yield carry
+
+
+def _to_piles(targets: list[tuple[Event, int, int]]) -> list[ReminderPileDTO]:
+    piles: dict[int, ReminderPileDTO] = {}
+    for event, user_id, telegram_id in targets:
+        pile = piles.get(event.id)
+        if pile is None:
+            pile = piles[event.id] = ReminderPileDTO(
+                event=ReminderEventDTO(
+                    event_id=event.id, title=event.title, starts_at=event.starts_at
+                ),
+                participants=RecipientBatch(),
+            )
+        pile.participants.append(user_id, telegram_id)
+    return list(piles.values())
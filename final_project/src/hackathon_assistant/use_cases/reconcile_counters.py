@@ -0,0 +1,22 @@
+import logging
+from dataclasses import dataclass
+
+from .ports import HackathonCountersRepository, UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconcileCountersUseCase:
+    """Периодическая сверка hackathon_counters с users и reminder_subscriptions"""
+
+    counters_repo: HackathonCountersRepository
+    uow: UnitOfWork
+
+    async def execute(self) -> int:
+        """Исправить расхождения; вернуть число исправленных строк счётчиков"""
+        fixed = await self.counters_repo.reconcile()
+        await self.uow.commit()
+        if fixed:
+            logger.warning("Hackathon counters drifted, %s rows corrected", fixed)
+        return fixed
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from ..domain.models import Hackathon
-from .ports import HackathonRepository, UserRepository
+from .ports import HackathonRepository, UnitOfWork, UserRepository
 
 
 @dataclass
@@ -10,10 +10,13 @@ class SelectHackathonByCodeUseCase:
     Используется когда пользователь:
     1) Переходит по ссылке t.me/bot?start=CODE
     2) вводит код после регистрации
+
+    Смена хакатона фиксируется до ответа (см. StartUserUseCase).
     """
 
     user_repo: UserRepository
     hackathon_repo: HackathonRepository
+    uow: UnitOfWork | None = None
 
     async def execute(self, telegram_id: int, hackathon_code: str) -> Hackathon | None:
         """Привязка пользователя к хакатону по коду
@@ -34,4 +37,6 @@ class SelectHackathonByCodeUseCase:
 
         user.current_hackathon_id = hackathon.id
         await self.user_repo.save(user)
+        if self.uow is not None:
+            await self.uow.commit()
         return hackathon
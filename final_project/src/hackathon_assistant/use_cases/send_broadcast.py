@@ -1,29 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
-from .dto import BroadcastTargetDTO
-from .ports import SubscriptionRepository, UserRepository
+from .dto import AudienceSegmentDTO, RecipientBatch
+from .ports import UserRepository
 
 
 @dataclass
 class SendBroadcastUseCase:
     user_repo: UserRepository
-    subscription_repo: SubscriptionRepository
 
-    async def execute(self, hackathon_id: int, message: str) -> list[BroadcastTargetDTO]:
-        """Получить список пользователей для рассылки по хакатону"""
-        subscriptions = await self.subscription_repo.get_by_hackathon(hackathon_id)
-        active_subscriptions = [s for s in subscriptions if s.enabled]
-        user_ids = {sub.user_id for sub in active_subscriptions}
-        users = await self.user_repo.get_by_hackathon(hackathon_id)
-        subscribed_users = [u for u in users if u.id in user_ids]
-        return [
-            BroadcastTargetDTO(
-                telegram_id=user.telegram_id,
-                user_id=user.id,
-                first_name=user.first_name,
-                username=user.username,
-            )
-            for user in subscribed_users
-        ]
+    async def execute(
+        self, hackathon_id: int, message: str, segment: AudienceSegmentDTO | None = None
+    ) -> RecipientBatch:
+        """Получить список пользователей для рассылки по хакатону
+        segment — кому отправлять; по умолчанию подписанным пользователям с доступным чатом
+        """
+        return await self.user_repo.get_audience(hackathon_id, segment or AudienceSegmentDTO())
+
+    async def iter_targets(
+        self, hackathon_id: int, chunk_size: int = 1000, segment: AudienceSegmentDTO | None = None
+    ) -> AsyncIterator[RecipientBatch]:
+        """Те же получатели, что и в execute, но частями по chunk_size"""
+        async for batch in self.user_repo.iter_audience(
+            hackathon_id, segment or AudienceSegmentDTO(), chunk_size=chunk_size
+        ):
+            yield batch
@@ -1,13 +1,17 @@
+import hashlib
 import logging
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
 from zoneinfo import ZoneInfo
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
 
-from .dto import ReminderPileDTO
-from .ports import Notifier
+from ..domain.models import OutboxMessage
+from .dto import ReminderEventDTO, ReminderPileDTO
+from .ports import Notifier, OutboxRepository, UnitOfWork, UserRepository
 
 _LOCAL_TZ = ZoneInfo("Europe/Moscow")
 logger = logging.getLogger(__name__)
@@ -19,57 +23,151 @@ def _to_local(dt: datetime) -> datetime:
     return dt.astimezone(_LOCAL_TZ)
 
 
+def is_unreachable_error(e: Exception) -> bool:
+    """Чат недоступен насовсем: бот заблокирован, пользователь удалён или чат не найден"""
+    if isinstance(e, TelegramForbiddenError):
+        return True
+    return isinstance(e, TelegramBadRequest) and "chat not found" in str(e).lower()
+
+
+def _render_reminder(event: ReminderEventDTO) -> str:
+    time_str = _to_local(event.starts_at).strftime("%H:%M")
+    return f"🔔 *Напоминание*\n\n" f"Скоро событие:\n" f"📌 *{event.title}*\n" f"🕐 {time_str}"
+
+
+def _render_digest(events: list[ReminderEventDTO]) -> str:
+    """Одно сообщение обо всех событиях пользователя; одно событие — обычное напоминание"""
+    if len(events) == 1:
+        return _render_reminder(events[0])
+    lines = [
+        f"📌 *{e.title}* — 🕐 {_to_local(e.starts_at).strftime('%H:%M')}"
+        for e in sorted(events, key=lambda e: (e.starts_at, e.event_id))
+    ]
+    return "🔔 *Напоминание*\n\nСкоро события:\n" + "\n".join(lines)
+
+
+def _digest_key(events: list[ReminderEventDTO]) -> str:
+    if len(events) == 1:
+        return f"reminder:{events[0].event_id}"
+    ids = ",".join(str(i) for i in sorted(e.event_id for e in events))
+    # ключ очереди ограничен 128 символами, список событий может быть длинным
+    return f"reminder-digest:{hashlib.sha1(ids.encode()).hexdigest()}"
+
+
+# (message_key, user_id, telegram_id, text)
+_Reminder = tuple[str, int, int, str]
+
+
 @dataclass
 class SendRemindersUseCase:
+    """
+    Отправка напоминаний напрямую (notifier или bot) или через очередь доставки
+
+    digest=True: все события тика, о которых надо напомнить пользователю, уходят
+    одним сообщением, поэтому сообщений столько, сколько получателей, а не пар
+    (событие, получатель)
+
+    uow фиксируется один раз в конце execute: вместе с очередью (или после отправки)
+    фиксируется и журнал, который ProcessRemindersUseCase записал в той же сессии
+    """
+
     notifier: Notifier | None = None
     bot: Bot | None = None
+    outbox_repo: OutboxRepository | None = None
+    user_repo: UserRepository | None = None
+    uow: UnitOfWork | None = None
+    digest: bool = False
+    enqueue_chunk_size: int = 1000
 
     async def execute(self, piles: list[ReminderPileDTO]) -> None:
+        reminders = self._digests(piles) if self.digest else self._per_event(piles)
+        if self.outbox_repo is not None:
+            await self._enqueue(reminders)
+        else:
+            await self._send(reminders)
+        # очередь (воркер доставки читает её в своей сессии) и журнал — одним commit
+        if self.uow is not None:
+            await self.uow.commit()
+
+    async def _send(self, reminders: Iterable[_Reminder]) -> None:
         if self.notifier is None and self.bot is None:
-            raise RuntimeError("SendRemindersUseCase: set either notifier or bot")
+            raise RuntimeError("SendRemindersUseCase: set either notifier, bot or outbox_repo")
         total_sent = 0
         total_failed = 0
+        unreachable: list[int] = []
+
+        for _, user_id, telegram_id, text in reminders:
+            try:
+                if self.notifier is not None:
+                    await self.notifier.send(telegram_id=telegram_id, text=text)
+                else:
+                    await self.bot.send_message(  # type: ignore[union-attr]
+                        chat_id=telegram_id,
+                        text=text,
+                        parse_mode="Markdown",
+                    )
 
-        for pile in piles:
-            local_dt = _to_local(pile.event.starts_at)
-            time_str = local_dt.strftime("%H:%M")
-
-            text = (
-                f"🔔 *Напоминание*\n\n"
-                f"Скоро событие:\n"
-                f"📌 *{pile.event.title}*\n"
-                f"🕐 {time_str}"
-            )
+                total_sent += 1
+                logger.info(
+                    "Reminder sent to user %s (chat_id: %s)",
+                    user_id,
+                    telegram_id,
+                )
 
-            for p in pile.participants:
-                try:
-                    if self.notifier is not None:
-                        await self.notifier.send(telegram_id=p.telegram_id, text=text)
-                    else:
-                        await self.bot.send_message(  # type: ignore[union-attr]
-                            chat_id=p.telegram_id,
-                            text=text,
-                            parse_mode="Markdown",
-                        )
-
-                    total_sent += 1
-                    logger.info(
-                        "Reminder sent to user %s (chat_id: %s)",
-                        p.user_id,
-                        p.telegram_id,
-                    )
+            except TelegramBadRequest as e:
+                if is_unreachable_error(e):
+                    logger.warning("Chat not found for user %s", user_id)
+                    unreachable.append(telegram_id)
+                total_failed += 1
 
-                except TelegramBadRequest as e:
-                    if "chat not found" in str(e).lower():
-                        logger.warning("Chat not found for user %s", p.user_id)
-                    total_failed += 1
+            except TelegramForbiddenError:
+                logger.warning("User %s blocked the bot", user_id)
+                unreachable.append(telegram_id)
+                total_failed += 1
 
-                except TelegramForbiddenError:
-                    logger.warning("User %s blocked the bot", p.user_id)
-                    total_failed += 1
+            except Exception as e:  # noqa: BLE001
+                logger.error("Error sending reminder to user %s: %r", user_id, e)
+                total_failed += 1
 
-                except Exception as e:  # noqa: BLE001
-                    logger.error("Error sending reminder to user %s: %r", p.user_id, e)
-                    total_failed += 1
+        logger.info("Reminders sent: %s successful, %s failed", total_sent, total_failed)
 
-            logger.info("Reminders sent: %s successful, %s failed", total_sent, total_failed)
+        if unreachable and self.user_repo is not None:
+            # следующие напоминания и рассылки этих пользователей уже не выберут
+            await self.user_repo.mark_unreachable(unreachable)
+
+    @staticmethod
+    def _per_event(piles: list[ReminderPileDTO]) -> Iterator[_Reminder]:
+        for pile in piles:
+            text = _render_reminder(pile.event)
+            message_key = f"reminder:{pile.event.event_id}"
+            for user_id, telegram_id in pile.participants:
+                yield message_key, user_id, telegram_id, text
+
+    @staticmethod
+    def _digests(piles: list[ReminderPileDTO]) -> Iterator[_Reminder]:
+        # события пользователя в порядке первого появления получателя
+        by_recipient: dict[int, tuple[int, list[ReminderEventDTO]]] = {}
+        for pile in piles:
+            for user_id, telegram_id in pile.participants:
+                entry = by_recipient.get(telegram_id)
+                if entry is None:
+                    by_recipient[telegram_id] = (user_id, [pile.event])
+                else:
+                    entry[1].append(pile.event)
+        for telegram_id, (user_id, events) in by_recipient.items():
+            yield _digest_key(events), user_id, telegram_id, _render_digest(events)
+
+    async def _enqueue(self, reminders: Iterable[_Reminder]) -> None:
+        """Положить напоминания в очередь доставки вместо прямой отправки"""
+        total_queued = 0
+        it = iter(reminders)
+        while chunk := list(islice(it, self.enqueue_chunk_size)):
+            total_queued += await self.outbox_repo.enqueue(  # type: ignore[union-attr]
+                [
+                    OutboxMessage(
+                        message_key=message_key, user_id=user_id, telegram_id=telegram_id, text=text
+                    )
+                    for message_key, user_id, telegram_id, text in chunk
+                ]
+            )
+        logger.info("Reminders queued: %s", total_queued)
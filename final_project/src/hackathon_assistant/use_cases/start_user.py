@@ -1,14 +1,20 @@
 from dataclasses import dataclass
 
-from ..domain.models import User, UserRole
-from .ports import UserRepository
+from ..domain.models import User
+from .ports import UnitOfWork, UserRepository
 
 
 @dataclass
 class StartUserUseCase:
-    """Use case для команды /start"""
+    """
+    Use case для команды /start
+
+    Регистрация фиксируется здесь, до ответа пользователю: триггер счётчиков держит
+    блокировку строки hackathon_counters до commit, и она не должна ждать запроса к Telegram.
+    """
 
     user_repo: UserRepository
+    uow: UnitOfWork | None = None
 
     async def execute(
         self, telegram_id: int, username: str = "", first_name: str = "", last_name: str = ""
@@ -21,23 +27,15 @@ class StartUserUseCase:
             last_name: фамилия в tg
         Возвращаем User: сохраненный пользователь
         """
-        user = await self.user_repo.get_by_telegram_id(telegram_id)
-
-        if user is None:
-            user = User(
-                id=None,
-                telegram_id=telegram_id,
-                username=username,
-                first_name=first_name,
-                last_name=last_name,
-                role=UserRole.PARTICIPANT,
-                current_hackathon_id=None,
-            )
-        else:
-            # Обновляем данные (могло измениться имя)
-            user.username = username
-            user.first_name = first_name
-            user.last_name = last_name
-
-        saved_user = await self.user_repo.save(user)
-        return saved_user
+        # новый пользователь регистрируется участником, у существующего обновляется имя
+        # (могло измениться) и снимается отметка о недоступном чате — одним запросом,
+        # без записи, если ничего не изменилось
+        user = await self.user_repo.upsert_profile(
+            telegram_id=telegram_id,
+            username=username,
+            first_name=first_name,
+            last_name=last_name,
+        )
+        if self.uow is not None:
+            await self.uow.commit()
+        return user
@@ -2,8 +2,10 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from hackathon_assistant.adapters.db.models import Base
 from hackathon_assistant.domain.models import (
     Event,
     EventType,
@@ -187,3 +189,15 @@ def mock_use_cases():
     use_cases.start_user.user_repo.get_by_telegram_id = AsyncMock()
 
     return use_cases
+
+
+@pytest_asyncio.fixture
+async def sqlite_session():
+    """Настоящая сессия поверх SQLite в памяти со всей схемой"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
@@ -0,0 +1,207 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, select, update
+
+from hackathon_assistant.adapters.db.counters import counter_trigger_ddl
+from hackathon_assistant.adapters.db.models import HackathonCountersORM
+from hackathon_assistant.adapters.db.repositories import (
+    ArchiveRepo,
+    HackathonCountersRepo,
+    HackathonRepo,
+    SubscriptionRepo,
+    UserRepo,
+)
+from hackathon_assistant.adapters.db.repositories.user_repo import hackathon_stats_select
+from hackathon_assistant.domain.models import Hackathon, ReminderSubscription, User, UserRole
+
+
+async def _seed(session) -> tuple[Hackathon, Hackathon]:
+    hackathons = HackathonRepo(session)
+    first = await hackathons.save(
+        Hackathon(
+            code="A", name="Hack A", start_at=datetime(2025, 1, 1), end_at=datetime(2025, 1, 2)
+        )
+    )
+    second = await hackathons.save(
+        Hackathon(
+            code="B", name="Hack B", start_at=datetime(2025, 2, 1), end_at=datetime(2025, 2, 2)
+        )
+    )
+    users = UserRepo(session)
+    subscriptions = SubscriptionRepo(session)
+    layout = [
+        (first.id, UserRole.PARTICIPANT, True),
+        (first.id, UserRole.PARTICIPANT, False),
+        (first.id, UserRole.ORGANIZER, True),
+        (second.id, UserRole.PARTICIPANT, True),
+        (None, UserRole.PARTICIPANT, False),
+    ]
+    for i, (hackathon_id, role, subscribed) in enumerate(layout, start=1):
+        user = await users.save(User(telegram_id=i, role=role, current_hackathon_id=hackathon_id))
+        if subscribed:
+            await subscriptions.save(
+                ReminderSubscription(user_id=user.id, hackathon_id=hackathon_id, enabled=True)
+            )
+    # выключенная подписка не считается
+    await subscriptions.save(
+        ReminderSubscription(user_id=user.id, hackathon_id=second.id, enabled=False)
+    )
+    return first, second
+
+
+class TestHackathonStatsSelect:
+    """Тесты hackathon_stats_select (фактические счётчики для сверки) на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_breakdown_in_one_query(self, sqlite_session):
+        """Счётчики по хакатонам одним SELECT, итоги совпадают с count_all"""
+        first, second = await _seed(sqlite_session)
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = sqlite_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            rows = await _actual(sqlite_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert len(statements) == 1
+        assert "GROUP BY" in statements[0]
+        by_id = {
+            r.hackathon_id: (
+                r.code,
+                r.total_users,
+                r.participants,
+                r.organizers,
+                r.subscribed_users,
+            )
+            for r in rows
+        }
+        assert by_id == {
+            None: (None, 1, 1, 0, 0),
+            first.id: ("A", 3, 2, 1, 2),
+            second.id: ("B", 1, 1, 0, 1),
+        }
+        assert sum(r.total_users for r in rows) == await UserRepo(sqlite_session).count_all()
+        assert sum(r.subscribed_users for r in rows) == (
+            await SubscriptionRepo(sqlite_session).count_all_subscribed()
+        )
+
+
+async def _actual(session) -> list:
+    return list(await session.execute(hackathon_stats_select()))
+
+
+def _counts(rows) -> dict:
+    return {
+        r.hackathon_id: (r.total_users, r.participants, r.organizers, r.subscribed_users)
+        for r in rows
+    }
+
+
+class TestHackathonCounters:
+    """Тесты hackathon_counters: триггеры и сверка на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_triggers_follow_every_write_path(self, sqlite_session):
+        """После записей через репозитории счётчики совпадают с GROUP BY по таблицам"""
+        first, second = await _seed(sqlite_session)
+        users = UserRepo(sqlite_session)
+        subscriptions = SubscriptionRepo(sqlite_session)
+        counters = HackathonCountersRepo(sqlite_session)
+
+        await users.upsert_profile(telegram_id=100, username="new", first_name="", last_name="")
+        await users.upsert_profile(telegram_id=100, username="renamed", first_name="", last_name="")
+        user = await users.get_by_telegram_id(100)
+        await users.update_current_hackathon(user.id, second.id)
+        await subscriptions.set_subscription(100, enabled=True)
+        await subscriptions.set_subscription(5, enabled=True)
+        await subscriptions.set_subscription(2, enabled=False)
+        await subscriptions.disable_all_for_hackathon(first.id)
+        await ArchiveRepo(sqlite_session).archive_hackathon(second.id)
+
+        expected = _counts(await _actual(sqlite_session))
+        assert _counts(await counters.get_all()) == {
+            **dict.fromkeys(expected, (0, 0, 0, 0)),
+            **expected,
+        }
+        assert await counters.reconcile() == 0
+
+    @pytest.mark.asyncio
+    async def test_read_is_primary_key_range(self, sqlite_session):
+        """Счётчики хакатона читаются одним запросом по префиксу ключа, без users"""
+        first, _ = await _seed(sqlite_session)
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = sqlite_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            row = await HackathonCountersRepo(sqlite_session).get_by_hackathon(first.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert (row.code, row.total_users, row.subscribed_users) == ("A", 3, 2)
+        assert len(statements) == 1
+        assert "FROM hackathon_counters" in statements[0]
+        assert "FROM users" not in statements[0]
+        assert "WHERE hackathon_counters.hackathon_id = " in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_counters_are_spread_over_shards(self, sqlite_session):
+        """Пользователи одного хакатона пишут в разные строки; чтение их суммирует"""
+        first, _ = await _seed(sqlite_session)
+
+        shards = (
+            await sqlite_session.execute(
+                select(HackathonCountersORM.shard).where(
+                    HackathonCountersORM.hackathon_id == first.id
+                )
+            )
+        ).scalars()
+        row = await HackathonCountersRepo(sqlite_session).get_by_hackathon(first.id)
+
+        assert len(set(shards)) > 1
+        assert (row.total_users, row.subscribed_users) == (3, 2)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fixes_drift(self, sqlite_session):
+        """Сверка возвращает испорченные и лишние строки к фактическим значениям"""
+        first, second = await _seed(sqlite_session)
+        counters = HackathonCountersRepo(sqlite_session)
+        await sqlite_session.execute(
+            update(HackathonCountersORM)
+            .where(HackathonCountersORM.hackathon_id == first.id)
+            .values(total_users=999, subscribed_users=0)
+        )
+        await sqlite_session.execute(
+            HackathonCountersORM.__table__.insert().values(hackathon_id=777, total_users=5)
+        )
+
+        assert await counters.reconcile() == 2
+        assert await counters.reconcile() == 0
+        rows = _counts(await counters.get_all())
+        assert rows[first.id] == (3, 2, 1, 2)
+        assert rows[777] == (0, 0, 0, 0)
+
+
+class TestCounterTriggerDDL:
+    """DDL триггеров для PostgreSQL (сам PostgreSQL в тестах не поднимается)"""
+
+    def test_postgresql_triggers_are_statement_level(self):
+        """Одна сгруппированная дельта на оператор, а не upsert на каждую строку"""
+        ddl = counter_trigger_ddl("postgresql")
+        triggers = [s for s in ddl if s.startswith("CREATE TRIGGER")]
+
+        assert len(triggers) == 6
+        assert all("FOR EACH STATEMENT" in s and "REFERENCING" in s for s in triggers)
+        assert not any("FOR EACH ROW" in s for s in ddl)
+        assert all(
+            "GROUP BY hackathon_id, shard" in s for s in ddl if s.startswith("CREATE OR REPLACE")
+        )
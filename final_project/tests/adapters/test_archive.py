@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from hackathon_assistant.adapters.db.models import (
+    ArchivedEventORM,
+    ArchivedFAQItemORM,
+    ArchivedReminderSubscriptionORM,
+    EventORM,
+    ReminderSubscriptionORM,
+    SentReminderORM,
+)
+from hackathon_assistant.domain.models import Event, FAQItem, Hackathon, SentReminder
+from hackathon_assistant.infra.repositories import RepositoryProvider
+from hackathon_assistant.use_cases.finish_hackathon import FinishHackathonUseCase
+
+
+async def _count(session, model, **where) -> int:
+    stmt = select(func.count()).select_from(model).filter_by(**where)
+    return (await session.execute(stmt)).scalar_one()
+
+
+async def _hackathon_with_content(repos: RepositoryProvider, code: str, users: int) -> Hackathon:
+    start = datetime(2025, 1, 1, 10)
+    hackathon = await repos.hackathon_repo().save(
+        Hackathon(code=code, name=code, start_at=start, end_at=start + timedelta(days=1))
+    )
+    events = await repos.event_repo().save_all(
+        [
+            Event(
+                hackathon_id=hackathon.id,
+                title="Opening",
+                starts_at=start,
+                ends_at=start + timedelta(hours=1),
+            )
+        ]
+    )
+    await repos.faq_repo().save_all([FAQItem(hackathon_id=hackathon.id, question="Q", answer="A")])
+    for i in range(users):
+        telegram_id = hackathon.id * 1000 + i
+        user = await repos.user_repo().upsert_profile(
+            telegram_id=telegram_id, username="", first_name="", last_name=""
+        )
+        await repos.user_repo().update_current_hackathon(user.id, hackathon.id)
+        await repos.subscription_repo().set_subscription(telegram_id, enabled=True)
+        await repos.sent_reminder_repo().record(
+            [SentReminder(event_id=events[0].id, user_id=user.id, offset_minutes=60)]
+        )
+    return hackathon
+
+
+class TestFinishHackathonOnSQLite:
+    """Тесты завершения и архивации хакатона на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_finish_disables_subscriptions_of_one_hackathon(self, sqlite_session):
+        """Выключаются только подписки завершаемого хакатона"""
+        repos = RepositoryProvider(session=sqlite_session)
+        finished = await _hackathon_with_content(repos, "DONE", users=3)
+        other = await _hackathon_with_content(repos, "LIVE", users=2)
+
+        use_case = FinishHackathonUseCase(
+            hackathon_repo=repos.hackathon_repo(), subscription_repo=repos.subscription_repo()
+        )
+        assert await use_case.execute(finished.id) is True
+
+        assert (await repos.hackathon_repo().get_by_id(finished.id)).is_active is False
+        subscriptions = ReminderSubscriptionORM
+        assert (
+            await _count(sqlite_session, subscriptions, hackathon_id=finished.id, enabled=True) == 0
+        )
+        assert await _count(sqlite_session, subscriptions, hackathon_id=other.id, enabled=True) == 2
+
+    @pytest.mark.asyncio
+    async def test_archive_moves_hackathon_data(self, sqlite_session):
+        """События, FAQ и подписки переезжают в архив, чужие данные не трогаются"""
+        repos = RepositoryProvider(session=sqlite_session)
+        finished = await _hackathon_with_content(repos, "DONE", users=3)
+        other = await _hackathon_with_content(repos, "LIVE", users=2)
+
+        use_case = FinishHackathonUseCase(
+            hackathon_repo=repos.hackathon_repo(),
+            subscription_repo=repos.subscription_repo(),
+            archive_repo=repos.archive_repo(),
+        )
+        assert await use_case.execute(finished.id) is True
+
+        assert await _count(sqlite_session, EventORM, hackathon_id=finished.id) == 0
+        assert await _count(sqlite_session, ArchivedEventORM, hackathon_id=finished.id) == 1
+        assert await _count(sqlite_session, ArchivedFAQItemORM, hackathon_id=finished.id) == 1
+        archived = (
+            await sqlite_session.execute(
+                select(ArchivedReminderSubscriptionORM.enabled).filter_by(hackathon_id=finished.id)
+            )
+        ).scalars()
+        assert list(archived) == [False, False, False]
+        assert await _count(sqlite_session, SentReminderORM) == 2
+
+        assert await _count(sqlite_session, EventORM, hackathon_id=other.id) == 1
+        assert await _count(sqlite_session, ReminderSubscriptionORM, hackathon_id=other.id) == 2
+        assert (await repos.hackathon_repo().get_by_id(finished.id)).content_version == 3
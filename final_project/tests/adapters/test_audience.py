@@ -0,0 +1,118 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, update
+
+from hackathon_assistant.adapters.db.models import UserORM
+from hackathon_assistant.adapters.db.repositories import HackathonRepo, SubscriptionRepo, UserRepo
+from hackathon_assistant.domain.models import Hackathon, ReminderSubscription, User, UserRole
+from hackathon_assistant.use_cases.dto import AudienceSegmentDTO, RecipientBatch
+
+
+@pytest.fixture
+async def members(sqlite_session):
+    """
+    Хакатон и пользователи: 111 — подписан; 222 — подписан, недоступен;
+    333 — организатор без подписки; 444 — подписка выключена; 555 — в другом хакатоне
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    hackathons = [
+        await HackathonRepo(sqlite_session).save(
+            Hackathon(code=code, name=code, start_at=now, end_at=now + timedelta(days=1))
+        )
+        for code in ("HACK", "OTHER")
+    ]
+    hackathon = hackathons[0]
+    users = {}
+    for tg, role, hack, enabled in (
+        (111, UserRole.PARTICIPANT, hackathon, True),
+        (222, UserRole.PARTICIPANT, hackathon, True),
+        (333, UserRole.ORGANIZER, hackathon, None),
+        (444, UserRole.PARTICIPANT, hackathon, False),
+        (555, UserRole.PARTICIPANT, hackathons[1], True),
+    ):
+        user = await UserRepo(sqlite_session).save(
+            User(telegram_id=tg, role=role, current_hackathon_id=hack.id)
+        )
+        users[tg] = user
+        if enabled is not None:
+            await SubscriptionRepo(sqlite_session).save(
+                ReminderSubscription(user_id=user.id, hackathon_id=hack.id, enabled=enabled)
+            )
+    await UserRepo(sqlite_session).mark_unreachable([222])
+    # 111 и 222 зарегистрировались давно
+    await sqlite_session.execute(
+        update(UserORM)
+        .where(UserORM.telegram_id.in_([111, 222]))
+        .values(created_at=now - timedelta(days=30))
+    )
+    return hackathon, users
+
+
+async def _audience(session, hackathon_id, **segment) -> list[int]:
+    batch = await UserRepo(session).get_audience(hackathon_id, AudienceSegmentDTO(**segment))
+    assert isinstance(batch, RecipientBatch)
+    return list(batch.telegram_ids)
+
+
+class TestBroadcastAudience:
+    """Тесты выборки получателей рассылки на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_default_segment(self, sqlite_session, members):
+        """По умолчанию: включённая подписка на этот хакатон и доступный чат"""
+        hackathon, users = members
+
+        batch = await UserRepo(sqlite_session).get_audience(hackathon.id, AudienceSegmentDTO())
+
+        assert list(batch) == [(users[111].id, 111)]
+
+    @pytest.mark.asyncio
+    async def test_segment_filters(self, sqlite_session, members):
+        """Роль, все участники, недоступные чаты и дата регистрации"""
+        hackathon, _ = members
+        week_ago = datetime.now(UTC) - timedelta(days=7)
+
+        assert await _audience(sqlite_session, hackathon.id, subscribed_only=False) == [
+            111,
+            333,
+            444,
+        ]
+        assert await _audience(
+            sqlite_session, hackathon.id, subscribed_only=False, reachable_only=False
+        ) == [111, 222, 333, 444]
+        assert await _audience(
+            sqlite_session, hackathon.id, subscribed_only=False, role=UserRole.ORGANIZER
+        ) == [333]
+        assert await _audience(
+            sqlite_session, hackathon.id, subscribed_only=False, joined_after=week_ago
+        ) == [333, 444]
+        assert await _audience(sqlite_session, hackathon.id, joined_after=week_ago) == []
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_chunk(self, sqlite_session, members):
+        """Выборка — один запрос, по частям — запрос на часть"""
+        hackathon, _ = members
+        statements: list[str] = []
+        engine = sqlite_session.get_bind()
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        segment = AudienceSegmentDTO(subscribed_only=False)
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            await UserRepo(sqlite_session).get_audience(hackathon.id, segment)
+            assert len(statements) == 1
+            statements.clear()
+            chunks = [
+                list(batch.telegram_ids)
+                async for batch in UserRepo(sqlite_session).iter_audience(
+                    hackathon.id, segment, chunk_size=2
+                )
+            ]
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert chunks == [[111, 333], [444]]
+        assert len(statements) == 2
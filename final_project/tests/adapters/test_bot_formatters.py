@@ -17,6 +17,7 @@ from hackathon_assistant.use_cases.dto import (
     AdminStatsDTO,
     FAQItemDTO,
     HackathonDTO,
+    HackathonStatsDTO,
     RulesDTO,
     ScheduleItemDTO,
 )
@@ -130,6 +131,32 @@ class TestFormatters:
         assert "Участников: 85" in result
         assert "Организаторов: 15" in result
         assert "Подписаны на напоминания: 60" in result
+        assert "По хакатонам" not in result
+
+    def test_format_admin_stats_breakdown(self):
+        """Тест разбивки статистики по хакатонам"""
+        stats = AdminStatsDTO(
+            total_users=10,
+            participants=8,
+            organizers=2,
+            subscribed_users=6,
+            hackathons=[
+                HackathonStatsDTO(
+                    hackathon_id=1,
+                    code="HACK2024",
+                    name="Тестовый хакатон",
+                    total_users=10,
+                    participants=8,
+                    organizers=2,
+                    subscribed_users=6,
+                )
+            ],
+        )
+
+        result = format_admin_stats(stats)
+
+        assert "По хакатонам:" in result
+        assert "HACK2024 — Тестовый хакатон: 10 польз. (8 уч., 2 орг.), подписаны: 6" in result
 
     def test_format_broadcast_result(self):
         """Тест форматирования результата рассылки"""
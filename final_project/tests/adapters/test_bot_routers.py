@@ -119,6 +119,22 @@ class TestBotRouters:
             mock_message.answer.assert_called_once()
             assert "100" in mock_message.answer.call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_admin_stats_by_code(self, mock_message, mock_use_cases):
+        """Тест /admin_stats <код>: статистика по хакатону, текущий хакатон не меняется"""
+
+        mock_message.text = "/admin_stats NOPE"
+
+        with patch("hackathon_assistant.adapters.bot.admin.is_organizer") as mock_is_organizer:
+            mock_is_organizer.return_value = True
+            mock_use_cases.get_admin_stats.execute.return_value = None
+
+            await cmd_admin_stats(mock_message, mock_use_cases)
+
+            mock_use_cases.get_admin_stats.execute.assert_awaited_once_with(hackathon_code="NOPE")
+            mock_use_cases.select_hackathon_by_code.execute.assert_not_called()
+            assert "не найден" in mock_message.answer.call_args[0][0]
+
     @pytest.mark.asyncio
     async def test_admin_stats_as_participant(self, mock_message, mock_use_cases):
         """Тест команды /admin_stats для участника"""
@@ -0,0 +1,195 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+
+from hackathon_assistant.adapters.bot.admin import cmd_admin_broadcast
+from hackathon_assistant.adapters.bot.broadcast import (
+    BroadcastDispatcher,
+    SendOutcome,
+    TokenBucket,
+)
+from hackathon_assistant.use_cases.dto import RecipientBatch
+
+
+def _dispatcher(bot, **kwargs) -> BroadcastDispatcher:
+    params = {"rate_per_second": 1000.0, "per_chat_interval": 0.0, "max_concurrency": 4}
+    params.update(kwargs)
+    return BroadcastDispatcher(bot, **params)
+
+
+class TestBroadcastDispatcher:
+    """Тесты BroadcastDispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_send_many_counts_results(self, mock_bot):
+        """Успешные и неудачные отправки попадают в BroadcastResultDTO"""
+
+        async def send_message(chat_id, text, parse_mode=None):
+            if chat_id == 3:
+                raise TelegramForbiddenError(method=MagicMock(), message="bot was blocked")
+
+        mock_bot.send_message.side_effect = send_message
+
+        result = await _dispatcher(mock_bot).send_many([1, 2, 3, 4], "hello")
+
+        assert mock_bot.send_message.call_count == 4
+        assert result.total_recipients == 4
+        assert result.sent_successfully == 3
+        assert result.failed == 1
+        assert result.success_rate == 0.75
+
+    @pytest.mark.asyncio
+    async def test_unreachable_chats_are_reported(self, mock_bot):
+        """Заблокированные и не найденные чаты передаются в on_unreachable после пачки"""
+
+        async def send_message(chat_id, text, parse_mode=None):
+            if chat_id == 1:
+                raise TelegramForbiddenError(method=MagicMock(), message="bot was blocked")
+            if chat_id == 2:
+                raise TelegramBadRequest(method=MagicMock(), message="Bad Request: chat not found")
+            if chat_id == 3:
+                raise TelegramBadRequest(method=MagicMock(), message="message is too long")
+
+        mock_bot.send_message.side_effect = send_message
+        on_unreachable = AsyncMock()
+
+        await _dispatcher(mock_bot, on_unreachable=on_unreachable).send_many([1, 2, 3, 4], "hi")
+
+        on_unreachable.assert_awaited_once()
+        assert sorted(on_unreachable.call_args[0][0]) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_and_retries(self, mock_bot):
+        """TelegramRetryAfter не считается ошибкой: bucket ставится на паузу и отправка повторяется"""
+        mock_bot.send_message.side_effect = [
+            TelegramRetryAfter(method=MagicMock(), message="flood", retry_after=0),
+            None,
+        ]
+        dispatcher = _dispatcher(mock_bot, max_concurrency=1)
+
+        with patch.object(TokenBucket, "pause") as mock_pause:
+            result = await dispatcher.send_many([42], "hello")
+
+        mock_pause.assert_called_once_with(0)
+        assert mock_bot.send_message.call_count == 2
+        assert result.sent_successfully == 1
+        assert result.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_send_keyed_separates_transient_errors(self, mock_bot):
+        """Сеть, 5xx и таймаут — повтор позже; отказ Telegram — окончательная ошибка"""
+
+        async def send_message(chat_id, text, parse_mode=None):
+            if chat_id == 2:
+                raise TelegramNetworkError(method=MagicMock(), message="connection reset")
+            if chat_id == 3:
+                raise TelegramServerError(method=MagicMock(), message="Bad Gateway")
+            if chat_id == 4:
+                raise TimeoutError
+            if chat_id == 5:
+                raise TelegramBadRequest(method=MagicMock(), message="message is too long")
+
+        mock_bot.send_message.side_effect = send_message
+
+        outcomes = await _dispatcher(mock_bot).send_keyed(
+            (chat_id * 10, chat_id, "hi") for chat_id in range(1, 6)
+        )
+
+        assert outcomes[SendOutcome.SENT] == [10]
+        assert sorted(outcomes[SendOutcome.RETRY]) == [20, 30, 40]
+        assert outcomes[SendOutcome.FAILED] == [50]
+
+    @pytest.mark.asyncio
+    async def test_send_keyed_stops_when_asked(self, mock_bot):
+        """После should_stop() оставшиеся сообщения не отправляются"""
+        stop = False
+
+        async def send_message(chat_id, text, parse_mode=None):
+            nonlocal stop
+            stop = True
+
+        mock_bot.send_message.side_effect = send_message
+        outcomes = await _dispatcher(mock_bot, max_concurrency=1).send_keyed(
+            ((chat_id, chat_id, "hi") for chat_id in (1, 2, 3)), should_stop=lambda: stop
+        )
+
+        assert outcomes[SendOutcome.SENT] == [1]
+        assert outcomes[SendOutcome.CANCELLED] == [2, 3]
+        assert mock_bot.send_message.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_recipients(self, mock_bot):
+        """Пустой список получателей"""
+        result = await _dispatcher(mock_bot).send_many([], "hello")
+
+        mock_bot.send_message.assert_not_called()
+        assert result.total_recipients == 0
+        assert result.success_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_start_reports_on_done(self, mock_bot):
+        """Фоновая рассылка вызывает on_done с итогом"""
+        on_done = AsyncMock()
+
+        task = _dispatcher(mock_bot).start([1, 2], "hello", on_done=on_done)
+        await task
+
+        on_done.assert_awaited_once()
+        assert on_done.call_args[0][0].sent_successfully == 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_limits_rate(self):
+        """Без запаса токенов acquire ждёт пополнения"""
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(4):
+            await bucket.acquire()
+
+        assert loop.time() - started >= 0.025
+
+
+class TestAdminBroadcastHandler:
+    """Тесты /admin_broadcast"""
+
+    @pytest.mark.asyncio
+    async def test_handler_does_not_wait_for_delivery(self, mock_message, mock_use_cases):
+        """Обработчик только запускает рассылку и сразу возвращается"""
+        mock_message.text = "/admin_broadcast HACK2025 Привет всем"
+        hackathon = MagicMock()
+        hackathon.id = 1
+        hackathon.name = "Тестовый хакатон"
+        mock_use_cases.select_hackathon_by_code.execute.return_value = hackathon
+        mock_use_cases.send_broadcast.execute = AsyncMock(
+            return_value=RecipientBatch.from_pairs([(1, 111), (2, 222)])
+        )
+        dispatcher = MagicMock()
+
+        with patch("hackathon_assistant.adapters.bot.admin.is_organizer", return_value=True):
+            await cmd_admin_broadcast(mock_message, mock_use_cases, dispatcher)
+
+        dispatcher.start.assert_called_once()
+        args, kwargs = dispatcher.start.call_args
+        assert list(args[0]) == [111, 222]
+        assert args[1] == "Привет всем"
+        assert kwargs["on_done"] is not None
+        mock_message.answer.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handler_requires_shared_dispatcher(self, mock_message, mock_use_cases):
+        """Без общего диспетчера обработчик не создаёт свой (со своим лимитом)"""
+        mock_message.text = "/admin_broadcast HACK2025 Привет всем"
+
+        with pytest.raises(RuntimeError):
+            await cmd_admin_broadcast(mock_message, mock_use_cases)
+
+        mock_use_cases.select_hackathon_by_code.execute.assert_not_called()
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from hackathon_assistant.adapters.db.models import EventORM, FAQItemORM
+from hackathon_assistant.adapters.db.repositories import EventRepo, FAQRepo, HackathonRepo
+from hackathon_assistant.domain.models import Event, FAQItem, Hackathon
+
+
+@pytest_asyncio.fixture
+async def hackathon(sqlite_session):
+    return await HackathonRepo(sqlite_session).save(
+        Hackathon(
+            code="HACK", name="Hack", start_at=datetime(2025, 1, 1), end_at=datetime(2025, 1, 2)
+        )
+    )
+
+
+class TestBulkSaveAll:
+    """Тесты пакетной вставки save_all на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_events_get_ids_in_input_order(self, sqlite_session, hackathon):
+        """id возвращаются в порядке входного списка, в т.ч. на границе частей"""
+        start = datetime(2025, 1, 1, 10)
+        events = [
+            Event(
+                hackathon_id=hackathon.id,
+                title=f"Event {i}",
+                starts_at=start + timedelta(minutes=i),
+                ends_at=start + timedelta(minutes=i + 30),
+            )
+            for i in range(5)
+        ]
+
+        with patch("hackathon_assistant.adapters.db.repositories.event_repo._INSERT_CHUNK", 2):
+            saved = await EventRepo(sqlite_session).save_all(events)
+
+        rows = (await sqlite_session.execute(select(EventORM.id, EventORM.title))).all()
+        assert [(e.id, e.title) for e in saved] == sorted(rows)
+        assert [e.title for e in saved] == [e.title for e in events]
+        assert saved[0].starts_at == start
+
+    @pytest.mark.asyncio
+    async def test_faq_items_get_ids(self, sqlite_session, hackathon):
+        """FAQ сохраняется одной вставкой, пустой список ничего не пишет"""
+        items = [FAQItem(hackathon_id=hackathon.id, question=f"Q{i}", answer="A") for i in range(3)]
+
+        assert await FAQRepo(sqlite_session).save_all([]) == []
+        saved = await FAQRepo(sqlite_session).save_all(items)
+
+        rows = (await sqlite_session.execute(select(FAQItemORM.id, FAQItemORM.question))).all()
+        assert [(i.id, i.question) for i in saved] == sorted(rows)
@@ -0,0 +1,232 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hackathon_assistant.adapters.bot.user import cmd_faq
+from hackathon_assistant.adapters.db.repositories import (
+    CachedEventRepo,
+    CachedFAQRepo,
+    CachedRulesRepo,
+    ContentCache,
+    EventRepo,
+    FAQRepo,
+    HackathonRepo,
+    RulesRepo,
+)
+from hackathon_assistant.domain.models import Event, FAQItem, Hackathon, Rules
+from hackathon_assistant.use_cases.dto import FAQItemDTO, HackathonDTO
+
+
+class TestContentCache:
+    """Тесты LRU + TTL кэша контента"""
+
+    def test_lru_eviction(self):
+        """При переполнении вытесняется давно не использованная запись"""
+        cache = ContentCache(max_entries=2)
+        cache.set(("faq", 1), "a")
+        cache.set(("faq", 2), "b")
+        cache.get(("faq", 1))
+        cache.set(("faq", 3), "c")
+
+        assert cache.get(("faq", 1)) == "a"
+        assert cache.get(("faq", 3)) == "c"
+        assert cache.get(("faq", 2)) is ContentCache.MISSING
+        assert len(cache) == 2
+        assert cache.stats() == {"hits": 3, "misses": 1, "entries": 2}
+
+    def test_ttl_expiry(self):
+        """Запись старше ttl считается промахом"""
+        cache = ContentCache(ttl_seconds=10)
+        with patch("hackathon_assistant.adapters.db.repositories.cached.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            cache.set(("rules", 1), "content")
+            mock_time.monotonic.return_value = 109.0
+            assert cache.get(("rules", 1)) == "content"
+            mock_time.monotonic.return_value = 111.0
+            assert cache.get(("rules", 1)) is ContentCache.MISSING
+
+        assert len(cache) == 0
+
+    def test_observe_version_drops_stale_content(self):
+        """Новая версия контента хакатона сбрасывает его записи репозиториев"""
+        cache = ContentCache()
+        cache.set(("faq", 1), "faq 1")
+        cache.set(("faq", 2), "faq 2")
+        cache.set((1, "faq", 0), "rendered")
+
+        cache.observe_version(1, 0)
+        cache.observe_version(1, 0)
+        assert cache.get(("faq", 1)) == "faq 1"
+
+        cache.observe_version(1, 1)
+        assert cache.get(("faq", 1)) is ContentCache.MISSING
+        assert cache.get(("faq", 2)) == "faq 2"
+
+    def test_observe_version_drops_old_rendered_replies(self):
+        """Готовые ответы старой версии удаляются сразу, а не ждут вытеснения"""
+        cache = ContentCache()
+        cache.set((1, "faq", 0), "old")
+        cache.set((2, "faq", 0), "other hackathon")
+        cache.observe_version(1, 0)
+
+        cache.observe_version(1, 1)
+        cache.set((1, "faq", 1), "new")
+
+        assert len(cache) == 2
+        assert cache.get((1, "faq", 1)) == "new"
+        assert cache.get((2, "faq", 0)) == "other hackathon"
+
+
+class TestCachedRepos:
+    """Тесты кэширующих декораторов репозиториев"""
+
+    @pytest.mark.asyncio
+    async def test_reads_hit_cache_until_write(self):
+        """Повторное чтение идёт из кэша, save_all сбрасывает запись хакатона"""
+        cache = ContentCache()
+        inner = AsyncMock()
+        inner.get_by_hackathon.return_value = [FAQItem(hackathon_id=1, question="Q", answer="A")]
+        inner.save_all.return_value = []
+        repo = CachedFAQRepo(inner, cache)
+
+        first = await repo.get_by_hackathon(1)
+        second = await repo.get_by_hackathon(1)
+        await repo.save_all([FAQItem(hackathon_id=1, question="Q2", answer="A2")])
+        await repo.get_by_hackathon(1)
+
+        assert first == second
+        assert first is not second
+        assert inner.get_by_hackathon.await_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_rules_are_cached(self):
+        """Отсутствие правил тоже кэшируется; save сбрасывает только свой хакатон"""
+        cache = ContentCache()
+        inner = AsyncMock()
+        inner.get_for_hackathon.return_value = None
+        repo = CachedRulesRepo(inner, cache)
+
+        assert await repo.get_for_hackathon(1) is None
+        assert await repo.get_for_hackathon(1) is None
+        await repo.get_for_hackathon(2)
+        await repo.save(Rules(hackathon_id=2, content="rules"))
+        await repo.get_for_hackathon(1)
+        await repo.get_for_hackathon(2)
+
+        assert [c.args[0] for c in inner.get_for_hackathon.await_args_list] == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_event_sections_are_separate(self):
+        """Расписание и FAQ одного хакатона кэшируются под разными ключами"""
+        cache = ContentCache()
+        events = AsyncMock()
+        events.get_by_hackathon.return_value = []
+        faq = AsyncMock()
+        faq.get_by_hackathon.return_value = []
+
+        await CachedEventRepo(events, cache).get_by_hackathon(1)
+        await CachedFAQRepo(faq, cache).get_by_hackathon(1)
+        await CachedEventRepo(events, cache).save_all([])
+
+        events.get_by_hackathon.assert_awaited_once_with(1)
+        faq.get_by_hackathon.assert_awaited_once_with(1)
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_again_after_commit(self, sqlite_session):
+        """Старые строки, прочитанные другой сессией до commit, не остаются в кэше"""
+        cache = ContentCache()
+        hackathon = await HackathonRepo(sqlite_session).save(
+            Hackathon(
+                code="HACK", name="Hack", start_at=datetime(2025, 1, 1), end_at=datetime(2025, 1, 2)
+            )
+        )
+        repo = CachedRulesRepo(RulesRepo(sqlite_session), cache, sqlite_session)
+
+        await repo.save(Rules(hackathon_id=hackathon.id, content="new rules"))
+        # параллельный читатель до commit видит старые (пустые) правила и кэширует их
+        cache.set(("rules", hackathon.id), None)
+        await sqlite_session.commit()
+
+        assert (await repo.get_for_hackathon(hackathon.id)).content == "new rules"
+
+
+class TestRenderedReplies:
+    """Тесты кэша готовых ответов /schedule, /rules, /faq"""
+
+    @pytest.fixture
+    def hackathon(self):
+        return HackathonDTO(
+            id=1,
+            name="Hack",
+            code="HACK",
+            description="",
+            start_at=datetime(2025, 1, 1),
+            end_at=datetime(2025, 1, 2),
+            is_active=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_reply_is_rendered_once_per_version(
+        self, mock_message, mock_use_cases, hackathon
+    ):
+        """Повторный /faq не ходит в use case, пока не изменилась версия контента"""
+        cache = ContentCache()
+        mock_use_cases.get_faq.execute.return_value = [FAQItemDTO(question="Q", answer="A")]
+
+        with patch(
+            "hackathon_assistant.adapters.bot.user.require_hackathon_selected",
+            AsyncMock(return_value=hackathon),
+        ):
+            await cmd_faq(mock_message, mock_use_cases, rendered_cache=cache)
+            await cmd_faq(mock_message, mock_use_cases, rendered_cache=cache)
+            hackathon.content_version = 1
+            await cmd_faq(mock_message, mock_use_cases, rendered_cache=cache)
+
+        assert mock_use_cases.get_faq.execute.await_count == 2
+        texts = [call.args[0] for call in mock_message.answer.call_args_list]
+        assert len(texts) == 3
+        assert texts[0] == texts[1] == texts[2]
+        assert "*1. Q*" in texts[0]
+
+
+class TestContentVersion:
+    """Тесты hackathons.content_version на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_content_writes_bump_version(self, sqlite_session):
+        """Запись расписания, правил и FAQ увеличивает версию, сохранение хакатона — нет"""
+        hackathons = HackathonRepo(sqlite_session)
+        hackathon = await hackathons.save(
+            Hackathon(
+                code="HACK",
+                name="Hack",
+                start_at=datetime(2025, 1, 1),
+                end_at=datetime(2025, 1, 2),
+            )
+        )
+        assert hackathon.content_version == 0
+
+        await EventRepo(sqlite_session).save_all(
+            [
+                Event(
+                    hackathon_id=hackathon.id,
+                    title="Start",
+                    starts_at=datetime(2025, 1, 1, 10),
+                    ends_at=datetime(2025, 1, 1, 11),
+                )
+            ]
+        )
+        await RulesRepo(sqlite_session).save(Rules(hackathon_id=hackathon.id, content="rules"))
+        await FAQRepo(sqlite_session).save_all(
+            [FAQItem(hackathon_id=hackathon.id, question="Q", answer="A")]
+        )
+        hackathon.name = "Hack 2"
+        await hackathons.save(hackathon)
+
+        reloaded = await hackathons.get_by_code("HACK")
+        assert reloaded.name == "Hack 2"
+        assert reloaded.content_version == 3
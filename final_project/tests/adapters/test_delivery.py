@@ -0,0 +1,387 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from hackathon_assistant.adapters.bot.broadcast import SendOutcome
+from hackathon_assistant.adapters.bot.delivery import DeliveryWorker
+from hackathon_assistant.adapters.db.models import Base
+from hackathon_assistant.adapters.db.repositories import OutboxRepo
+from hackathon_assistant.domain.models import DeliveryStatus, OutboxMessage
+
+
+def _messages(key: str, telegram_ids: list[int]) -> list[OutboxMessage]:
+    return [OutboxMessage(message_key=key, telegram_id=t, text="hello") for t in telegram_ids]
+
+
+def _outcomes(sent=(), failed=(), retry=(), cancelled=()) -> dict[SendOutcome, list[int]]:
+    return {
+        SendOutcome.SENT: list(sent),
+        SendOutcome.FAILED: list(failed),
+        SendOutcome.RETRY: list(retry),
+        SendOutcome.CANCELLED: list(cancelled),
+    }
+
+
+class TestOutboxRepo:
+    """Тесты OutboxRepo на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_ignores_duplicates(self, sqlite_session):
+        """Повторная постановка того же сообщения тому же получателю не создаёт строк"""
+        repo = OutboxRepo(sqlite_session)
+
+        assert await repo.enqueue(_messages("broadcast:1", [111, 222])) == 2
+        assert await repo.enqueue(_messages("broadcast:1", [222, 333])) == 1
+
+        counts = await repo.count_by_status("broadcast:1")
+        assert counts == {DeliveryStatus.PENDING: 3}
+
+    @pytest.mark.asyncio
+    async def test_claim_batch_does_not_return_claimed_rows(self, sqlite_session):
+        """Забранные строки не выдаются повторно, пока аренда не истекла"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111, 222, 333]))
+
+        first = await repo.claim_batch(limit=2, lease_seconds=60)
+        second = await repo.claim_batch(limit=2, lease_seconds=60)
+
+        assert [m.telegram_id for m in first] == [111, 222]
+        assert [m.telegram_id for m in second] == [333]
+        assert all(m.status == DeliveryStatus.IN_PROGRESS for m in first + second)
+        assert all(m.attempts == 1 for m in first + second)
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_claimed_again(self, sqlite_session):
+        """После падения воркера строки возвращаются в работу по истечении аренды"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("reminder:1", [111]))
+
+        claimed = await repo.claim_batch(limit=10, lease_seconds=-1)
+        reclaimed = await repo.claim_batch(limit=10, lease_seconds=60)
+
+        assert [m.id for m in reclaimed] == [m.id for m in claimed]
+        assert reclaimed[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_mark_sent_and_failed(self, sqlite_session):
+        """Завершённые строки больше не забираются"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111, 222]))
+        first, second = await repo.claim_batch(limit=10, lease_seconds=60)
+
+        await repo.mark_sent([first.id])
+        await repo.mark_failed([second.id], "blocked")
+
+        assert await repo.claim_batch(limit=10, lease_seconds=-1) == []
+        counts = await repo.count_by_status("broadcast:1")
+        assert counts == {DeliveryStatus.SENT: 1, DeliveryStatus.FAILED: 1}
+
+    @pytest.mark.asyncio
+    async def test_retry_later_delays_next_claim(self, sqlite_session):
+        """Строка с временной ошибкой возвращается в очередь, но не раньше паузы"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111, 222]))
+        first, second = await repo.claim_batch(limit=10, lease_seconds=60)
+
+        await repo.retry_later([first.id], delay_seconds=60, error="timeout")
+        await repo.retry_later([second.id], delay_seconds=-1, error="timeout")
+
+        reclaimed = await repo.claim_batch(limit=10, lease_seconds=60)
+        assert [(m.id, m.attempts) for m in reclaimed] == [(second.id, 2)]
+        counts = await repo.count_by_status("broadcast:1")
+        assert counts == {DeliveryStatus.PENDING: 1, DeliveryStatus.IN_PROGRESS: 1}
+
+    @pytest.mark.asyncio
+    async def test_extend_lease_keeps_rows_claimed(self, sqlite_session):
+        """Продлённая аренда не даёт забрать строку второй раз"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111]))
+        claimed = await repo.claim_batch(limit=10, lease_seconds=-1)
+
+        await repo.extend_lease([m.id for m in claimed], lease_seconds=60)
+
+        assert await repo.claim_batch(limit=10, lease_seconds=60) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_finished_keeps_queued_rows(self, sqlite_session):
+        """Очистка удаляет только завершённые строки и не больше limit за раз"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111, 222, 333, 444]))
+        first, second, third = await repo.claim_batch(limit=3, lease_seconds=60)
+        await repo.mark_sent([first.id, second.id])
+        await repo.mark_failed([third.id], "blocked")
+        later = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+        assert await repo.delete_finished(older_than=later, limit=2) == 2
+        assert await repo.delete_finished(older_than=later, limit=2) == 1
+        assert await repo.delete_finished(older_than=later - timedelta(days=1), limit=2) == 0
+        counts = await repo.count_by_status("broadcast:1")
+        assert counts == {DeliveryStatus.PENDING: 1}
+
+    @pytest.mark.asyncio
+    async def test_finished_reports_are_taken_once(self, sqlite_session):
+        """Итог забирается, только когда по рассылке не осталось сообщений в очереди"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111, 222]))
+        await repo.add_report("broadcast:1", chat_id=999)
+        await repo.add_report("broadcast:2", chat_id=998)
+        first, second = await repo.claim_batch(limit=10, lease_seconds=60)
+        await repo.mark_sent([first.id])
+
+        assert await repo.take_finished_reports() == [("broadcast:2", 998)]
+
+        await repo.mark_failed([second.id], "blocked")
+        assert await repo.take_finished_reports() == [("broadcast:1", 999)]
+        assert await repo.take_finished_reports() == []
+
+    @pytest.mark.asyncio
+    async def test_release_returns_rows_without_attempt(self, sqlite_session):
+        """Возвращённая строка снова в очереди, попытка не засчитана"""
+        repo = OutboxRepo(sqlite_session)
+        await repo.enqueue(_messages("broadcast:1", [111]))
+        claimed = await repo.claim_batch(limit=10, lease_seconds=60)
+
+        await repo.release([m.id for m in claimed])
+
+        reclaimed = await repo.claim_batch(limit=10, lease_seconds=60)
+        assert [(m.id, m.attempts) for m in reclaimed] == [(claimed[0].id, 1)]
+
+    @pytest.mark.asyncio
+    async def test_sender_lease_has_one_holder(self, sqlite_session):
+        """Аренду отправителя держит один процесс, пока она не истекла или не отпущена"""
+        repo = OutboxRepo(sqlite_session)
+
+        assert await repo.acquire_sender_lease("a", seconds=60)
+        assert not await repo.acquire_sender_lease("b", seconds=60)
+        assert await repo.acquire_sender_lease("a", seconds=-1)
+        assert await repo.acquire_sender_lease("b", seconds=60)
+        assert not await repo.acquire_sender_lease("a", seconds=60)
+
+        await repo.release_sender_lease("a")
+        assert not await repo.acquire_sender_lease("a", seconds=60)
+        await repo.release_sender_lease("b")
+        assert await repo.acquire_sender_lease("a", seconds=60)
+
+
+class TestDeliveryWorker:
+    """Тесты DeliveryWorker"""
+
+    @pytest.fixture
+    def outbox_repo(self):
+        repo = AsyncMock()
+        repo.acquire_sender_lease.return_value = True
+        repo.take_finished_reports.return_value = []
+        return repo
+
+    @pytest.fixture
+    def dispatcher(self):
+        dispatcher = MagicMock()
+        dispatcher.send_keyed = AsyncMock(return_value=_outcomes(sent=[1], failed=[2]))
+        dispatcher.send_one = AsyncMock(return_value=True)
+        return dispatcher
+
+    @pytest.fixture
+    def worker(self, dispatcher, outbox_repo, mock_session_factory):
+        return DeliveryWorker(
+            dispatcher,
+            session_cm_factory=lambda: mock_session_factory,
+            repo_factory=lambda session: outbox_repo,
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_once_marks_results(self, worker, dispatcher, outbox_repo):
+        """Результаты отправки записываются в outbox"""
+        batch = [
+            OutboxMessage(id=1, message_key="broadcast:1", telegram_id=111, text="hi"),
+            OutboxMessage(id=2, message_key="broadcast:1", telegram_id=222, text="hi"),
+        ]
+        outbox_repo.claim_batch.return_value = batch
+
+        processed = await worker.run_once()
+
+        assert processed == 2
+        assert list(dispatcher.send_keyed.call_args[0][0]) == [(1, 111, "hi"), (2, 222, "hi")]
+        outbox_repo.mark_sent.assert_awaited_once_with([1])
+        outbox_repo.mark_failed.assert_awaited_once_with([2], "delivery failed")
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried_with_backoff(self, worker, dispatcher, outbox_repo):
+        """Временная ошибка — повтор с растущей паузой; после max_attempts — FAILED"""
+        batch = [
+            OutboxMessage(id=1, message_key="b:1", telegram_id=111, text="hi", attempts=1),
+            OutboxMessage(id=2, message_key="b:1", telegram_id=222, text="hi", attempts=3),
+            OutboxMessage(id=3, message_key="b:1", telegram_id=333, text="hi", attempts=5),
+        ]
+        outbox_repo.claim_batch.return_value = batch
+        dispatcher.send_keyed.return_value = _outcomes(retry=[1, 2, 3])
+
+        await worker.run_once()
+
+        assert outbox_repo.retry_later.await_args_list == [
+            (([1], 30.0, "transient error, will retry"),),
+            (([2], 120.0, "transient error, will retry"),),
+        ]
+        assert outbox_repo.mark_failed.await_args_list[-1].args == (
+            [3],
+            "delivery failed after 5 attempts",
+        )
+
+    @pytest.mark.asyncio
+    async def test_leases_are_extended_while_sending(
+        self, dispatcher, outbox_repo, mock_session_factory
+    ):
+        """Долгая отправка (пауза RetryAfter) продлевает аренду строк и отправителя"""
+        worker = DeliveryWorker(
+            dispatcher,
+            session_cm_factory=lambda: mock_session_factory,
+            repo_factory=lambda session: outbox_repo,
+            lease_seconds=0.03,
+        )
+        outbox_repo.claim_batch.return_value = [
+            OutboxMessage(id=1, message_key="b:1", telegram_id=111, text="hi")
+        ]
+
+        async def slow_send(messages, should_stop):
+            list(messages)
+            await asyncio.sleep(0.05)
+            return _outcomes(sent=[1])
+
+        dispatcher.send_keyed.side_effect = slow_send
+
+        await worker.run_once()
+
+        assert outbox_repo.extend_lease.await_count >= 2
+        outbox_repo.extend_lease.assert_awaited_with([1], 0.03)
+        assert outbox_repo.acquire_sender_lease.await_count >= 3
+
+    @pytest.mark.asyncio
+    async def test_lost_sender_lease_stops_sending(
+        self, dispatcher, outbox_repo, mock_session_factory
+    ):
+        """Аренду забрал другой процесс: остаток пачки не отправляется и возвращается"""
+        worker = DeliveryWorker(
+            dispatcher,
+            session_cm_factory=lambda: mock_session_factory,
+            repo_factory=lambda session: outbox_repo,
+            lease_seconds=0.03,
+        )
+        outbox_repo.claim_batch.return_value = [
+            OutboxMessage(id=i, message_key="b:1", telegram_id=100 + i, text="hi")
+            for i in (1, 2, 3)
+        ]
+        outbox_repo.acquire_sender_lease.side_effect = [True, False]
+
+        async def slow_send(messages, should_stop):
+            outcomes = _outcomes()
+            for key, _, _ in messages:
+                if should_stop():
+                    outcomes[SendOutcome.CANCELLED].append(key)
+                    continue
+                outcomes[SendOutcome.SENT].append(key)
+                await asyncio.sleep(0.02)
+            return outcomes
+
+        dispatcher.send_keyed.side_effect = slow_send
+
+        await worker.run_once()
+
+        outbox_repo.mark_sent.assert_awaited_once_with([1])
+        outbox_repo.release.assert_awaited_once_with([2, 3])
+        outbox_repo.extend_lease.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prune_deletes_in_chunks(self, worker, outbox_repo):
+        """Очистка повторяется, пока удаляются полные части"""
+        outbox_repo.delete_finished.side_effect = [1000, 7]
+
+        assert await worker.prune() == 1007
+        assert outbox_repo.delete_finished.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_once_empty_queue(self, worker, dispatcher, outbox_repo):
+        """Пустая очередь: ничего не отправляется"""
+        outbox_repo.claim_batch.return_value = []
+
+        assert await worker.run_once() == 0
+        dispatcher.send_keyed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_once_without_sender_lease(self, worker, dispatcher, outbox_repo):
+        """Пока отправляет другой процесс, строки не забираются"""
+        outbox_repo.acquire_sender_lease.return_value = False
+
+        assert await worker.run_once() == 0
+        outbox_repo.claim_batch.assert_not_called()
+        dispatcher.send_keyed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reports_finished_broadcast(self, worker, dispatcher, outbox_repo):
+        """Итог рассылки отправляется один раз, когда очередь по ней опустела"""
+        outbox_repo.claim_batch.return_value = []
+        outbox_repo.count_by_status.return_value = {
+            DeliveryStatus.SENT: 3,
+            DeliveryStatus.FAILED: 1,
+        }
+        outbox_repo.take_finished_reports.side_effect = [[("broadcast:1", 999)], []]
+
+        await worker.run_once()
+        await worker.run_once()
+
+        dispatcher.send_one.assert_awaited_once()
+        chat_id, text = dispatcher.send_one.call_args[0]
+        assert chat_id == 999
+        assert "Успешно: 3" in text
+
+
+class TestDeliveryReportAcrossProcesses:
+    """Итог рассылки при нескольких процессах с общей БД"""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    def _worker(self, session_factory, holder: str) -> tuple[DeliveryWorker, MagicMock]:
+        dispatcher = MagicMock()
+        dispatcher.send_one = AsyncMock(return_value=True)
+
+        async def send_all(messages, should_stop):
+            return _outcomes(sent=[key for key, _, _ in messages])
+
+        dispatcher.send_keyed = AsyncMock(side_effect=send_all)
+        worker = DeliveryWorker(
+            dispatcher, session_cm_factory=session_factory, repo_factory=OutboxRepo, holder=holder
+        )
+        return worker, dispatcher
+
+    @pytest.mark.asyncio
+    async def test_report_of_non_sender_process_is_sent_by_sender(self, session_factory):
+        """/admin_broadcast принял процесс без аренды: итог присылает отправитель"""
+        sender, sender_dispatcher = self._worker(session_factory, "a")
+        other, other_dispatcher = self._worker(session_factory, "b")
+        assert await sender.run_once() == 0  # берёт аренду отправителя
+
+        # процесс b ставит рассылку в очередь вместе с адресатом итога
+        async with session_factory() as session:
+            repo = OutboxRepo(session)
+            await repo.enqueue(_messages("broadcast:1", [111, 222]))
+            await repo.add_report("broadcast:1", chat_id=999)
+            await session.commit()
+
+        assert await other.run_once() == 0
+        assert await sender.run_once() == 2
+        await other.run_once()
+
+        other_dispatcher.send_keyed.assert_not_called()
+        other_dispatcher.send_one.assert_not_called()
+        sender_dispatcher.send_one.assert_awaited_once()
+        chat_id, text = sender_dispatcher.send_one.call_args[0]
+        assert chat_id == 999
+        assert "Успешно: 2" in text
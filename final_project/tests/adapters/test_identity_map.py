@@ -0,0 +1,95 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from hackathon_assistant.adapters.db.repositories import HackathonRepo, UserRepo
+from hackathon_assistant.domain.models import Hackathon, User, UserRole
+from hackathon_assistant.infra.usecase_provider import build_use_case_provider
+
+
+@pytest.fixture
+def statements(sqlite_session):
+    """SQL-запросы, выполненные через сессию"""
+    executed: list[str] = []
+    engine = sqlite_session.get_bind()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _seed(session) -> Hackathon:
+    hackathon = await HackathonRepo(session).save(
+        Hackathon(
+            code="HACK",
+            name="Hack",
+            start_at=datetime(2025, 1, 1),
+            end_at=datetime(2025, 1, 2),
+        )
+    )
+    await UserRepo(session).save(
+        User(
+            telegram_id=42,
+            username="u",
+            first_name="F",
+            last_name="L",
+            role=UserRole.PARTICIPANT,
+            current_hackathon_id=hackathon.id,
+        )
+    )
+    return hackathon
+
+
+class TestIdentityMap:
+    """Тесты identity map в пределах одной сессии"""
+
+    @pytest.mark.asyncio
+    async def test_schedule_command_loads_user_once(self, sqlite_session, statements):
+        """/schedule: проверка хакатона и расписание читают пользователя один раз"""
+        await _seed(sqlite_session)
+        sqlite_session.info.clear()
+        statements.clear()
+        use_cases = build_use_case_provider(sqlite_session, bot=MagicMock())
+
+        hackathon, _ = await use_cases.get_hackathon_info.execute(telegram_id=42)
+        await use_cases.get_hackathon_info.execute(telegram_id=42)
+        schedule = await use_cases.get_schedule.execute(telegram_id=42)
+
+        assert hackathon.code == "HACK"
+        assert schedule == []
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert sum("FROM users" in s for s in selects) == 1
+        assert sum("FROM hackathons" in s for s in selects) == 1
+        assert sum("FROM reminder_subscriptions" in s for s in selects) == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_map_current(self, sqlite_session):
+        """После записи в той же сессии читается новое состояние"""
+        await _seed(sqlite_session)
+        other = await HackathonRepo(sqlite_session).save(
+            Hackathon(
+                code="OTHER",
+                name="Other",
+                start_at=datetime(2025, 2, 1),
+                end_at=datetime(2025, 2, 2),
+            )
+        )
+        use_cases = build_use_case_provider(sqlite_session, bot=MagicMock())
+
+        await use_cases.get_hackathon_info.execute(telegram_id=42)
+        await use_cases.select_hackathon_by_code.execute(telegram_id=42, hackathon_code="OTHER")
+        hackathon, subscribed = await use_cases.get_hackathon_info.execute(telegram_id=42)
+        assert (hackathon.id, subscribed) == (other.id, False)
+
+        await use_cases.subscribe_notifications.execute(telegram_id=42)
+        _, subscribed = await use_cases.get_hackathon_info.execute(telegram_id=42)
+        assert subscribed is True
+
+        await UserRepo(sqlite_session).mark_unreachable([42])
+        user = await UserRepo(sqlite_session).get_by_telegram_id(42)
+        assert user.unreachable_since is not None
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from hackathon_assistant.adapters.db.models import UserORM
+from hackathon_assistant.adapters.db.repositories import UserRepo
+from hackathon_assistant.adapters.db.repositories.mappers import RowMapper, to_dataclass
+from hackathon_assistant.domain.models import Event, EventType, FAQItem, User, UserRole
+
+
+class TestRowMapper:
+    """Тесты скомпилированного отображения строки в dataclass"""
+
+    def test_matches_to_dataclass(self):
+        """Результат совпадает с to_dataclass, лишние колонки пропускаются"""
+        columns = ("id", "hackathon_id", "question", "answer", "created_at")
+        row = (5, 1, "Q?", "A", datetime(2025, 1, 1))
+        mapped = RowMapper(FAQItem, columns)(row)
+        assert mapped == to_dataclass(FAQItem, dict(zip(columns, row, strict=True)))
+        assert not hasattr(mapped, "created_at")
+
+    def test_missing_columns_get_defaults(self):
+        """Поля без колонки получают значения по умолчанию, в т.ч. из default_factory"""
+        mapper = RowMapper(Event, ("hackathon_id", "title"))
+        first, second = mapper.all([(1, "Open"), (1, "Close")])
+        assert (first.type, first.location, first.id) == (EventType.OTHER, None, None)
+        assert isinstance(first.starts_at, datetime)
+        assert second.title == "Close"
+
+    def test_field_without_column_and_default(self):
+        """Обязательное поле без колонки — ошибка при компиляции, а не на строке"""
+        with pytest.raises(ValueError, match="title"):
+            RowMapper(Event, ("id", "hackathon_id"))
+
+    def test_not_a_dataclass(self):
+        with pytest.raises(TypeError):
+            RowMapper(dict, ("id",))
+
+    def test_trusted_skips_validation(self):
+        """trusted=True не повторяет __post_init__, trusted=False проверяет строку"""
+        columns = ("hackathon_id", "question", "answer")
+        row = (1, "", "A")
+        assert RowMapper(FAQItem, columns)(row).question == ""
+        with pytest.raises(ValueError):
+            RowMapper(FAQItem, columns, trusted=False)(row)
+
+    @pytest.mark.asyncio
+    async def test_core_row_from_table_columns(self, sqlite_session):
+        """Строка select(*table.c) отображается по позициям, без ORM-объектов"""
+        await UserRepo(sqlite_session).save(
+            User(telegram_id=42, username="u", role=UserRole.ORGANIZER)
+        )
+        columns = tuple(UserORM.__table__.c)
+        row = (await sqlite_session.execute(select(*columns))).one()
+
+        user = RowMapper(User, columns)(row)
+        assert user == to_dataclass(User, dict(row._mapping))
+        assert user.role is UserRole.ORGANIZER
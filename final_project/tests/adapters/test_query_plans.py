@@ -0,0 +1,276 @@
+import asyncio
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from hackathon_assistant.adapters.db.models import (
+    Base,
+    DeliveryOutboxORM,
+    EventORM,
+    FAQItemORM,
+    HackathonORM,
+    ReminderSubscriptionORM,
+    RulesORM,
+    UserORM,
+)
+from hackathon_assistant.adapters.db.repositories import (
+    EventRepo,
+    FAQRepo,
+    HackathonCountersRepo,
+    HackathonRepo,
+    OutboxRepo,
+    RulesRepo,
+    SentReminderRepo,
+    SubscriptionRepo,
+    UserRepo,
+)
+from hackathon_assistant.domain.models import DeliveryStatus, EventType, UserRole
+from hackathon_assistant.use_cases.dto import AudienceSegmentDTO
+
+HACKATHONS = 20
+USERS_PER_HACKATHON = 1000
+EVENTS_PER_HACKATHON = 200
+FAQ_PER_HACKATHON = 50
+OUTBOX_ROWS = 5000
+HACK = 7
+TABLES = set(Base.metadata.tables)
+
+
+async def _seed(url: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        now = datetime.now(UTC).replace(tzinfo=None)
+        await conn.execute(
+            insert(HackathonORM),
+            [
+                {
+                    "id": h,
+                    "code": f"H{h}",
+                    "name": f"Hack {h}",
+                    "start_at": now,
+                    "end_at": now + timedelta(days=2),
+                    "is_active": h % 4 != 0,
+                }
+                for h in range(1, HACKATHONS + 1)
+            ],
+        )
+        users = [
+            {
+                "id": i,
+                "telegram_id": 10_000 + i,
+                "role": UserRole.ORGANIZER if i % 50 == 0 else UserRole.PARTICIPANT,
+                "current_hackathon_id": i % HACKATHONS + 1,
+            }
+            for i in range(1, HACKATHONS * USERS_PER_HACKATHON + 1)
+        ]
+        await conn.execute(insert(UserORM), users)
+        await conn.execute(
+            insert(ReminderSubscriptionORM),
+            [
+                {"user_id": u["id"], "hackathon_id": u["current_hackathon_id"], "enabled": True}
+                for u in users
+                if u["id"] % 3
+            ],
+        )
+        await conn.execute(
+            insert(EventORM),
+            [
+                {
+                    "hackathon_id": h,
+                    "title": f"Event {i}",
+                    "type": EventType.OTHER,
+                    "starts_at": now + timedelta(minutes=15 * i),
+                    "ends_at": now + timedelta(minutes=15 * i + 10),
+                }
+                for h in range(1, HACKATHONS + 1)
+                for i in range(EVENTS_PER_HACKATHON)
+            ],
+        )
+        await conn.execute(
+            insert(FAQItemORM),
+            [
+                {"hackathon_id": h, "question": f"Q{i}", "answer": "A"}
+                for h in range(1, HACKATHONS + 1)
+                for i in range(FAQ_PER_HACKATHON)
+            ],
+        )
+        await conn.execute(
+            insert(RulesORM),
+            [{"hackathon_id": h, "content": "rules"} for h in range(1, HACKATHONS + 1)],
+        )
+        await conn.execute(
+            insert(DeliveryOutboxORM),
+            [
+                {
+                    "message_key": f"broadcast:{i // 1000}",
+                    "telegram_id": 10_000 + i,
+                    "text": "hello",
+                    "status": (
+                        DeliveryStatus.SENT if i < OUTBOX_ROWS - 100 else DeliveryStatus.PENDING
+                    ),
+                    "attempts": 0,
+                    "created_at": now,
+                }
+                for i in range(OUTBOX_ROWS)
+            ],
+        )
+        # без ANALYZE, как в рабочей базе бота: планировщик опирается только на схему
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory):
+    """Файл SQLite с объёмом данных, при котором полный просмотр заметен"""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}"
+    asyncio.run(_seed(url))
+    return url
+
+
+@pytest_asyncio.fixture
+async def session(database_url):
+    engine = create_async_engine(database_url)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+        await session.rollback()
+    await engine.dispose()
+
+
+async def _drain(iterator) -> None:
+    async for _ in iterator:
+        pass
+
+
+# напоминания по всем активным хакатонам: частичный индекс содержит только включённые
+# подписки (у завершённых хакатонов они выключены), его просмотр и есть выборка
+_ENABLED_SUBSCRIPTIONS = ("hackathons", "ix_reminder_subscriptions_enabled_hackathon_id")
+
+# (название, вызов репозитория, таблицы или индексы, которые допустимо просматривать целиком)
+CASES = [
+    ("UserRepo.get_by_telegram_id", lambda s: UserRepo(s).get_by_telegram_id(10_042), ()),
+    ("UserRepo.count_by_hackathon", lambda s: UserRepo(s).count_by_hackathon(HACK), ()),
+    (
+        "UserRepo.upsert_profile",
+        lambda s: UserRepo(s).upsert_profile(10_042, "u", "F", "L"),
+        (),
+    ),
+    (
+        "UserRepo.get_audience",
+        lambda s: UserRepo(s).get_audience(HACK, AudienceSegmentDTO(role=UserRole.PARTICIPANT)),
+        (),
+    ),
+    (
+        "UserRepo.iter_audience",
+        lambda s: _drain(
+            UserRepo(s).iter_audience(HACK, AudienceSegmentDTO(subscribed_only=False))
+        ),
+        (),
+    ),
+    ("HackathonRepo.get_by_code", lambda s: HackathonRepo(s).get_by_code("H7"), ()),
+    ("HackathonRepo.get_by_id", lambda s: HackathonRepo(s).get_by_id(HACK), ()),
+    # хакатонов единицы, активные выбираются просмотром
+    ("HackathonRepo.get_all_active", lambda s: HackathonRepo(s).get_all_active(), ("hackathons",)),
+    ("EventRepo.get_by_hackathon", lambda s: EventRepo(s).get_by_hackathon(HACK), ()),
+    (
+        "EventRepo.get_upcoming_events",
+        lambda s: EventRepo(s).get_upcoming_events(HACK, hours_ahead=24),
+        (),
+    ),
+    (
+        "EventRepo.get_upcoming_for_active",
+        lambda s: EventRepo(s).get_upcoming_for_active(hours_ahead=24),
+        ("hackathons",),
+    ),
+    ("FAQRepo.get_by_hackathon", lambda s: FAQRepo(s).get_by_hackathon(HACK), ()),
+    ("RulesRepo.get_for_hackathon", lambda s: RulesRepo(s).get_for_hackathon(HACK), ()),
+    (
+        "SubscriptionRepo.get_user_subscription",
+        lambda s: SubscriptionRepo(s).get_user_subscription(42, HACK),
+        (),
+    ),
+    (
+        "SubscriptionRepo.set_subscription",
+        lambda s: SubscriptionRepo(s).set_subscription(10_042, enabled=True),
+        (),
+    ),
+    (
+        "SubscriptionRepo.get_subscribed_users",
+        lambda s: SubscriptionRepo(s).get_subscribed_users(HACK),
+        (),
+    ),
+    (
+        "SubscriptionRepo.get_reminder_targets",
+        lambda s: SubscriptionRepo(s).get_reminder_targets(hours_ahead=1),
+        _ENABLED_SUBSCRIPTIONS,
+    ),
+    (
+        "SubscriptionRepo.count_subscribed_users",
+        lambda s: SubscriptionRepo(s).count_subscribed_users(HACK),
+        (),
+    ),
+    (
+        "SubscriptionRepo.disable_all_for_hackathon",
+        lambda s: SubscriptionRepo(s).disable_all_for_hackathon(HACK),
+        (),
+    ),
+    (
+        "SentReminderRepo.get_owed",
+        lambda s: SentReminderRepo(s).get_owed(hours_ahead=1, offset_minutes=60),
+        _ENABLED_SUBSCRIPTIONS,
+    ),
+    (
+        "HackathonCountersRepo.get_by_hackathon",
+        lambda s: HackathonCountersRepo(s).get_by_hackathon(HACK),
+        (),
+    ),
+    (
+        "OutboxRepo.claim_batch",
+        lambda s: OutboxRepo(s).claim_batch(limit=50, lease_seconds=60),
+        (),
+    ),
+    ("OutboxRepo.count_by_status", lambda s: OutboxRepo(s).count_by_status("broadcast:1"), ()),
+    (
+        "OutboxRepo.delete_finished",
+        lambda s: OutboxRepo(s).delete_finished(datetime(2000, 1, 1), limit=100),
+        (),
+    ),
+]
+
+# "SCAN users" — полный просмотр; "SCAN users USING INDEX ..." — просмотр индекса целиком
+_FULL_SCAN = re.compile(r"\bSCAN (\w+)(?: USING (?:COVERING )?INDEX (\w+))?")
+
+
+class TestQueryPlans:
+    """EXPLAIN QUERY PLAN для запросов репозиториев на заполненной SQLite"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("name", "call", "allowed"), CASES, ids=[case[0] for case in CASES])
+    async def test_no_full_table_scan(self, session, name, call, allowed):
+        """Ни один запрос метода не просматривает большую таблицу целиком"""
+        executed: list[tuple[str, tuple]] = []
+        engine = session.get_bind()
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not executemany:
+                executed.append((statement, tuple(parameters)))
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            await call(session)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert executed, f"{name} не выполнил ни одного запроса"
+        connection = await session.connection()
+        for statement, parameters in executed:
+            plan = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            for row in plan:
+                detail = row[-1]
+                # просмотр индекса целиком читает столько же строк, сколько и таблицы
+                for table, index in _FULL_SCAN.findall(detail):
+                    if table in TABLES and table not in allowed and index not in allowed:
+                        pytest.fail(f"{name}: full scan of {table}\n{statement}\n{detail}")
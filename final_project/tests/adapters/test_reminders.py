@@ -0,0 +1,263 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hackathon_assistant.adapters.bot.reminders import ReminderSchedule, ReminderService
+from hackathon_assistant.adapters.db.repositories import EventRepo, HackathonRepo
+from hackathon_assistant.domain.models import Event, Hackathon
+from hackathon_assistant.use_cases.dto import RecipientBatch, ReminderEventDTO, ReminderPileDTO
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _event(event_id: int | None, hackathon_id: int, starts_at: datetime) -> Event:
+    return Event(
+        id=event_id,
+        hackathon_id=hackathon_id,
+        title=f"Event {event_id}",
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=1),
+    )
+
+
+class TestReminderSchedule:
+    """Тесты min-heap расписания напоминаний"""
+
+    def test_pop_due_returns_hackathons_in_due_order(self):
+        """Снимаются только наступившие напоминания"""
+        now = _now()
+        schedule = ReminderSchedule(timedelta(hours=1))
+        schedule.add(
+            [
+                _event(1, 10, now + timedelta(hours=3)),
+                _event(2, 20, now + timedelta(minutes=30)),
+                _event(3, 30, now + timedelta(hours=2)),
+            ],
+            now,
+        )
+
+        assert schedule.next_due() == now - timedelta(minutes=30)
+        assert schedule.pop_due(now) == {20}
+        assert schedule.next_due() == now + timedelta(hours=1)
+        assert schedule.pop_due(now + timedelta(hours=1)) == {30}
+        assert len(schedule) == 1
+
+    def test_add_skips_duplicates_and_started_events(self):
+        """Повторная загрузка не дублирует записи, начавшиеся события не планируются"""
+        now = _now()
+        schedule = ReminderSchedule(timedelta(hours=1))
+        events = [_event(1, 10, now + timedelta(hours=2)), _event(2, 10, now - timedelta(hours=1))]
+
+        schedule.add(events, now)
+        schedule.add(events, now)
+
+        assert len(schedule) == 1
+
+    def test_fired_reminder_is_due_again_on_reload(self):
+        """
+        Перечитывание после срабатывания снова делает событие в окне наступившим
+
+        Напоминание получат подписавшиеся позже; уже получившим его не даст журнал.
+        """
+        now = _now()
+        schedule = ReminderSchedule(timedelta(hours=1))
+        events = [_event(1, 10, now + timedelta(minutes=30))]
+        schedule.add(events, now)
+        assert schedule.pop_due(now) == {10}
+        assert len(schedule) == 0
+
+        later = now + timedelta(minutes=10)
+        schedule.add(events, later)
+        schedule.add(events, later)
+        assert len(schedule) == 1
+        assert schedule.pop_due(later) == {10}
+
+        # событие началось — больше не планируется
+        schedule.add(events, now + timedelta(minutes=31))
+        assert len(schedule) == 0
+
+
+class TestEventRepoSchedule:
+    """Тесты EventRepo для расписания напоминаний на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_save_all_notifies_listener_after_commit(self, sqlite_session):
+        """Слушатель получает сохранённые события с id только после commit"""
+        now = _now()
+        hackathon = await HackathonRepo(sqlite_session).save(
+            Hackathon(code="HACK", name="Hack", start_at=now, end_at=now + timedelta(days=1))
+        )
+        listener = MagicMock()
+
+        saved = await EventRepo(sqlite_session, listener=listener).save_all(
+            [_event(None, hackathon.id, now + timedelta(hours=2))]
+        )
+        listener.events_saved.assert_not_called()
+
+        await sqlite_session.commit()
+        listener.events_saved.assert_called_once_with(saved)
+        assert saved[0].id is not None
+
+        await sqlite_session.commit()
+        listener.events_saved.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_events_are_not_notified(self, sqlite_session):
+        now = _now()
+        hackathon = await HackathonRepo(sqlite_session).save(
+            Hackathon(code="HACK", name="Hack", start_at=now, end_at=now + timedelta(days=1))
+        )
+        await sqlite_session.commit()
+        listener = MagicMock()
+
+        await EventRepo(sqlite_session, listener=listener).save_all(
+            [_event(None, hackathon.id, now + timedelta(hours=2))]
+        )
+        await sqlite_session.rollback()
+        await sqlite_session.commit()
+
+        listener.events_saved.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_upcoming_for_active_skips_inactive_hackathons(self, sqlite_session):
+        """В расписание попадают только будущие события активных хакатонов"""
+        now = _now()
+        repo = HackathonRepo(sqlite_session)
+        active = await repo.save(
+            Hackathon(code="A", name="A", start_at=now, end_at=now + timedelta(days=1))
+        )
+        inactive = await repo.save(
+            Hackathon(
+                code="B",
+                name="B",
+                start_at=now,
+                end_at=now + timedelta(days=1),
+                is_active=False,
+            )
+        )
+        await EventRepo(sqlite_session).save_all(
+            [
+                _event(None, active.id, now + timedelta(hours=2)),
+                _event(None, active.id, now + timedelta(hours=30)),
+                _event(None, active.id, now - timedelta(hours=1)),
+                _event(None, inactive.id, now + timedelta(hours=2)),
+            ]
+        )
+
+        events = await EventRepo(sqlite_session).get_upcoming_for_active(hours_ahead=24)
+
+        assert [(e.hackathon_id, e.starts_at) for e in events] == [
+            (active.id, now + timedelta(hours=2))
+        ]
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield MagicMock()
+
+
+class TestScheduledReminders:
+    """Тесты ReminderService в режиме расписания"""
+
+    @pytest.mark.asyncio
+    async def test_fires_due_and_newly_saved_events(self, mock_bot):
+        """Напоминание уходит сразу по наступлении срока, в т.ч. для событий из events_saved"""
+        now = _now()
+        use_cases = MagicMock()
+        event_repo = use_cases.repos.event_repo.return_value
+        event_repo.get_upcoming_for_active = AsyncMock(
+            return_value=[
+                _event(1, 10, now + timedelta(minutes=30)),
+                _event(2, 20, now + timedelta(hours=5)),
+            ]
+        )
+        service = ReminderService(mock_bot, lambda session: use_cases)
+        fired = asyncio.Queue()
+        service.send_upcoming_event_reminders = AsyncMock(
+            side_effect=lambda hackathon_ids: fired.put_nowait(hackathon_ids)
+        )
+
+        with patch("hackathon_assistant.adapters.bot.reminders.get_session", _fake_session):
+            await service.start_scheduled_reminders(resync_minutes=60)
+            try:
+                assert await asyncio.wait_for(fired.get(), timeout=1) == {10}
+
+                service.events_saved([_event(3, 30, _now() + timedelta(minutes=59))])
+                assert await asyncio.wait_for(fired.get(), timeout=1) == {30}
+            finally:
+                await service.stop_periodic_reminders()
+
+        event_repo.get_upcoming_for_active.assert_awaited_once_with(hours_ahead=24)
+        assert fired.empty()
+
+    @pytest.mark.asyncio
+    async def test_event_in_window_fires_again_on_resync(self, mock_bot):
+        """После перечитывания событие в окне снова обрабатывается: поздним подписчикам"""
+        use_cases = MagicMock()
+        event_repo = use_cases.repos.event_repo.return_value
+        event_repo.get_upcoming_for_active = AsyncMock(
+            return_value=[_event(1, 10, _now() + timedelta(minutes=30))]
+        )
+        service = ReminderService(mock_bot, lambda session: use_cases)
+        fired = asyncio.Queue()
+        service.send_upcoming_event_reminders = AsyncMock(
+            side_effect=lambda hackathon_ids: fired.put_nowait(hackathon_ids)
+        )
+
+        with patch("hackathon_assistant.adapters.bot.reminders.get_session", _fake_session):
+            await service.start_scheduled_reminders(resync_minutes=0.001)
+            try:
+                assert await asyncio.wait_for(fired.get(), timeout=1) == {10}
+                assert await asyncio.wait_for(fired.get(), timeout=1) == {10}
+            finally:
+                await service.stop_periodic_reminders()
+
+        assert event_repo.get_upcoming_for_active.await_count >= 2
+
+
+class TestReminderDigest:
+    """ReminderService с дайджестом напоминаний"""
+
+    @pytest.mark.asyncio
+    async def test_digest_is_sent_per_chunk(self, mock_bot):
+        """Части планируются по пользователям, каждая отправляется и фиксируется сразу"""
+        starts_at = _now() + timedelta(minutes=30)
+
+        def pile(event_id, pairs):
+            return ReminderPileDTO(
+                event=ReminderEventDTO(
+                    event_id=event_id, title=f"Event {event_id}", starts_at=starts_at
+                ),
+                participants=RecipientBatch.from_pairs(pairs),
+            )
+
+        plan_kwargs = {}
+        sent_before_next_chunk = []
+
+        async def plan_chunks(**kwargs):
+            plan_kwargs.update(kwargs)
+            yield [pile(1, [(1, 111)]), pile(2, [(1, 111)])]
+            sent_before_next_chunk.append(mock_bot.send_message.call_count)
+            yield [pile(1, [(2, 222)])]
+
+        use_cases = MagicMock()
+        use_cases.process_reminders.plan_chunks = plan_chunks
+        use_cases.repos.user_repo.return_value = AsyncMock()
+        use_cases.uow = AsyncMock()
+        service = ReminderService(mock_bot, lambda session: use_cases, digest=True)
+
+        with patch("hackathon_assistant.adapters.bot.reminders.get_session", _fake_session):
+            await service.send_upcoming_event_reminders()
+
+        assert plan_kwargs["by_user"] is True
+        assert sent_before_next_chunk == [1]
+        assert use_cases.uow.commit.await_count == 2
+        texts = {call.args[0]: call.args[1] for call in mock_bot.send_message.call_args_list}
+        assert mock_bot.send_message.call_count == 2
+        assert "Event 1" in texts[111] and "Event 2" in texts[111]
+        assert "Event 2" not in texts[222]
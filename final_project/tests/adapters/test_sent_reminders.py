@@ -0,0 +1,225 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from hackathon_assistant.adapters.db.repositories import (
+    EventRepo,
+    HackathonRepo,
+    OutboxRepo,
+    SentReminderRepo,
+    SubscriptionRepo,
+    UserRepo,
+)
+from hackathon_assistant.domain.models import (
+    DeliveryStatus,
+    Event,
+    Hackathon,
+    ReminderSubscription,
+    SentReminder,
+    User,
+)
+from hackathon_assistant.infra.usecase_provider import build_use_case_provider
+from hackathon_assistant.use_cases.dto import AudienceSegmentDTO
+from hackathon_assistant.use_cases.send_reminder import SendRemindersUseCase
+
+
+@pytest.fixture
+async def seeded(sqlite_session):
+    """Хакатон с двумя подписчиками, одним отписанным и двумя событиями"""
+    now = datetime.now(UTC).replace(tzinfo=None)
+    hackathon = await HackathonRepo(sqlite_session).save(
+        Hackathon(code="HACK", name="Hack", start_at=now, end_at=now + timedelta(days=1))
+    )
+    users = [
+        await UserRepo(sqlite_session).save(User(telegram_id=tg, current_hackathon_id=hackathon.id))
+        for tg in (111, 222, 333)
+    ]
+    for user, enabled in zip(users, (True, True, False), strict=True):
+        await SubscriptionRepo(sqlite_session).save(
+            ReminderSubscription(user_id=user.id, hackathon_id=hackathon.id, enabled=enabled)
+        )
+    events = await EventRepo(sqlite_session).save_all(
+        [
+            Event(
+                hackathon_id=hackathon.id,
+                title="Soon",
+                starts_at=now + timedelta(minutes=20),
+                ends_at=now + timedelta(minutes=80),
+            ),
+            Event(
+                hackathon_id=hackathon.id,
+                title="Tomorrow",
+                starts_at=now + timedelta(hours=20),
+                ends_at=now + timedelta(hours=21),
+            ),
+        ]
+    )
+    return hackathon, users, events
+
+
+class TestSentReminderRepo:
+    """Тесты журнала sent_reminders на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_get_owed_returns_subscribed_pairs_in_window(self, sqlite_session, seeded):
+        """В выборку попадают только события в окне и только включённые подписки"""
+        hackathon, _, events = seeded
+
+        owed = await SentReminderRepo(sqlite_session).get_owed(hours_ahead=1, offset_minutes=60)
+
+        assert [(e.id, tg) for e, _, tg in owed] == [(events[0].id, 111), (events[0].id, 222)]
+        assert owed[0][0] is owed[1][0]
+
+    @pytest.mark.asyncio
+    async def test_recorded_reminders_are_not_owed(self, sqlite_session, seeded):
+        """Записанные в журнал напоминания исключаются анти-джойном"""
+        hackathon, users, events = seeded
+        repo = SentReminderRepo(sqlite_session)
+
+        inserted = await repo.record(
+            [SentReminder(event_id=events[0].id, user_id=users[0].id, offset_minutes=60)] * 2
+        )
+        owed = await repo.get_owed(hours_ahead=1, offset_minutes=60)
+        other_offset = await repo.get_owed(hours_ahead=1, offset_minutes=15)
+
+        assert inserted == 1
+        assert [tg for _, _, tg in owed] == [222]
+        assert [tg for _, _, tg in other_offset] == [111, 222]
+
+
+class TestReminderTargets:
+    """Тесты выборки получателей напоминаний по всем хакатонам на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_targets_cover_all_active_hackathons(self, sqlite_session, seeded):
+        """Одна выборка возвращает пары по всем активным хакатонам и учитывает фильтр"""
+        hackathon, users, events = seeded
+        now = datetime.now(UTC).replace(tzinfo=None)
+        other = await HackathonRepo(sqlite_session).save(
+            Hackathon(code="OTHER", name="Other", start_at=now, end_at=now + timedelta(days=1))
+        )
+        await SubscriptionRepo(sqlite_session).save(
+            ReminderSubscription(user_id=users[2].id, hackathon_id=other.id, enabled=True)
+        )
+        [other_event] = await EventRepo(sqlite_session).save_all(
+            [
+                Event(
+                    hackathon_id=other.id,
+                    title="Other soon",
+                    starts_at=now + timedelta(minutes=40),
+                    ends_at=now + timedelta(minutes=90),
+                )
+            ]
+        )
+        repo = SubscriptionRepo(sqlite_session)
+
+        targets = await repo.get_reminder_targets(hours_ahead=1)
+        only_other = await repo.get_reminder_targets(hours_ahead=1, hackathon_ids=[other.id])
+
+        assert [(e.id, tg) for e, _, tg in targets] == [
+            (events[0].id, 111),
+            (events[0].id, 222),
+            (other_event.id, 333),
+        ]
+        assert [(e.id, tg) for e, _, tg in only_other] == [(other_event.id, 333)]
+
+
+class TestChunkedIteration:
+    """Тесты чтения получателей по частям на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_iter_owed_with_record_between_chunks(self, sqlite_session, seeded):
+        """Запись в журнал (с коммитом) между частями не ломает и не сдвигает выборку"""
+        hackathon, _, events = seeded
+        repo = SentReminderRepo(sqlite_session)
+
+        chunks = []
+        async for owed in repo.iter_owed(hours_ahead=1, offset_minutes=60, chunk_size=1):
+            chunks.append([tg for _, _, tg in owed])
+            await repo.record(
+                [SentReminder(event_id=e.id, user_id=u, offset_minutes=60) for e, u, _ in owed]
+            )
+
+        assert chunks == [[111], [222]]
+        assert await repo.get_owed(hours_ahead=1, offset_minutes=60) == []
+
+    @pytest.mark.asyncio
+    async def test_iter_owed_by_user_groups_user_events(self, sqlite_session, seeded):
+        """by_user: события одного пользователя идут подряд, по времени начала"""
+        hackathon, _, events = seeded
+        later = events[0].starts_at + timedelta(minutes=10)
+        (extra,) = await EventRepo(sqlite_session).save_all(
+            [
+                Event(
+                    hackathon_id=hackathon.id,
+                    title="Later",
+                    starts_at=later,
+                    ends_at=later + timedelta(hours=1),
+                )
+            ]
+        )
+        repo = SentReminderRepo(sqlite_session)
+
+        rows = []
+        async for owed in repo.iter_owed(
+            hours_ahead=1, offset_minutes=60, chunk_size=3, by_user=True
+        ):
+            rows.extend((tg, event.id) for event, _, tg in owed)
+
+        assert rows == [
+            (111, events[0].id),
+            (111, extra.id),
+            (222, events[0].id),
+            (222, extra.id),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unreachable_users_are_skipped(self, sqlite_session, seeded):
+        """Недоступные пользователи не выбираются для напоминаний и рассылок"""
+        hackathon, _, events = seeded
+        await UserRepo(sqlite_session).mark_unreachable([111])
+
+        targets = await SubscriptionRepo(sqlite_session).get_reminder_targets(hours_ahead=1)
+        subscribed = await SubscriptionRepo(sqlite_session).get_subscribed_users(hackathon.id)
+        members = await UserRepo(sqlite_session).get_audience(
+            hackathon.id, AudienceSegmentDTO(subscribed_only=False)
+        )
+
+        assert [tg for _, _, tg in targets] == [222]
+        assert [u.telegram_id for u in subscribed] == [222]
+        assert list(members.telegram_ids) == [222, 333]
+
+
+class TestLedgerCommittedWithOutbox:
+    """Журнал напоминаний фиксируется одной транзакцией с постановкой в очередь"""
+
+    @pytest.mark.asyncio
+    async def test_failed_enqueue_keeps_chunk_owed(self, sqlite_session, seeded):
+        """Упала постановка второй части: первая доставляется, вторая остаётся в долгах"""
+        _, _, events = seeded
+        await sqlite_session.commit()
+        use_cases = build_use_case_provider(sqlite_session, bot=None)
+        outbox = OutboxRepo(sqlite_session)
+        calls = 0
+
+        async def enqueue(messages):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError("enqueue failed")
+            return await outbox.enqueue(messages)
+
+        failing_outbox = MagicMock(enqueue=enqueue)
+        send = SendRemindersUseCase(outbox_repo=failing_outbox, uow=use_cases.uow)
+
+        with pytest.raises(RuntimeError):
+            async for piles in use_cases.process_reminders.plan_chunks(hours_ahead=1, chunk_size=1):
+                await send.execute(piles)
+        await sqlite_session.rollback()
+
+        owed = await SentReminderRepo(sqlite_session).get_owed(hours_ahead=1, offset_minutes=60)
+        assert [tg for _, _, tg in owed] == [222]
+        assert await outbox.count_by_status(f"reminder:{events[0].id}") == {
+            DeliveryStatus.PENDING: 1
+        }
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from hackathon_assistant.adapters.db.models import ReminderSubscriptionORM
+from hackathon_assistant.adapters.db.repositories import HackathonRepo, SubscriptionRepo, UserRepo
+from hackathon_assistant.domain.models import Hackathon
+
+
+async def _subscriptions(session) -> list[tuple[int, int, bool]]:
+    stmt = select(
+        ReminderSubscriptionORM.user_id,
+        ReminderSubscriptionORM.hackathon_id,
+        ReminderSubscriptionORM.enabled,
+    )
+    return [tuple(row) for row in (await session.execute(stmt)).all()]
+
+
+class TestSetSubscription:
+    """Тесты SubscriptionRepo.set_subscription на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_toggle_current_hackathon(self, sqlite_session):
+        """Включение создаёт подписку один раз, выключение и повторное включение её меняют"""
+        hackathon = await HackathonRepo(sqlite_session).save(
+            Hackathon(
+                code="HACK", name="Hack", start_at=datetime(2025, 1, 1), end_at=datetime(2025, 1, 2)
+            )
+        )
+        users = UserRepo(sqlite_session)
+        user = await users.upsert_profile(telegram_id=42, username="", first_name="", last_name="")
+        await users.update_current_hackathon(user.id, hackathon.id)
+        repo = SubscriptionRepo(sqlite_session)
+
+        assert await repo.set_subscription(42, enabled=True) is True
+        assert await repo.set_subscription(42, enabled=True) is True
+        assert await _subscriptions(sqlite_session) == [(user.id, hackathon.id, True)]
+
+        assert await repo.set_subscription(42, enabled=False) is True
+        assert await _subscriptions(sqlite_session) == [(user.id, hackathon.id, False)]
+        subscription = await repo.get_user_subscription(user.id, hackathon.id)
+        assert subscription.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_toggle(self, sqlite_session):
+        """Без пользователя, без хакатона или без подписки (при выключении) — False"""
+        repo = SubscriptionRepo(sqlite_session)
+        await UserRepo(sqlite_session).upsert_profile(
+            telegram_id=42, username="", first_name="", last_name=""
+        )
+
+        assert await repo.set_subscription(1, enabled=True) is False
+        assert await repo.set_subscription(42, enabled=True) is False
+        assert await repo.set_subscription(42, enabled=False) is False
+        assert await _subscriptions(sqlite_session) == []
@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from hackathon_assistant.adapters.bot.middlewares.usecases import UseCasesMiddleware
+from hackathon_assistant.infra.usecase_provider import build_use_case_provider
+
+
+@pytest.fixture
+def checkouts(sqlite_session):
+    """Число выдач соединения из пула"""
+    pool = sqlite_session.get_bind().pool
+    count = [0]
+
+    def _checkout(dbapi_conn, conn_record, conn_proxy):
+        count[0] += 1
+
+    event.listen(pool, "checkout", _checkout)
+    yield count
+    event.remove(pool, "checkout", _checkout)
+
+
+class TestLazyUseCaseProvider:
+    """Тесты ленивого UseCaseProvider"""
+
+    def test_use_cases_are_built_on_first_access(self, sqlite_session):
+        """Use case создаётся при первом обращении, репозитории общие"""
+        use_cases = build_use_case_provider(sqlite_session, bot=MagicMock())
+        assert "get_schedule" not in vars(use_cases)
+
+        schedule = use_cases.get_schedule
+        assert use_cases.get_schedule is schedule
+        assert set(vars(use_cases)) == {"repos", "bot", "get_schedule"}
+        assert use_cases.get_faq.user_repo is schedule.user_repo
+
+    @pytest.mark.asyncio
+    async def test_update_without_queries_takes_no_connection(self, sqlite_session, checkouts):
+        """Апдейт, не обращающийся к БД, не берёт соединение из пула"""
+        session_factory = async_sessionmaker(sqlite_session.bind, expire_on_commit=False)
+        middleware = UseCasesMiddleware(
+            session_cm_factory=session_factory,
+            provider_factory=lambda session: build_use_case_provider(session, bot=MagicMock()),
+        )
+
+        async def cheap_handler(event, data):
+            return data["use_cases"].get_hackathon_info is not None
+
+        async def db_handler(event, data):
+            return await data["use_cases"].get_hackathon_info.execute(telegram_id=1)
+
+        assert await middleware(cheap_handler, MagicMock(), {}) is True
+        assert checkouts[0] == 0
+
+        assert await middleware(db_handler, MagicMock(), {}) == (None, False)
+        assert checkouts[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_are_committed_before_reply(self, sqlite_session):
+        """Пишущий use case фиксирует запись сам, до ответа обработчика"""
+        engine = sqlite_session.bind
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        middleware = UseCasesMiddleware(
+            session_cm_factory=session_factory,
+            provider_factory=lambda session: build_use_case_provider(session, bot=MagicMock()),
+        )
+        commits = [0]
+        commits_before_reply = []
+
+        def _commit(conn):
+            commits[0] += 1
+
+        async def handler(event, data):
+            use_cases = data["use_cases"]
+            await use_cases.start_user.execute(telegram_id=7, username="u")
+            await use_cases.start_user.execute(telegram_id=7, username="u2")
+            commits_before_reply.append(commits[0])
+
+        event.listen(engine.sync_engine, "commit", _commit)
+        try:
+            await middleware(handler, MagicMock(), {})
+        finally:
+            event.remove(engine.sync_engine, "commit", _commit)
+
+        assert commits_before_reply == [2]
+        assert commits[0] == 2
+        async with session_factory() as session:
+            use_cases = build_use_case_provider(session, bot=MagicMock())
+            user = await use_cases.start_user.user_repo.get_by_telegram_id(7)
+        assert user.username == "u2"
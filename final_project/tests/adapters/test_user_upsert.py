@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from hackathon_assistant.adapters.db.repositories import HackathonRepo, UserRepo
+from hackathon_assistant.domain.models import Hackathon, UserRole
+
+
+async def _changes(session) -> int:
+    return (await session.execute(select(func.changes()))).scalar_one()
+
+
+class TestUpsertProfile:
+    """Тесты UserRepo.upsert_profile на SQLite"""
+
+    @pytest.mark.asyncio
+    async def test_registers_new_user(self, sqlite_session):
+        """Новый пользователь создаётся участником"""
+        user = await UserRepo(sqlite_session).upsert_profile(
+            telegram_id=42, username="u", first_name="F", last_name="L"
+        )
+
+        assert user.id is not None
+        assert (user.telegram_id, user.username, user.role) == (42, "u", UserRole.PARTICIPANT)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_profile_is_not_written(self, sqlite_session):
+        """Повторный /start с теми же данными не обновляет строку"""
+        repo = UserRepo(sqlite_session)
+        first = await repo.upsert_profile(
+            telegram_id=42, username="u", first_name="F", last_name=""
+        )
+
+        again = await UserRepo(sqlite_session).upsert_profile(
+            telegram_id=42, username="u", first_name="F", last_name=""
+        )
+
+        assert await _changes(sqlite_session) == 0
+        assert again == first
+
+    @pytest.mark.asyncio
+    async def test_updates_profile_and_keeps_role_and_hackathon(self, sqlite_session):
+        """Изменённое имя обновляется, отметка недоступности снимается, остальное не трогается"""
+        hackathon = await HackathonRepo(sqlite_session).save(
+            Hackathon(
+                code="HACK", name="Hack", start_at=datetime(2025, 1, 1), end_at=datetime(2025, 1, 2)
+            )
+        )
+        repo = UserRepo(sqlite_session)
+        user = await repo.upsert_profile(telegram_id=42, username="u", first_name="F", last_name="")
+        user.role = UserRole.ORGANIZER
+        user.current_hackathon_id = hackathon.id
+        await repo.save(user)
+        await repo.mark_unreachable([42])
+
+        await repo.upsert_profile(telegram_id=42, username="u", first_name="F", last_name="")
+        assert await _changes(sqlite_session) == 1
+        updated = await repo.upsert_profile(
+            telegram_id=42, username="new", first_name="F", last_name=""
+        )
+
+        assert updated.id == user.id
+        assert updated.username == "new"
+        assert updated.unreachable_since is None
+        assert updated.role == UserRole.ORGANIZER
+        assert updated.current_hackathon_id == hackathon.id
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from aiogram import Bot, Dispatcher, Router
+from aiogram.types import Message
+from aiohttp.test_utils import TestClient, TestServer
+
+from hackathon_assistant.adapters.bot.webhook import WEBHOOK_HANDLER_KEY, build_webhook_app
+
+SECRET = "s3cret"
+
+
+def _update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "text": f"msg {update_id}",
+        },
+    }
+
+
+class _SlowHandler:
+    """Обработчик сообщений, который ждёт release и считает одновременные вызовы"""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.handled: list[int] = []
+
+    async def handle(self, message: Message) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            self.handled.append(message.message_id)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+async def telegram():
+    """Фейковый Telegram: клиент, который POST-ит апдейты в webhook-приложение бота"""
+    handler = _SlowHandler()
+    router = Router()
+    router.message.register(handler.handle)
+    dp = Dispatcher()
+    dp.include_router(router)
+    app = build_webhook_app(
+        dp,
+        Bot(token="42:TEST"),
+        path="/webhook",
+        max_in_flight=2,
+        queue_size=3,
+        enqueue_timeout=0.05,
+        secret_token=SECRET,
+    )
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    try:
+        yield client, handler, app[WEBHOOK_HANDLER_KEY]
+    finally:
+        handler.release.set()
+        await client.close()
+
+
+async def _post(client: TestClient, update_id: int, secret: str = SECRET) -> int:
+    response = await client.post(
+        "/webhook",
+        json=_update(update_id),
+        headers={"X-Telegram-Bot-Api-Secret-Token": secret},
+    )
+    return response.status
+
+
+class TestWebhook:
+    """Тесты webhook-обработчика с ограниченной очередью"""
+
+    @pytest.mark.asyncio
+    async def test_ack_before_handling(self, telegram):
+        """Telegram получает 200 сразу, обработка идёт в воркерах"""
+        client, handler, _ = telegram
+
+        assert await _post(client, 1) == 200
+        await asyncio.sleep(0.01)
+        assert handler.in_flight == 1
+        assert handler.handled == []
+
+        handler.release.set()
+        await asyncio.sleep(0.01)
+        assert handler.handled == [1]
+
+    @pytest.mark.asyncio
+    async def test_bounded_in_flight_and_backpressure(self, telegram):
+        """Не больше max_in_flight обработчиков; при полной очереди — 503"""
+        client, handler, webhook = telegram
+
+        statuses = [await _post(client, i) for i in range(1, 6)]
+        await asyncio.sleep(0.01)
+        assert statuses == [200] * 5
+        assert webhook.stats() == {"in_flight": 2, "queued": 3}
+
+        assert await _post(client, 6) == 503
+
+        handler.release.set()
+        await asyncio.sleep(0.05)
+        assert sorted(handler.handled) == [1, 2, 3, 4, 5]
+        assert handler.max_in_flight == 2
+        assert webhook.stats() == {"in_flight": 0, "queued": 0}
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret(self, telegram):
+        client, handler, webhook = telegram
+
+        assert await _post(client, 1, secret="wrong") == 401
+        assert webhook.stats() == {"in_flight": 0, "queued": 0}
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue(self, telegram):
+        """Остановка сервера дообрабатывает принятые апдейты"""
+        client, handler, _ = telegram
+        for i in range(1, 4):
+            assert await _post(client, i) == 200
+
+        asyncio.get_running_loop().call_later(0.05, handler.release.set)
+        await client.close()
+
+        assert sorted(handler.handled) == [1, 2, 3]
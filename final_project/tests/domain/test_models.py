@@ -1,4 +1,4 @@
-from dataclasses import is_dataclass
+from dataclasses import fields, is_dataclass
 from datetime import timedelta
 
 import pytest
@@ -8,8 +8,10 @@ from hackathon_assistant.domain.models import (
     EventType,
     FAQItem,
     Hackathon,
+    OutboxMessage,
     ReminderSubscription,
     Rules,
+    SentReminder,
     User,
     UserRole,
 )
@@ -143,6 +145,14 @@ class TestEvent:
         assert event.location == "Зал А"
         assert event.description == "Промежуточная сдача прототипа"
 
+    def test_event_aliases_with_slots(self, sample_event_data):
+        """Алиасы start_at/end_at работают и у класса со __slots__."""
+        data = sample_event_data.copy()
+        starts_at, ends_at = data.pop("starts_at"), data.pop("ends_at")
+        event = Event(**data, start_at=starts_at, end_at=ends_at)
+
+        assert (event.starts_at, event.ends_at) == (starts_at, ends_at)
+
     def test_event_title_validation(self, sample_event_data):
         """Валидация названия события."""
         # Пустой заголовок
@@ -300,3 +310,32 @@ class TestReminderSubscription:
             data = sample_reminder_subscription_data.copy()
             data["hackathon_id"] = -1
             ReminderSubscription(**data)
+
+
+class TestSlots:
+    """Доменные модели без __dict__ на экземпляр."""
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            User,
+            Hackathon,
+            Event,
+            FAQItem,
+            Rules,
+            ReminderSubscription,
+            SentReminder,
+            OutboxMessage,
+        ],
+    )
+    def test_model_is_slotted(self, model):
+        """Поля хранятся в __slots__."""
+        assert set(model.__slots__) == {f.name for f in fields(model)}
+
+    def test_unknown_attribute_rejected(self, sample_user_data):
+        """Опечатка в имени поля — ошибка, а не новый атрибут."""
+        user = User(**sample_user_data)
+
+        assert not hasattr(user, "__dict__")
+        with pytest.raises(AttributeError):
+            user.telegram = 1
@@ -19,6 +19,7 @@ def test_cli_parser():
     # Проверяем что команды добавлены
     assert "db-ping" in parser.format_help()
     assert "create-hackathon" in parser.format_help()
+    assert "reconcile-counters" in parser.format_help()
 
 
 @pytest.mark.asyncio
@@ -178,6 +179,7 @@ async def test_create_hackathon_success():
                 mock_repo_instance.event_repo.return_value = AsyncMock()
                 mock_repo_instance.faq_repo.return_value = AsyncMock()
                 mock_repo_instance.rules_repo.return_value = AsyncMock()
+                mock_uow = mock_repo_instance.unit_of_work.return_value = AsyncMock()
 
                 with patch("builtins.print") as mock_print:
                     # Создаем аргументы
@@ -187,6 +189,7 @@ async def test_create_hackathon_success():
                     result = await cli._cmd_create_hackathon(args)
 
                     assert result == 0  # успех
+                    mock_uow.commit.assert_awaited_once()
                     mock_print.assert_called_with(
                         "Created hackathon id=1 code='TEST2025' name='Test Hackathon'"
                     )
@@ -0,0 +1,24 @@
+import pytest
+from pydantic import ValidationError
+
+from hackathon_assistant.infra.settings import Settings
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(_env_file=None, bot_token="42:TEST", database_url="sqlite://", **overrides)
+
+
+def test_polling_needs_no_webhook_url():
+    assert _settings().bot_mode == "polling"
+
+
+@pytest.mark.parametrize("base_url", ["", "http://bot.example.com", "bot.example.com"])
+def test_webhook_mode_requires_https_base_url(base_url):
+    """Без https-адреса webhook-режим не запускается: ошибка при чтении настроек"""
+    with pytest.raises(ValidationError, match="WEBHOOK_BASE_URL"):
+        _settings(bot_mode="webhook", webhook_base_url=base_url)
+
+
+def test_webhook_mode_with_https_base_url():
+    settings = _settings(bot_mode="webhook", webhook_base_url="https://bot.example.com")
+    assert settings.webhook_base_url == "https://bot.example.com"
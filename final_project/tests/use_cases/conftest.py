@@ -18,8 +18,8 @@ from hackathon_assistant.domain.models import (
 )
 from hackathon_assistant.use_cases.create_hackathon import CreateHackathonFromConfigUseCase
 from hackathon_assistant.use_cases.dto import (
+    RecipientBatch,
     ReminderEventDTO,
-    ReminderParticipantDTO,
     ReminderPileDTO,
 )
 from hackathon_assistant.use_cases.finish_hackathon import FinishHackathonUseCase
@@ -66,6 +66,24 @@ def mock_subscription_repo():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_sent_reminder_repo():
+    """Фикстура мока SentReminderRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_outbox_repo():
+    """Фикстура мока OutboxRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_counters_repo():
+    """Фикстура мока HackathonCountersRepository."""
+    return AsyncMock()
+
+
 @pytest.fixture
 def mock_notifier():
     return AsyncMock()
@@ -164,17 +182,16 @@ def sample_subscription():
 
 
 @pytest.fixture
-def use_case_admin_stats(mock_user_repo, mock_subscription_repo, mock_hackathon_repo):
+def use_case_admin_stats(mock_counters_repo, mock_hackathon_repo):
     return GetAdminStatsUseCase(
-        user_repo=mock_user_repo,
-        subscription_repo=mock_subscription_repo,
+        counters_repo=mock_counters_repo,
         hackathon_repo=mock_hackathon_repo,
     )
 
 
 @pytest.fixture
-def use_case_send_broadcast(mock_user_repo, mock_subscription_repo):
-    return SendBroadcastUseCase(user_repo=mock_user_repo, subscription_repo=mock_subscription_repo)
+def use_case_send_broadcast(mock_user_repo):
+    return SendBroadcastUseCase(user_repo=mock_user_repo)
 
 
 @pytest.fixture
@@ -259,8 +276,5 @@ def sample_pile():
         event=ReminderEventDTO(
             event_id=1, title="Тестовое событие", starts_at=datetime.now() + timedelta(minutes=30)
         ),
-        participants=[
-            ReminderParticipantDTO(user_id=1, telegram_id=111),
-            ReminderParticipantDTO(user_id=2, telegram_id=222),
-        ],
+        participants=RecipientBatch.from_pairs([(1, 111), (2, 222)]),
     )
@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hackathon_assistant.use_cases.dto import AudienceSegmentDTO, RecipientBatch
+from hackathon_assistant.use_cases.enqueue_broadcast import EnqueueBroadcastUseCase
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestEnqueueBroadcastUseCase:
+    """Тесты для EnqueueBroadcastUseCase"""
+
+    @pytest.fixture
+    def use_case(self, mock_user_repo, mock_outbox_repo):
+        return EnqueueBroadcastUseCase(user_repo=mock_user_repo, outbox_repo=mock_outbox_repo)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_subscribed_users_by_chunks(
+        self, use_case, mock_user_repo, mock_outbox_repo
+    ):
+        """Каждая часть подписанных пользователей ставится в очередь отдельно"""
+        mock_user_repo.iter_audience = MagicMock(
+            return_value=_chunks(
+                RecipientBatch.from_pairs([(1, 111), (2, 222)]),
+                RecipientBatch.from_pairs([(3, 333)]),
+            )
+        )
+        mock_outbox_repo.enqueue.side_effect = [2, 1]
+
+        job = await use_case.execute(hackathon_id=5, message="Важное объявление")
+
+        mock_user_repo.iter_audience.assert_called_once_with(
+            5, AudienceSegmentDTO(), chunk_size=1000
+        )
+        first, second = (call.args[0] for call in mock_outbox_repo.enqueue.call_args_list)
+        assert [(m.user_id, m.telegram_id) for m in first] == [(1, 111), (2, 222)]
+        assert [(m.user_id, m.telegram_id) for m in second] == [(3, 333)]
+        assert first[0].text == "Важное объявление"
+        assert {m.message_key for m in first + second} == {job.message_key}
+        assert job.message_key.startswith("broadcast:5:")
+        assert job.recipients == 3
+
+    @pytest.mark.asyncio
+    async def test_each_broadcast_gets_own_key(self, use_case, mock_user_repo, mock_outbox_repo):
+        """Повторная рассылка того же текста не схлопывается с предыдущей"""
+        mock_user_repo.iter_audience = MagicMock(side_effect=lambda *a, **kw: _chunks())
+
+        first = await use_case.execute(hackathon_id=5, message="text")
+        second = await use_case.execute(hackathon_id=5, message="text")
+
+        assert first.message_key != second.message_key
+
+    @pytest.mark.asyncio
+    async def test_each_chunk_is_committed(self, use_case, mock_user_repo, mock_outbox_repo):
+        """Каждая часть фиксируется сразу, чтобы воркер доставки её увидел"""
+        mock_user_repo.iter_audience = MagicMock(
+            return_value=_chunks(
+                RecipientBatch.from_pairs([(1, 111)]), RecipientBatch.from_pairs([(2, 222)])
+            )
+        )
+        mock_outbox_repo.enqueue.return_value = 1
+        use_case.uow = AsyncMock()
+
+        await use_case.execute(hackathon_id=5, message="text")
+
+        assert use_case.uow.commit.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_report_target_is_stored_after_recipients(
+        self, use_case, mock_user_repo, mock_outbox_repo
+    ):
+        """Адресат итога сохраняется в БД после всех получателей и фиксируется"""
+        mock_user_repo.iter_audience = MagicMock(
+            return_value=_chunks(RecipientBatch.from_pairs([(1, 111)]))
+        )
+        mock_outbox_repo.enqueue.return_value = 1
+        use_case.uow = AsyncMock()
+
+        job = await use_case.execute(hackathon_id=5, message="text", report_chat_id=999)
+
+        assert [c[0] for c in mock_outbox_repo.mock_calls] == ["enqueue", "add_report"]
+        mock_outbox_repo.add_report.assert_awaited_once_with(job.message_key, 999)
+        assert use_case.uow.commit.await_count == 2
@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
 
 import pytest
 
-from hackathon_assistant.domain.models import Hackathon, ReminderSubscription
+from hackathon_assistant.domain.models import Hackathon
 
 
 class TestFinishHackathonUseCase:
@@ -25,27 +26,18 @@ class TestFinishHackathonUseCase:
         )
         mock_hackathon_repo.get_by_id.return_value = hackathon
 
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=True),
-            ReminderSubscription(id=2, user_id=2, hackathon_id=5, enabled=True),
-            ReminderSubscription(id=3, user_id=3, hackathon_id=5, enabled=False),
-        ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
+        mock_subscription_repo.disable_all_for_hackathon.return_value = 2
 
         result = await use_case_finish_hackathon.execute(hackathon_id=hackathon_id)
 
         mock_hackathon_repo.get_by_id.assert_called_once_with(hackathon_id)
-        mock_subscription_repo.get_by_hackathon.assert_called_once_with(hackathon_id)
-
         saved_hackathon = mock_hackathon_repo.save.call_args[0][0]
         assert saved_hackathon.is_active is False
 
-        assert mock_subscription_repo.save.call_count == 3
-
-        call_args_list = mock_subscription_repo.save.call_args_list
-        for _i, call_args in enumerate(call_args_list):
-            subscription = call_args[0][0]
-            assert subscription.enabled is False
+        # подписки выключаются одним UPDATE, а не по одной
+        mock_subscription_repo.disable_all_for_hackathon.assert_called_once_with(hackathon_id)
+        mock_subscription_repo.get_by_hackathon.assert_not_called()
+        mock_subscription_repo.save.assert_not_called()
 
         assert result is True
 
@@ -61,7 +53,7 @@ class TestFinishHackathonUseCase:
         result = await use_case_finish_hackathon.execute(hackathon_id=hackathon_id)
 
         assert result is False
-        mock_subscription_repo.get_by_hackathon.assert_not_called()
+        mock_subscription_repo.disable_all_for_hackathon.assert_not_called()
         mock_hackathon_repo.save.assert_not_called()
 
     @pytest.mark.asyncio
@@ -81,10 +73,7 @@ class TestFinishHackathonUseCase:
         )
         mock_hackathon_repo.get_by_id.return_value = hackathon
 
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=False),  # уже отключена
-        ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
+        mock_subscription_repo.disable_all_for_hackathon.return_value = 0
 
         result = await use_case_finish_hackathon.execute(hackathon_id=hackathon_id)
 
@@ -92,7 +81,7 @@ class TestFinishHackathonUseCase:
 
         mock_hackathon_repo.save.assert_called_once()
 
-        mock_subscription_repo.save.assert_called_once()
+        mock_subscription_repo.disable_all_for_hackathon.assert_called_once_with(hackathon_id)
 
     @pytest.mark.asyncio
     async def test_finish_hackathon_no_subscriptions(
@@ -112,10 +101,29 @@ class TestFinishHackathonUseCase:
         )
         mock_hackathon_repo.get_by_id.return_value = hackathon
 
-        mock_subscription_repo.get_by_hackathon.return_value = []
+        mock_subscription_repo.disable_all_for_hackathon.return_value = 0
 
         result = await use_case_finish_hackathon.execute(hackathon_id=hackathon_id)
 
         assert result is True
         mock_hackathon_repo.save.assert_called_once()
         mock_subscription_repo.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_finish_hackathon_with_archive(
+        self, use_case_finish_hackathon, mock_hackathon_repo, mock_subscription_repo
+    ):
+        """С archive_repo данные хакатона переносятся в архив"""
+        now = datetime.now()
+        mock_hackathon_repo.get_by_id.return_value = Hackathon(
+            id=5,
+            code="HACK2024",
+            name="Test Hackathon",
+            start_at=now,
+            end_at=now + timedelta(days=1),
+        )
+        use_case_finish_hackathon.archive_repo = AsyncMock()
+
+        assert await use_case_finish_hackathon.execute(hackathon_id=5) is True
+
+        use_case_finish_hackathon.archive_repo.archive_hackathon.assert_called_once_with(5)
@@ -1,50 +1,50 @@
+from datetime import datetime
+
 import pytest
 
-from hackathon_assistant.domain.models import User, UserRole
-from hackathon_assistant.use_cases.dto import AdminStatsDTO
+from hackathon_assistant.domain.models import Hackathon
+from hackathon_assistant.use_cases.dto import AdminStatsDTO, HackathonStatsDTO
+
+
+def _row(hackathon_id, total, participants, organizers, subscribed):
+    return HackathonStatsDTO(
+        hackathon_id=hackathon_id,
+        code=None if hackathon_id is None else f"HACK{hackathon_id}",
+        name=None if hackathon_id is None else f"Hack {hackathon_id}",
+        total_users=total,
+        participants=participants,
+        organizers=organizers,
+        subscribed_users=subscribed,
+    )
 
 
 class TestGetAdminStatsUseCase:
     """Тесты для GetAdminStatsUseCase"""
 
     @pytest.mark.asyncio
-    async def test_get_admin_stats(
-        self, use_case_admin_stats, mock_user_repo, mock_subscription_repo, mock_hackathon_repo
-    ):
-        """Получение статистики"""
-        mock_user_repo.count_all.return_value = 100
-
-        users = [
-            User(id=1, telegram_id=111, username="user1", role=UserRole.PARTICIPANT),
-            User(id=2, telegram_id=222, username="user2", role=UserRole.PARTICIPANT),
-            User(id=3, telegram_id=333, username="org1", role=UserRole.ORGANIZER),
-            User(id=4, telegram_id=444, username="org2", role=UserRole.ORGANIZER),
-            User(id=5, telegram_id=555, username="user3", role=UserRole.PARTICIPANT),
+    async def test_get_admin_stats(self, use_case_admin_stats, mock_counters_repo):
+        """Итоги суммируются по строкам счётчиков"""
+        mock_counters_repo.get_all.return_value = [
+            _row(None, 10, 10, 0, 0),
+            _row(1, 60, 55, 5, 50),
+            _row(2, 30, 20, 10, 25),
         ]
-        mock_user_repo.get_all.return_value = users
-
-        mock_subscription_repo.count_all_subscribed.return_value = 75
 
         result = await use_case_admin_stats.execute()
 
-        mock_user_repo.count_all.assert_called_once()
-        mock_user_repo.get_all.assert_called_once()
-        mock_subscription_repo.count_all_subscribed.assert_called_once()
+        mock_counters_repo.get_all.assert_awaited_once()
 
         assert isinstance(result, AdminStatsDTO)
         assert result.total_users == 100
-        assert result.participants == 3
-        assert result.organizers == 2
+        assert result.participants == 85
+        assert result.organizers == 15
         assert result.subscribed_users == 75
+        assert [h.code for h in result.hackathons] == ["HACK1", "HACK2"]
 
     @pytest.mark.asyncio
-    async def test_get_admin_stats_empty(
-        self, use_case_admin_stats, mock_user_repo, mock_subscription_repo, mock_hackathon_repo
-    ):
+    async def test_get_admin_stats_empty(self, use_case_admin_stats, mock_counters_repo):
         """Статистика при отсутствии данных"""
-        mock_user_repo.count_all.return_value = 0
-        mock_user_repo.get_all.return_value = []
-        mock_subscription_repo.count_all_subscribed.return_value = 0
+        mock_counters_repo.get_all.return_value = []
 
         result = await use_case_admin_stats.execute()
 
@@ -52,57 +52,58 @@ class TestGetAdminStatsUseCase:
         assert result.participants == 0
         assert result.organizers == 0
         assert result.subscribed_users == 0
+        assert result.hackathons == []
 
     @pytest.mark.asyncio
-    async def test_count_all_subscribed_method(self, use_case_admin_stats, mock_subscription_repo):
-        """Проверка вызова count_all_subscribed"""
-        mock_subscription_repo.count_all_subscribed.return_value = 42
-
-        result = await use_case_admin_stats.execute()
-
-        mock_subscription_repo.count_all_subscribed.assert_called_once()
-        assert result.subscribed_users == 42
+    async def test_get_admin_stats_by_code(
+        self, use_case_admin_stats, mock_counters_repo, mock_hackathon_repo
+    ):
+        """Статистика по одному хакатону — одна строка счётчиков по ключу"""
+        mock_hackathon_repo.get_by_code.return_value = Hackathon(
+            id=2,
+            code="HACK2",
+            name="Hack 2",
+            start_at=datetime(2025, 1, 1),
+            end_at=datetime(2025, 1, 2),
+        )
+        mock_counters_repo.get_by_hackathon.return_value = _row(2, 30, 20, 10, 25)
+
+        result = await use_case_admin_stats.execute(hackathon_code="HACK2")
+
+        mock_hackathon_repo.get_by_code.assert_awaited_once_with("HACK2")
+        mock_counters_repo.get_by_hackathon.assert_awaited_once_with(2)
+        mock_counters_repo.get_all.assert_not_called()
+        assert result.total_users == 30
+        assert result.subscribed_users == 25
+        assert len(result.hackathons) == 1
 
     @pytest.mark.asyncio
-    async def test_get_admin_stats_only_participants(
-        self, use_case_admin_stats, mock_user_repo, mock_subscription_repo, mock_hackathon_repo
+    async def test_get_admin_stats_unknown_code(
+        self, use_case_admin_stats, mock_counters_repo, mock_hackathon_repo
     ):
-        """Только участники, без организаторов"""
-        mock_user_repo.count_all.return_value = 50
-
-        users = [
-            User(id=i, telegram_id=i * 100, username=f"user{i}", role=UserRole.PARTICIPANT)
-            for i in range(1, 51)
-        ]
-        mock_user_repo.get_all.return_value = users
-
-        mock_subscription_repo.count_all_subscribed.return_value = 30
+        """Неизвестный код хакатона"""
+        mock_hackathon_repo.get_by_code.return_value = None
 
-        result = await use_case_admin_stats.execute()
+        result = await use_case_admin_stats.execute(hackathon_code="NOPE")
 
-        assert result.total_users == 50
-        assert result.participants == 50
-        assert result.organizers == 0
-        assert result.subscribed_users == 30
+        assert result is None
+        mock_counters_repo.get_by_hackathon.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_admin_stats_only_organizers(
-        self, use_case_admin_stats, mock_user_repo, mock_subscription_repo, mock_hackathon_repo
+    async def test_get_admin_stats_hackathon_without_users(
+        self, use_case_admin_stats, mock_counters_repo, mock_hackathon_repo
     ):
-        """Только организаторы"""
-        mock_user_repo.count_all.return_value = 10
-
-        users = [
-            User(id=i, telegram_id=i * 100, username=f"org{i}", role=UserRole.ORGANIZER)
-            for i in range(1, 11)
-        ]
-        mock_user_repo.get_all.return_value = users
+        """Хакатон без строки счётчиков — нули"""
+        mock_hackathon_repo.get_by_code.return_value = Hackathon(
+            id=3,
+            code="NEW",
+            name="New",
+            start_at=datetime(2025, 1, 1),
+            end_at=datetime(2025, 1, 2),
+        )
+        mock_counters_repo.get_by_hackathon.return_value = None
+
+        result = await use_case_admin_stats.execute(hackathon_code="NEW")
 
-        mock_subscription_repo.count_all_subscribed.return_value = 5
-
-        result = await use_case_admin_stats.execute()
-
-        assert result.total_users == 10
-        assert result.participants == 0
-        assert result.organizers == 10
-        assert result.subscribed_users == 5
+        assert result.total_users == 0
+        assert [(h.code, h.total_users) for h in result.hackathons] == [("NEW", 0)]
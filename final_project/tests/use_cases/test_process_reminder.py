@@ -1,9 +1,13 @@
+import sys
+from array import array
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 
 from hackathon_assistant.domain.models import Event, EventType, User, UserRole
-from hackathon_assistant.use_cases.dto import ReminderPileDTO
+from hackathon_assistant.use_cases.dto import RecipientBatch, ReminderPileDTO
+from hackathon_assistant.use_cases.process_reminder import ProcessRemindersUseCase
 
 
 class TestProcessRemindersUseCase:
@@ -44,11 +48,7 @@ class TestProcessRemindersUseCase:
         assert isinstance(pile, ReminderPileDTO)
         assert pile.event.event_id == 1
         assert pile.event.title == "Test Event"
-        assert len(pile.participants) == 2
-        assert pile.participants[0].user_id == 1
-        assert pile.participants[0].telegram_id == 111
-        assert pile.participants[1].user_id == 2
-        assert pile.participants[1].telegram_id == 222
+        assert list(pile.participants) == [(1, 111), (2, 222)]
 
     @pytest.mark.asyncio
     async def test_process_reminders_no_events(
@@ -128,4 +128,202 @@ class TestProcessRemindersUseCase:
         assert result[1].event.title == "Event 2"
         assert len(result[0].participants) == 1
         assert len(result[1].participants) == 1
-        assert result[0].participants[0].user_id == result[1].participants[0].user_id == 1
+        assert list(result[0].participants) == list(result[1].participants) == [(1, 111)]
+
+
+class TestProcessRemindersWithLedger:
+    """ProcessRemindersUseCase с журналом sent_reminders"""
+
+    @pytest.fixture
+    def use_case(self, mock_event_repo, mock_subscription_repo, mock_sent_reminder_repo):
+        return ProcessRemindersUseCase(
+            event_repo=mock_event_repo,
+            subscription_repo=mock_subscription_repo,
+            sent_reminder_repo=mock_sent_reminder_repo,
+        )
+
+    @pytest.mark.asyncio
+    async def test_groups_owed_reminders_and_records_them(
+        self, use_case, mock_event_repo, mock_subscription_repo, mock_sent_reminder_repo
+    ):
+        """Недоставленные пары группируются по событию и сразу пишутся в журнал"""
+        now = datetime.now()
+        event_1 = Event(
+            id=1,
+            hackathon_id=1,
+            title="Event 1",
+            starts_at=now + timedelta(minutes=30),
+            ends_at=now + timedelta(hours=1),
+        )
+        event_2 = Event(
+            id=2,
+            hackathon_id=1,
+            title="Event 2",
+            starts_at=now + timedelta(minutes=50),
+            ends_at=now + timedelta(hours=1),
+        )
+        mock_sent_reminder_repo.get_owed.return_value = [
+            (event_1, 1, 111),
+            (event_1, 2, 222),
+            (event_2, 2, 222),
+        ]
+
+        result = await use_case.execute(hackathon_id=1, hours_ahead=1)
+
+        mock_sent_reminder_repo.get_owed.assert_called_once_with(
+            hours_ahead=1, offset_minutes=60, hackathon_ids=[1]
+        )
+        mock_event_repo.get_upcoming_events.assert_not_called()
+        mock_subscription_repo.get_subscribed_users.assert_not_called()
+
+        assert [pile.event.event_id for pile in result] == [1, 2]
+        assert list(result[0].participants.telegram_ids) == [111, 222]
+        assert list(result[1].participants.telegram_ids) == [222]
+
+        recorded = mock_sent_reminder_repo.record.call_args[0][0]
+        assert [(r.event_id, r.user_id, r.offset_minutes) for r in recorded] == [
+            (1, 1, 60),
+            (1, 2, 60),
+            (2, 2, 60),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_nothing_owed(self, use_case, mock_sent_reminder_repo):
+        """Все напоминания уже отправлены: ничего не пишем и не отправляем"""
+        mock_sent_reminder_repo.get_owed.return_value = []
+
+        result = await use_case.execute(hackathon_id=1)
+
+        assert result == []
+        mock_sent_reminder_repo.record.assert_not_called()
+
+
+class TestPlanAllHackathons:
+    """Тесты планирования напоминаний сразу по всем активным хакатонам"""
+
+    @pytest.mark.asyncio
+    async def test_plan_uses_single_joined_query(
+        self, use_case_process_reminder, mock_event_repo, mock_subscription_repo
+    ):
+        """Без журнала пары (событие, подписчик) берутся одним запросом для всех хакатонов"""
+        now = datetime.now()
+        events = [
+            Event(
+                id=i,
+                hackathon_id=i,
+                title=f"Event {i}",
+                starts_at=now + timedelta(minutes=30),
+                ends_at=now + timedelta(hours=1),
+            )
+            for i in (1, 2)
+        ]
+        mock_subscription_repo.get_reminder_targets.return_value = [
+            (events[0], 1, 111),
+            (events[1], 1, 111),
+            (events[1], 2, 222),
+        ]
+
+        result = await use_case_process_reminder.plan(hours_ahead=1)
+
+        mock_subscription_repo.get_reminder_targets.assert_called_once_with(
+            hours_ahead=1, hackathon_ids=None
+        )
+        mock_event_repo.get_upcoming_events.assert_not_called()
+        mock_subscription_repo.get_subscribed_users.assert_not_called()
+        assert [pile.event.event_id for pile in result] == [1, 2]
+        assert list(result[1].participants.telegram_ids) == [111, 222]
+
+    @pytest.mark.asyncio
+    async def test_plan_chunks_records_each_chunk_before_yielding(
+        self, use_case_process_reminder, mock_sent_reminder_repo
+    ):
+        """По частям: каждая часть пишется в журнал до того, как уйдёт на отправку"""
+        now = datetime.now()
+        event = Event(
+            id=1,
+            hackathon_id=1,
+            title="Event 1",
+            starts_at=now + timedelta(minutes=30),
+            ends_at=now + timedelta(hours=1),
+        )
+
+        async def owed(**kwargs):
+            yield [(event, 1, 111), (event, 2, 222)]
+            yield [(event, 3, 333)]
+
+        mock_sent_reminder_repo.iter_owed = MagicMock(side_effect=owed)
+        use_case_process_reminder.sent_reminder_repo = mock_sent_reminder_repo
+
+        chunks = []
+        async for piles in use_case_process_reminder.plan_chunks(hours_ahead=1, chunk_size=2):
+            chunks.append(piles)
+            assert mock_sent_reminder_repo.record.call_count == len(chunks)
+
+        assert [list(piles[0].participants.telegram_ids) for piles in chunks] == [
+            [111, 222],
+            [333],
+        ]
+        mock_sent_reminder_repo.iter_owed.assert_called_once_with(
+            hours_ahead=1, offset_minutes=60, hackathon_ids=None, chunk_size=2, by_user=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_plan_chunks_by_user_keeps_user_events_together(
+        self, use_case_process_reminder, mock_sent_reminder_repo
+    ):
+        """Для дайджеста пользователь не делится между частями, даже если его события — в двух"""
+        now = datetime.now()
+        first, second = (
+            Event(
+                id=i,
+                hackathon_id=1,
+                title=f"Event {i}",
+                starts_at=now + timedelta(minutes=30),
+                ends_at=now + timedelta(hours=1),
+            )
+            for i in (1, 2)
+        )
+
+        async def owed(**kwargs):
+            yield [(first, 1, 111), (first, 2, 222)]
+            yield [(second, 2, 222), (first, 3, 333)]
+            yield [(second, 3, 333)]
+
+        mock_sent_reminder_repo.iter_owed = MagicMock(side_effect=owed)
+        use_case_process_reminder.sent_reminder_repo = mock_sent_reminder_repo
+
+        chunks = []
+        async for piles in use_case_process_reminder.plan_chunks(
+            hours_ahead=1, chunk_size=2, by_user=True
+        ):
+            chunks.append(
+                sorted(
+                    (pile.event.event_id, tg)
+                    for pile in piles
+                    for tg in pile.participants.telegram_ids
+                )
+            )
+
+        assert chunks == [[(1, 111)], [(1, 222), (2, 222)], [(1, 333), (2, 333)]]
+        assert mock_sent_reminder_repo.record.call_count == 3
+        assert mock_sent_reminder_repo.iter_owed.call_args.kwargs["by_user"] is True
+
+
+class TestRecipientBatch:
+    """Получатели пачки в массивах array('q')"""
+
+    def test_pairs_round_trip(self):
+        batch = RecipientBatch.from_pairs([(1, 111), (2, 222)])
+        batch.append(3, 333)
+
+        assert len(batch) == 3
+        assert list(batch) == [(1, 111), (2, 222), (3, 333)]
+        assert batch == RecipientBatch(array("q", [1, 2, 3]), array("q", [111, 222, 333]))
+
+    def test_large_pile_is_compact(self):
+        """100k получателей — два массива по 8 байт на число, без объекта на получателя"""
+        n = 100_000
+        batch = RecipientBatch.from_pairs((i, 10**9 + i) for i in range(1, n + 1))
+
+        size = sys.getsizeof(batch.user_ids) + sys.getsizeof(batch.telegram_ids)
+        assert size < 2 * n * 8 * 1.2
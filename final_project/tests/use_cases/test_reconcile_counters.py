@@ -0,0 +1,21 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hackathon_assistant.use_cases.reconcile_counters import ReconcileCountersUseCase
+
+
+class TestReconcileCountersUseCase:
+    """Тесты для ReconcileCountersUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_reconcile_commits(self, mock_counters_repo):
+        """Сверка фиксируется и возвращает число исправленных строк"""
+        uow = AsyncMock()
+        mock_counters_repo.reconcile.return_value = 2
+
+        result = await ReconcileCountersUseCase(counters_repo=mock_counters_repo, uow=uow).execute()
+
+        assert result == 2
+        mock_counters_repo.reconcile.assert_awaited_once()
+        uow.commit.assert_awaited_once()
@@ -1,160 +1,68 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
 import pytest
 
-from hackathon_assistant.domain.models import ReminderSubscription, User, UserRole
-from hackathon_assistant.use_cases.dto import BroadcastTargetDTO
+from hackathon_assistant.domain.models import UserRole
+from hackathon_assistant.use_cases.dto import AudienceSegmentDTO, RecipientBatch
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
 
 
 class TestSendBroadcastUseCase:
     """Тесты для SendBroadcastUseCase"""
 
     @pytest.mark.asyncio
-    async def test_get_broadcast_targets(
-        self, use_case_send_broadcast, mock_user_repo, mock_subscription_repo
-    ):
-        """Получение списка получателей для рассылки"""
-        hackathon_id = 5
-
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=True),
-            ReminderSubscription(id=2, user_id=2, hackathon_id=5, enabled=True),
-            ReminderSubscription(id=3, user_id=3, hackathon_id=5, enabled=False),
-            ReminderSubscription(id=4, user_id=4, hackathon_id=5, enabled=True),
-        ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
-
-        users = [
-            User(
-                id=1,
-                telegram_id=111,
-                username="user1",
-                first_name="Alice",
-                role=UserRole.PARTICIPANT,
-            ),
-            User(
-                id=2, telegram_id=222, username="user2", first_name="Bob", role=UserRole.PARTICIPANT
-            ),
-            User(
-                id=3,
-                telegram_id=333,
-                username="user3",
-                first_name="Charlie",
-                role=UserRole.PARTICIPANT,
-            ),
-            User(
-                id=4,
-                telegram_id=444,
-                username="user4",
-                first_name="Diana",
-                role=UserRole.PARTICIPANT,
-            ),
-            User(
-                id=5, telegram_id=555, username="user5", first_name="Eve", role=UserRole.PARTICIPANT
-            ),
-        ]
-        mock_user_repo.get_by_hackathon.return_value = users
-
-        result = await use_case_send_broadcast.execute(
-            hackathon_id=hackathon_id, message="Test broadcast"
-        )
-
-        mock_subscription_repo.get_by_hackathon.assert_called_once_with(hackathon_id)
-        mock_user_repo.get_by_hackathon.assert_called_once_with(hackathon_id)
+    async def test_get_broadcast_targets(self, use_case_send_broadcast, mock_user_repo):
+        """Получатели выбираются одним запросом репозитория"""
+        targets = RecipientBatch.from_pairs([(1, 111), (2, 222), (4, 444)])
+        mock_user_repo.get_audience.return_value = targets
 
-        assert isinstance(result, list)
-        assert len(result) == 3
+        result = await use_case_send_broadcast.execute(hackathon_id=5, message="Test broadcast")
 
-        user_ids = {target.user_id for target in result}
-        assert 1 in user_ids
-        assert 2 in user_ids
-        assert 4 in user_ids
-        assert 3 not in user_ids
-        assert 5 not in user_ids
-
-        target = result[0]
-        assert isinstance(target, BroadcastTargetDTO)
-        assert target.user_id == 1
-        assert target.telegram_id == 111
-        assert target.username == "user1"
-        assert target.first_name == "Alice"
+        mock_user_repo.get_audience.assert_called_once_with(5, AudienceSegmentDTO())
+        assert result is targets
 
     @pytest.mark.asyncio
-    async def test_get_broadcast_targets_no_subscriptions(
-        self, use_case_send_broadcast, mock_user_repo, mock_subscription_repo
-    ):
-        """Нет активных подписок"""
-        hackathon_id = 5
-
-        mock_subscription_repo.get_by_hackathon.return_value = []  # нет подписок
-        mock_user_repo.get_by_hackathon.return_value = [
-            User(id=1, telegram_id=111, username="user1")
-        ]
+    async def test_default_segment(self, use_case_send_broadcast, mock_user_repo):
+        """По умолчанию — подписанные пользователи с доступным чатом, без других фильтров"""
+        await use_case_send_broadcast.execute(hackathon_id=5, message="Test")
 
-        result = await use_case_send_broadcast.execute(hackathon_id=hackathon_id, message="Test")
-
-        assert result == []
+        segment = mock_user_repo.get_audience.call_args.args[1]
+        assert (segment.subscribed_only, segment.reachable_only) == (True, True)
+        assert (segment.role, segment.joined_after) == (None, None)
 
     @pytest.mark.asyncio
-    async def test_get_broadcast_targets_only_disabled_subscriptions(
-        self, use_case_send_broadcast, mock_user_repo, mock_subscription_repo
-    ):
-        """Только отключенные подписки"""
-        hackathon_id = 5
-
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=False),
-            ReminderSubscription(id=2, user_id=2, hackathon_id=5, enabled=False),
-        ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
-
-        users = [
-            User(id=1, telegram_id=111, username="user1"),
-            User(id=2, telegram_id=222, username="user2"),
-        ]
-        mock_user_repo.get_by_hackathon.return_value = users
+    async def test_segment_is_passed_to_repository(self, use_case_send_broadcast, mock_user_repo):
+        """Фильтры сегмента уходят в репозиторий как есть"""
+        segment = AudienceSegmentDTO(
+            role=UserRole.ORGANIZER, subscribed_only=False, joined_after=datetime(2025, 1, 1)
+        )
+        mock_user_repo.get_audience.return_value = RecipientBatch()
 
-        result = await use_case_send_broadcast.execute(hackathon_id=hackathon_id, message="Test")
+        result = await use_case_send_broadcast.execute(
+            hackathon_id=5, message="Test", segment=segment
+        )
 
-        assert result == []
+        mock_user_repo.get_audience.assert_called_once_with(5, segment)
+        assert len(result) == 0
 
     @pytest.mark.asyncio
-    async def test_get_broadcast_targets_user_not_found_for_subscription(
-        self, use_case_send_broadcast, mock_user_repo, mock_subscription_repo
-    ):
-        """Пользователь не найден для активной подписки"""
-        hackathon_id = 5
-
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=True),
-            ReminderSubscription(
-                id=2, user_id=999, hackathon_id=5, enabled=True
-            ),  # несуществующий user_id
-        ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
-
-        users = [
-            User(id=1, telegram_id=111, username="user1"),
-        ]
-        mock_user_repo.get_by_hackathon.return_value = users
-
-        result = await use_case_send_broadcast.execute(hackathon_id=hackathon_id, message="Test")
-
-        assert len(result) == 1
-        assert result[0].user_id == 1
+    async def test_iter_targets(self, use_case_send_broadcast, mock_user_repo):
+        """Получатели частями"""
+        mock_user_repo.iter_audience = MagicMock(
+            return_value=_chunks(
+                RecipientBatch.from_pairs([(1, 111)]), RecipientBatch.from_pairs([(2, 222)])
+            )
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_broadcast_targets_empty_users(
-        self, use_case_send_broadcast, mock_user_repo, mock_subscription_repo
-    ):
-        """Нет пользователей в хакатоне"""
-        hackathon_id = 5
-
-        subscriptions = [
-            ReminderSubscription(id=1, user_id=1, hackathon_id=5, enabled=True),
+        chunks = [
+            list(batch)
+            async for batch in use_case_send_broadcast.iter_targets(hackathon_id=5, chunk_size=1)
         ]
-        mock_subscription_repo.get_by_hackathon.return_value = subscriptions
-
-        mock_user_repo.get_by_hackathon.return_value = []  # нет пользователей
-
-        result = await use_case_send_broadcast.execute(hackathon_id=hackathon_id, message="Test")
 
-        assert result == []
+        mock_user_repo.iter_audience.assert_called_once_with(5, AudienceSegmentDTO(), chunk_size=1)
+        assert chunks == [[(1, 111)], [(2, 222)]]
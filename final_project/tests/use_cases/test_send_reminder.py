@@ -1,13 +1,16 @@
 from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
+from aiogram.exceptions import TelegramForbiddenError
 
 from hackathon_assistant.use_cases.dto import (
+    RecipientBatch,
     ReminderEventDTO,
-    ReminderParticipantDTO,
     ReminderPileDTO,
 )
+from hackathon_assistant.use_cases.send_reminder import SendRemindersUseCase
 
 
 class TestSendRemindersUseCase:
@@ -42,13 +45,13 @@ class TestSendRemindersUseCase:
                 event=ReminderEventDTO(
                     event_id=1, title="Событие 1", starts_at=now + timedelta(hours=1)
                 ),
-                participants=[ReminderParticipantDTO(user_id=1, telegram_id=111)],
+                participants=RecipientBatch.from_pairs([(1, 111)]),
             ),
             ReminderPileDTO(
                 event=ReminderEventDTO(
                     event_id=2, title="Событие 2", starts_at=now + timedelta(hours=2)
                 ),
-                participants=[ReminderParticipantDTO(user_id=2, telegram_id=222)],
+                participants=RecipientBatch.from_pairs([(2, 222)]),
             ),
         ]
 
@@ -76,7 +79,7 @@ class TestSendRemindersUseCase:
         """Событие без участников"""
         pile = ReminderPileDTO(
             event=ReminderEventDTO(event_id=1, title="Событие", starts_at=datetime.now()),
-            participants=[],
+            participants=RecipientBatch(),
         )
 
         await use_case_send_reminder.execute([pile])
@@ -89,7 +92,7 @@ class TestSendRemindersUseCase:
         now = datetime.now(UTC)
         pile = ReminderPileDTO(
             event=ReminderEventDTO(event_id=1, title="Важное собрание", starts_at=now),
-            participants=[ReminderParticipantDTO(user_id=1, telegram_id=123)],
+            participants=RecipientBatch.from_pairs([(1, 123)]),
         )
 
         await use_case_send_reminder.execute([pile])
@@ -102,3 +105,81 @@ class TestSendRemindersUseCase:
         assert "Важное собрание" in text
         assert "🕐" in text
         assert now.astimezone(ZoneInfo("Europe/Moscow")).strftime("%H:%M") in text
+
+    @pytest.mark.asyncio
+    async def test_send_reminders_via_outbox(self, mock_outbox_repo, mock_notifier, sample_pile):
+        """С outbox_repo напоминания ставятся в очередь, а не отправляются"""
+        mock_outbox_repo.enqueue.return_value = 2
+        use_case = SendRemindersUseCase(notifier=mock_notifier, outbox_repo=mock_outbox_repo)
+
+        await use_case.execute([sample_pile])
+
+        mock_notifier.send.assert_not_called()
+        messages = mock_outbox_repo.enqueue.call_args[0][0]
+        assert [m.telegram_id for m in messages] == [111, 222]
+        assert all(m.message_key == "reminder:1" for m in messages)
+        assert "Тестовое событие" in messages[0].text
+
+    @pytest.mark.asyncio
+    async def test_unreachable_users_are_marked(self, mock_notifier, mock_user_repo, sample_pile):
+        """Заблокировавшие бота пользователи отмечаются как недоступные"""
+        mock_notifier.send.side_effect = [
+            TelegramForbiddenError(method=MagicMock(), message="bot was blocked by the user"),
+            None,
+        ]
+        use_case = SendRemindersUseCase(notifier=mock_notifier, user_repo=mock_user_repo)
+
+        await use_case.execute([sample_pile])
+
+        assert mock_notifier.send.call_count == 2
+        mock_user_repo.mark_unreachable.assert_called_once_with([111])
+
+
+class TestReminderDigest:
+    """SendRemindersUseCase с digest=True"""
+
+    @pytest.fixture
+    def piles(self):
+        now = datetime.now(UTC)
+        return [
+            ReminderPileDTO(
+                event=ReminderEventDTO(
+                    event_id=2, title="Дедлайн", starts_at=now + timedelta(minutes=50)
+                ),
+                participants=RecipientBatch.from_pairs([(1, 111), (2, 222)]),
+            ),
+            ReminderPileDTO(
+                event=ReminderEventDTO(event_id=1, title="Лекция", starts_at=now),
+                participants=RecipientBatch.from_pairs([(1, 111)]),
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_one_message_per_user(self, mock_notifier, piles):
+        """Сообщений столько, сколько пользователей; события в дайджесте по времени начала"""
+        await SendRemindersUseCase(notifier=mock_notifier, digest=True).execute(piles)
+
+        assert mock_notifier.send.call_count == 2
+        texts = {
+            c.kwargs["telegram_id"]: c.kwargs["text"] for c in mock_notifier.send.call_args_list
+        }
+        assert "Скоро события" in texts[111]
+        assert texts[111].index("Лекция") < texts[111].index("Дедлайн")
+        assert "Скоро событие:" in texts[222] and "Лекция" not in texts[222]
+
+    @pytest.mark.asyncio
+    async def test_digest_via_outbox(self, mock_outbox_repo, piles):
+        """В очередь — по строке на пользователя, ключ зависит от набора событий"""
+        mock_outbox_repo.enqueue.return_value = 2
+        use_case = SendRemindersUseCase(outbox_repo=mock_outbox_repo, digest=True)
+
+        await use_case.execute(piles)
+        await use_case.execute(list(reversed(piles)))
+
+        first, second = (c.args[0] for c in mock_outbox_repo.enqueue.call_args_list)
+        assert [(m.user_id, m.telegram_id) for m in first] == [(1, 111), (2, 222)]
+        assert first[1].message_key == "reminder:2"
+        assert first[0].message_key.startswith("reminder-digest:")
+        assert {m.telegram_id: m.message_key for m in second} == {
+            m.telegram_id: m.message_key for m in first
+        }
@@ -2,7 +2,6 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from hackathon_assistant.domain.models import UserRole
 from hackathon_assistant.use_cases.start_user import StartUserUseCase
 
 
@@ -10,59 +9,43 @@ class TestStartUserUseCase:
     """Тесты для StartUserUseCase."""
 
     @pytest.mark.asyncio
-    async def test_execute_new_user(self, mock_user_repo):
-        """Тест регистрации нового пользователя."""
-        mock_user_repo.get_by_telegram_id.return_value = None
-        mock_user_repo.save = AsyncMock()
-        saved_user = mock_user_repo.save.return_value
+    async def test_execute_upserts_profile(self, mock_user_repo, sample_user):
+        """Регистрация и обновление профиля — один вызов upsert_profile."""
+        mock_user_repo.upsert_profile.return_value = sample_user
 
         use_case = StartUserUseCase(user_repo=mock_user_repo)
-        telegram_id = 123456789
-        username = "testuser"
-        first_name = "Test"
-        last_name = "User"
-
         result = await use_case.execute(
-            telegram_id=telegram_id,
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
+            telegram_id=123456789,
+            username="testuser",
+            first_name="Test",
+            last_name="User",
         )
 
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_user_repo.save.assert_called_once()
-        saved_user_arg = mock_user_repo.save.call_args[0][0]
-        assert saved_user_arg.telegram_id == telegram_id
-        assert saved_user_arg.username == username
-        assert saved_user_arg.first_name == first_name
-        assert saved_user_arg.last_name == last_name
-        assert saved_user_arg.role == UserRole.PARTICIPANT
-        assert result == saved_user
+        mock_user_repo.upsert_profile.assert_called_once_with(
+            telegram_id=123456789,
+            username="testuser",
+            first_name="Test",
+            last_name="User",
+        )
+        mock_user_repo.get_by_telegram_id.assert_not_called()
+        mock_user_repo.save.assert_not_called()
+        assert result == sample_user
 
     @pytest.mark.asyncio
-    async def test_execute_existing_user(self, mock_user_repo, sample_user):
-        """Тест обновления существующего пользователя."""
-        mock_user_repo.get_by_telegram_id.return_value = sample_user
-        mock_user_repo.save = AsyncMock()
-        saved_user = mock_user_repo.save.return_value
-
-        use_case = StartUserUseCase(user_repo=mock_user_repo)
-        telegram_id = 123456789
-        new_username = "updateduser"
-        new_first_name = "Updated"
-        new_last_name = "User"
+    async def test_execute_defaults_to_empty_profile(self, mock_user_repo):
+        """Без данных из Telegram передаются пустые строки."""
+        await StartUserUseCase(user_repo=mock_user_repo).execute(telegram_id=123456789)
 
-        result = await use_case.execute(
-            telegram_id=telegram_id,
-            username=new_username,
-            first_name=new_first_name,
-            last_name=new_last_name,
+        mock_user_repo.upsert_profile.assert_called_once_with(
+            telegram_id=123456789, username="", first_name="", last_name=""
         )
 
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_user_repo.save.assert_called_once()
-        saved_user_arg = mock_user_repo.save.call_args[0][0]
-        assert saved_user_arg.username == new_username
-        assert saved_user_arg.first_name == new_first_name
-        assert saved_user_arg.last_name == new_last_name
-        assert result == saved_user
+    @pytest.mark.asyncio
+    async def test_execute_commits_registration(self, mock_user_repo, sample_user):
+        """Регистрация фиксируется в execute, до ответа пользователю."""
+        mock_user_repo.upsert_profile.return_value = sample_user
+        uow = AsyncMock()
+
+        await StartUserUseCase(user_repo=mock_user_repo, uow=uow).execute(telegram_id=123456789)
+
+        uow.commit.assert_awaited_once()
@@ -1,5 +1,3 @@
-from unittest.mock import AsyncMock
-
 import pytest
 
 from hackathon_assistant.use_cases.notifications import UnsubscribeNotificationsUseCase
@@ -9,85 +7,22 @@ class TestUnsubscribeNotificationsUseCase:
     """Тесты для UnsubscribeNotificationsUseCase."""
 
     @pytest.mark.asyncio
-    async def test_execute_existing_subscription(
-        self, mock_user_repo, mock_subscription_repo, sample_user, sample_subscription
-    ):
-        """Тест отключения существующей подписки."""
-        sample_subscription.enabled = True
-        mock_user_repo.get_by_telegram_id.return_value = sample_user
-        mock_subscription_repo.get_user_subscription.return_value = sample_subscription
-        mock_subscription_repo.save = AsyncMock()
-
-        use_case = UnsubscribeNotificationsUseCase(
-            user_repo=mock_user_repo, subscription_repo=mock_subscription_repo
-        )
-        telegram_id = 123456789
+    async def test_execute_disables_subscription(self, mock_subscription_repo):
+        """Подписка выключается одной операцией репозитория."""
+        mock_subscription_repo.set_subscription.return_value = True
 
-        result = await use_case.execute(telegram_id)
+        use_case = UnsubscribeNotificationsUseCase(subscription_repo=mock_subscription_repo)
+        result = await use_case.execute(123456789)
 
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_subscription_repo.get_user_subscription.assert_called_once_with(
-            user_id=sample_user.id, hackathon_id=sample_user.current_hackathon_id
-        )
-        mock_subscription_repo.save.assert_called_once()
-        args, kwargs = mock_subscription_repo.save.call_args
-        saved_sub = args[0] if args else kwargs.get("subscription")
-        assert saved_sub.enabled is False
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_execute_no_subscription(
-        self, mock_user_repo, mock_subscription_repo, sample_user
-    ):
-        """Тест попытки отписаться, если подписка не существует."""
-        mock_user_repo.get_by_telegram_id.return_value = sample_user
-        mock_subscription_repo.get_user_subscription.return_value = None
-
-        use_case = UnsubscribeNotificationsUseCase(
-            user_repo=mock_user_repo, subscription_repo=mock_subscription_repo
-        )
-        telegram_id = 123456789
-
-        result = await use_case.execute(telegram_id)
-
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_subscription_repo.get_user_subscription.assert_called_once_with(
-            user_id=sample_user.id, hackathon_id=sample_user.current_hackathon_id
-        )
+        mock_subscription_repo.set_subscription.assert_called_once_with(123456789, enabled=False)
         mock_subscription_repo.save.assert_not_called()
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_execute_no_user(self, mock_user_repo, mock_subscription_repo):
-        """Тест попытки отписаться для несуществующего пользователя."""
-        mock_user_repo.get_by_telegram_id.return_value = None
-
-        use_case = UnsubscribeNotificationsUseCase(
-            user_repo=mock_user_repo, subscription_repo=mock_subscription_repo
-        )
-        telegram_id = 999999999
-
-        result = await use_case.execute(telegram_id)
-
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_subscription_repo.get_user_subscription.assert_not_called()
-        mock_subscription_repo.save.assert_not_called()
-        assert result is False
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_execute_no_hackathon(self, mock_user_repo, mock_subscription_repo, sample_user):
-        """Тест попытки отписаться для пользователя без хакатона."""
-        sample_user.current_hackathon_id = None
-        mock_user_repo.get_by_telegram_id.return_value = sample_user
+    async def test_execute_no_subscription(self, mock_subscription_repo):
+        """Тест когда подписки не было."""
+        mock_subscription_repo.set_subscription.return_value = False
 
-        use_case = UnsubscribeNotificationsUseCase(
-            user_repo=mock_user_repo, subscription_repo=mock_subscription_repo
-        )
-        telegram_id = 123456789
+        use_case = UnsubscribeNotificationsUseCase(subscription_repo=mock_subscription_repo)
 
-        result = await use_case.execute(telegram_id)
-
-        mock_user_repo.get_by_telegram_id.assert_called_once_with(telegram_id)
-        mock_subscription_repo.get_user_subscription.assert_not_called()
-        mock_subscription_repo.save.assert_not_called()
-        assert result is False
+        assert await use_case.execute(123456789) is False